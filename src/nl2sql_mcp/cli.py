@@ -1,15 +1,12 @@
 """Command-line entrypoint for the nl2sql-mcp FastMCP server.
 
-This module exposes the package's CLI via the FastMCP-provided `app` object.
-If invoked without any command-line arguments, it defaults to executing the
-`run` subcommand for a streamlined developer experience (equivalent to running
-`nl2sql-mcp run`).
+This module is the single target of the `nl2sql-mcp` console script. It starts
+the server with one `mcp.run()` call using FastMCP's default transport, without
+loading the FastMCP CLI.
 """
 
 from __future__ import annotations
 
-import traceback
-
 from fastmcp.utilities.logging import get_logger
 
 from nl2sql_mcp.server import mcp
@@ -25,6 +22,8 @@ def main() -> None:
     except KeyboardInterrupt:
         _logger.info("Interrupted by user. Exiting cleanly.")
     except Exception:  # noqa: BLE001
+        import traceback  # noqa: PLC0415 - only needed on the failure path
+
         traceback.print_exc(limit=1)
 
 
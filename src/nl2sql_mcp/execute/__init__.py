@@ -6,12 +6,13 @@ Exports typed models and the FastMCP registration helper.
 from __future__ import annotations
 
 from .mcp_tools import register_execute_query_tool
-from .models import ExecuteQueryResult
+from .models import ExecuteQueryResult, ExecutionMeta
 from .runner import ExecutionLimits, run_execute_flow
 
 __all__ = [
     "ExecuteQueryResult",
     "ExecutionLimits",
+    "ExecutionMeta",
     "register_execute_query_tool",
     "run_execute_flow",
 ]
@@ -18,10 +18,13 @@ from nl2sql_mcp.execute.runner import ExecutionLimits, run_execute_flow
 from nl2sql_mcp.schema_tools.mcp_tools import MAX_QUERY_DISPLAY
 from nl2sql_mcp.services.config_service import ConfigService
 from nl2sql_mcp.services.schema_service_manager import SchemaServiceManager
-from nl2sql_mcp.sqlglot_tools import SqlglotService, map_sqlalchemy_to_sqlglot
+from nl2sql_mcp.sqlglot_tools import SqlglotService
 
 _logger = get_logger(__name__)
 
+# Process-wide default so re-registration never constructs another service
+_DEFAULT_SQLGLOT_SERVICE = SqlglotService()
+
 
 def register_execute_query_tool(
     mcp: FastMCP, *, sqlglot_service: SqlglotService | None = None
@@ -34,7 +37,12 @@ def register_execute_query_tool(
     """
 
     mgr = SchemaServiceManager.get_instance()
-    glot = sqlglot_service or SqlglotService()
+    glot = sqlglot_service or _DEFAULT_SQLGLOT_SERVICE
+    # Result budgets are process-wide configuration; resolve them once at registration
+    limits = ExecutionLimits(
+        row_limit=ConfigService.result_row_limit(),
+        max_cell_chars=ConfigService.result_max_cell_chars(),
+    )
 
     @mcp.tool
     async def execute_query(
@@ -67,23 +75,12 @@ def register_execute_query_tool(
             await ctx.error(f"Schema service not ready: {exc}")
             raise
 
-        # Result budgets from config
-        row_limit = ConfigService.result_row_limit()
-        max_cell_chars = ConfigService.result_max_cell_chars()
-
-        # Active dialect resolution
-        sa_name = mgr.current_sqlalchemy_dialect_name() or "sql"
-        dialect = map_sqlalchemy_to_sqlglot(sa_name)
-
         return run_execute_flow(
             sql=sql,
             engine=schema_service.engine,
             glot=glot,
-            active_dialect=dialect,
-            limits=ExecutionLimits(
-                row_limit=row_limit,
-                max_cell_chars=max_cell_chars,
-            ),
+            active_dialect=mgr.current_sqlglot_dialect(),
+            limits=limits,
         )
 
     _ = execute_query
@@ -6,17 +6,29 @@ requests, without any LLM planning fields.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Literal
 
 from pydantic import BaseModel, Field
 
 
+@dataclass(slots=True, frozen=True)
+class ExecutionMeta:
+    """Execution metadata reported alongside every execute_query result."""
+
+    dialect: str
+    elapsed_ms: float
+    row_limit: int
+    rows_returned: int
+    truncated: bool
+
+
 class ExecuteQueryResult(BaseModel):
     """Structured response from the execute_query tool."""
 
     sql: str = Field(description="Final executed SQL normalized to the active dialect")
-    execution: dict[str, int | float | str | bool] = Field(
+    execution: ExecutionMeta = Field(
         description=(
             "Execution metadata: dialect, elapsed_ms, row_limit, rows_returned, truncated"
         )
@@ -10,42 +10,71 @@ This module provides a small, dependency-injected runner that:
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+import re
 import time
+from typing import Any, cast
 
 from fastmcp.utilities.logging import get_logger
 import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
+import sqlglot
+from sqlglot.errors import TokenError
+from sqlglot.tokens import TokenType
 
-from nl2sql_mcp.execute.models import ExecuteQueryResult
-from nl2sql_mcp.sqlglot_tools import SqlglotService
+from nl2sql_mcp.execute.models import ExecuteQueryResult, ExecutionMeta
+from nl2sql_mcp.sqlglot_tools import SqlglotService, cap_row_limit
 from nl2sql_mcp.sqlglot_tools.models import (
     Dialect,
     SqlAutoTranspileRequest,
     SqlErrorAssistRequest,
+    SqlErrorAssistResult,
     SqlValidationRequest,
 )
 
 _logger = get_logger(__name__)
 
+# Whole-word, case-insensitive match so identifiers such as ``created_at`` or
+# ``last_update`` pass while keywords followed by any whitespace are still caught.
+# EXEC/EXECUTE/DO/CALL are banned too: they run arbitrary statements passed as
+# string literals or procedure bodies, so literals are never exempt from the scan.
+_BANNED_STATEMENT_RE = re.compile(
+    r"\b(?:insert|update|delete|merge|alter|create|drop|truncate|grant|revoke"
+    r"|exec|execute|do|call)\b",
+    re.IGNORECASE,
+)
+
+
+# Cell types returned as-is (bool is listed explicitly; the lookup is by exact type)
+_JSON_SCALAR_TYPES: frozenset[type] = frozenset({int, float, bool})
+
+
+@lru_cache(maxsize=256)
+def _has_banned_statement(sql: str, dialect: Dialect = "sql") -> bool:
+    """Scan once per distinct SQL string; clients often re-send identical queries.
+
+    The raw SQL is scanned, except for quoted identifiers (``"update"``, ``[drop]``)
+    as tokenized for the dialect. SQL that does not tokenize is scanned unchanged.
+    """
+    try:
+        tokens = sqlglot.tokenize(sql, read=None if dialect == "sql" else dialect)
+    except (TokenError, ValueError):
+        return _BANNED_STATEMENT_RE.search(sql) is not None
+    parts: list[str] = []
+    pos = 0
+    for token in tokens:
+        if token.token_type is TokenType.IDENTIFIER:
+            parts.append(sql[pos : token.start])
+            pos = token.end + 1
+    parts.append(sql[pos:])
+    return _BANNED_STATEMENT_RE.search(" ".join(parts)) is not None
 
-def enforce_select_only(sql: str) -> None:
+
+def enforce_select_only(sql: str, dialect: Dialect = "sql") -> None:
     """Raise ValueError when the SQL appears to include non-SELECT operations."""
-    lowered = sql.strip().lower()
-    banned: tuple[str, ...] = (
-        "insert ",
-        "update ",
-        "delete ",
-        "merge ",
-        "alter ",
-        "create ",
-        "drop ",
-        "truncate ",
-        "grant ",
-        "revoke ",
-    )
-    if any(tok in lowered for tok in banned):  # conservative heuristic
+    if _has_banned_statement(sql, dialect):  # conservative heuristic
         msg = "Only SELECT queries are permitted"
         raise ValueError(msg)
 
@@ -59,30 +88,73 @@ def _truncate_value(val: object, max_chars: int) -> str | int | float | bool | N
     """Truncate a single cell value to a safe representation."""
     if val is None:
         return None
-    if isinstance(val, int | float | bool):
+    # Exact-type lookup first: this runs once per returned cell
+    if type(val) in _JSON_SCALAR_TYPES:
+        return cast("int | float | bool", val)
+    if isinstance(val, str):
+        s = val
+    elif isinstance(val, int | float):  # subclasses such as IntEnum or numpy.float64
         return val
-    s = str(val)
+    else:
+        s = str(val)
     if len(s) > max_chars:
         return s[: max_chars - 1] + "…"
     return s
 
 
 def _truncate_rows(
-    rows: Iterable[sa.RowMapping],
+    rows: Sequence[Sequence[Any]],
     columns: list[str],
     max_rows: int,
     max_chars: int,
 ) -> list[dict[str, str | int | float | bool | None]]:
-    """Convert rows to JSON-safe dicts with truncation and row limit."""
-    out: list[dict[str, str | int | float | bool | None]] = []
-    for i, row in enumerate(rows):
-        if i >= max_rows:
-            break
-        item: dict[str, str | int | float | bool | None] = {}
-        for col in columns:
-            item[col] = _truncate_value(row[col], max_chars)
-        out.append(item)
-    return out
+    """Convert positional rows to JSON-safe dicts with truncation and row limit.
+
+    Rows are matched to ``columns`` by position, so each row is walked once instead
+    of looking every column up by name. NULLs and exact int/float/bool cells are
+    passed through inline; only other values pay for a ``_truncate_value`` call.
+    """
+    scalar_types = _JSON_SCALAR_TYPES
+    truncate = _truncate_value
+    return [
+        {
+            col: val if val is None or type(val) in scalar_types else truncate(val, max_chars)
+            for col, val in zip(columns, row, strict=False)
+        }
+        for row in rows[:max_rows]
+    ]
+
+
+_format_cause = "Cause: {}".format
+_format_fix = "Fix: {}".format
+
+
+def _assist_notes(assist: SqlErrorAssistResult) -> list[str]:
+    """Flatten error-assist hints into ``Cause: ...`` / ``Fix: ...`` notes."""
+    notes = list(map(_format_cause, assist.likely_causes))
+    notes.extend(map(_format_fix, assist.suggested_fixes))
+    return notes
+
+
+def _prepare_sql(
+    glot: SqlglotService, base_sql: str, dialect: Dialect
+) -> tuple[str, tuple[str, ...], str | None]:
+    """Transpile and validate ``base_sql`` for ``dialect``.
+
+    Both steps are memoized per (SQL, dialect) on the service, so a re-sent query
+    skips the sqlglot work. Returns the SQL to run, the validation notes, and the
+    validation error (None when the SQL is valid).
+    """
+    trans = glot.auto_transpile_for_database(
+        SqlAutoTranspileRequest(sql=base_sql, target_dialect=dialect)
+    )
+    validation = glot.validate(SqlValidationRequest(sql=trans.sql, dialect=dialect))
+    notes = list(trans.notes)
+    error = None
+    if not validation.is_valid and validation.error_message:
+        error = validation.error_message
+        notes.append(error)
+    return trans.sql, tuple(notes), error
 
 
 @dataclass(slots=True)
@@ -113,28 +185,28 @@ def run_execute_flow(
         limits.max_cell_chars,
     )
 
-    # Policy and normalization
+    # Normalize once; the policy scan is unaffected by surrounding whitespace or a
+    # trailing semicolon, and a shared key lets repeated variants hit its cache.
+    base_sql = strip_trailing_semicolon(sql)
+
+    # Policy
     try:
-        enforce_select_only(sql)
+        enforce_select_only(base_sql, active_dialect)
     except ValueError as exc:
         # Non-SELECT attempted: return structured error result with guidance
         assist_res = glot.assist_error(
             SqlErrorAssistRequest(sql=sql, error_message=str(exc), dialect=active_dialect)
         )
-        assist_notes: list[str] = []
-        if assist_res.likely_causes:
-            assist_notes.extend([f"Cause: {c}" for c in assist_res.likely_causes])
-        if assist_res.suggested_fixes:
-            assist_notes.extend([f"Fix: {f}" for f in assist_res.suggested_fixes])
+        assist_notes = _assist_notes(assist_res)
         return ExecuteQueryResult(
-            sql=strip_trailing_semicolon(sql),
-            execution={
-                "dialect": active_dialect,
-                "elapsed_ms": 0.0,
-                "row_limit": limits.row_limit,
-                "rows_returned": 0,
-                "truncated": False,
-            },
+            sql=base_sql,
+            execution=ExecutionMeta(
+                dialect=active_dialect,
+                elapsed_ms=0.0,
+                row_limit=limits.row_limit,
+                rows_returned=0,
+                truncated=False,
+            ),
             results=[],
             validation_notes=["Only SELECT queries are permitted"],
             recommended_next_steps=[],
@@ -143,22 +215,16 @@ def run_execute_flow(
             assist_notes=assist_notes or None,
         )
 
-    base_sql = strip_trailing_semicolon(sql)
+    sql_to_run, prepared_notes, validation_error = _prepare_sql(glot, base_sql, active_dialect)
+    notes = list(prepared_notes)
+    if validation_error:
+        _logger.warning("SQL validation reported: %s", validation_error)
 
-    trans = glot.auto_transpile_for_database(
-        SqlAutoTranspileRequest(sql=base_sql, target_dialect=active_dialect)
-    )
-    sql_to_run = trans.sql
-
-    validation = glot.validate(SqlValidationRequest(sql=sql_to_run, dialect=active_dialect))
-    notes: list[str] = []
-    if trans.notes:
-        notes.extend(trans.notes)
-    if not validation.is_valid and validation.error_message:
-        notes.append(validation.error_message)
-        _logger.warning("SQL validation reported: %s", validation.error_message)
+    # Let the database stop after row_limit + 1 rows (the +1 detects truncation)
+    fetch_size = limits.row_limit + 1
+    capped_sql = cap_row_limit(sql_to_run, active_dialect, fetch_size)
 
-    _logger.info("SQL to execute (%s): %s", active_dialect, sql_to_run)
+    _logger.info("SQL to execute (%s): %s", active_dialect, capped_sql)
 
     # Execute
     elapsed_ms: float
@@ -168,10 +234,18 @@ def run_execute_flow(
     start = time.perf_counter()
     try:
         with engine.connect() as conn:
-            result = conn.execute(sa.text(sql_to_run))
+            # Stream in a single batch of row_limit + 1 so drivers with client-side
+            # cursors do not buffer the full result set before fetchmany() applies.
+            result = conn.execute(
+                sa.text(capped_sql),
+                execution_options={"yield_per": fetch_size},
+            )
+            # Drivers that fetch in arraysize chunks (e.g. oracledb) then need one trip;
+            # statements without rows have no cursor and fail in keys() below.
+            if result.cursor is not None:
+                result.cursor.arraysize = fetch_size
             cols = list(result.keys())
-            map_result = result.mappings()
-            raw_rows = map_result.fetchmany(limits.row_limit + 1)  # sentinel to detect truncation
+            raw_rows = result.fetchmany(fetch_size)  # sentinel to detect truncation
             returned = min(len(raw_rows), limits.row_limit)
             truncated = len(raw_rows) > limits.row_limit
             rows = _truncate_rows(raw_rows, cols, limits.row_limit, limits.max_cell_chars)
@@ -181,21 +255,17 @@ def run_execute_flow(
         helpres = glot.assist_error(
             SqlErrorAssistRequest(sql=sql_to_run, error_message=str(exc), dialect=active_dialect)
         )
-        assist: list[str] = []
-        if helpres.likely_causes:
-            assist.extend([f"Cause: {c}" for c in helpres.likely_causes])
-        if helpres.suggested_fixes:
-            assist.extend([f"Fix: {f}" for f in helpres.suggested_fixes])
+        assist = _assist_notes(helpres)
 
         return ExecuteQueryResult(
             sql=sql_to_run,
-            execution={
-                "dialect": active_dialect,
-                "elapsed_ms": elapsed_ms,
-                "row_limit": limits.row_limit,
-                "rows_returned": 0,
-                "truncated": False,
-            },
+            execution=ExecutionMeta(
+                dialect=active_dialect,
+                elapsed_ms=elapsed_ms,
+                row_limit=limits.row_limit,
+                rows_returned=0,
+                truncated=False,
+            ),
             results=[],
             validation_notes=notes,
             recommended_next_steps=[],
@@ -224,15 +294,18 @@ def run_execute_flow(
 
     next_action = "refine_plan" if truncated else None
 
-    return ExecuteQueryResult(
+    # Every field below is built here from already-normalized values (rows hold only
+    # the JSON-safe scalars produced by _truncate_value), so skip re-validating what can
+    # be row_limit x columns cells; defaults such as timestamp are still applied.
+    return ExecuteQueryResult.model_construct(
         sql=sql_to_run,
-        execution={
-            "dialect": active_dialect,
-            "elapsed_ms": elapsed_ms,
-            "row_limit": limits.row_limit,
-            "rows_returned": returned,
-            "truncated": truncated,
-        },
+        execution=ExecutionMeta(
+            dialect=active_dialect,
+            elapsed_ms=elapsed_ms,
+            row_limit=limits.row_limit,
+            rows_returned=returned,
+            truncated=truncated,
+        ),
         results=rows,
         validation_notes=notes,
         recommended_next_steps=next_steps,
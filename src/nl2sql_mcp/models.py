@@ -8,7 +8,11 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Leaf response models are built once by the response builders and only read
+# afterwards; freezing them rules out accidental mutation of shared instances.
+_LEAF_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
 
 # -----------------------
 # MCP Request Models
@@ -124,6 +128,8 @@ class SubjectAreaItem(BaseModel):
 class ColumnDetail(BaseModel):
     """Simple column information optimized for SQL generation."""
 
+    model_config = _LEAF_MODEL_CONFIG
+
     name: str = Field(description="Column name")
     data_type: str = Field(description="SQL data type (prominently displayed)")
     nullable: bool = Field(description="Whether NULL values are allowed")
@@ -132,13 +138,19 @@ class ColumnDetail(BaseModel):
     business_role: str | None = Field(
         description="Business purpose (ID, date, amount, category, etc.)"
     )
-    sample_values: list[str] = Field(description="Representative sample values from the data")
-    constraints: list[str] = Field(description="Value constraints (enum values, ranges, patterns)")
+    sample_values: tuple[str, ...] = Field(
+        description="Representative sample values from the data"
+    )
+    constraints: tuple[str, ...] = Field(
+        description="Value constraints (enum values, ranges, patterns)"
+    )
 
 
 class JoinExample(BaseModel):
     """Clear JOIN example with actual SQL syntax."""
 
+    model_config = _LEAF_MODEL_CONFIG
+
     from_table: str = Field(description="Source table name")
     to_table: str = Field(description="Target table name")
     sql_syntax: str = Field(description="Complete JOIN clause with ON condition")
@@ -149,6 +161,8 @@ class JoinExample(BaseModel):
 class JoinOnPair(BaseModel):
     """Explicit ON clause column pair used in a join plan."""
 
+    model_config = _LEAF_MODEL_CONFIG
+
     left: str = Field(description="Left fully-qualified column 'schema.table.column'")
     right: str = Field(description="Right fully-qualified column 'schema.table.column'")
 
@@ -156,6 +170,8 @@ class JoinOnPair(BaseModel):
 class JoinPlanStep(BaseModel):
     """Structured join plan step for deterministic SQL assembly."""
 
+    model_config = _LEAF_MODEL_CONFIG
+
     from_table: str = Field(description="Source table name 'schema.table'")
     to_table: str = Field(description="Target table name 'schema.table'")
     on: list[JoinOnPair] = Field(description="List of ON clause column pairs")
@@ -166,11 +182,13 @@ class JoinPlanStep(BaseModel):
 class TableSummary(BaseModel):
     """Simple table information focused on SQL generation needs."""
 
+    model_config = _LEAF_MODEL_CONFIG
+
     name: str = Field(description="Table name")
     business_purpose: str = Field(description="Clear explanation of what this table represents")
     columns: list[ColumnDetail] = Field(description="Column details with types and samples")
-    primary_keys: list[str] = Field(description="Primary key column names")
-    common_filters: list[str] = Field(description="Commonly used WHERE clause conditions")
+    primary_keys: tuple[str, ...] = Field(description="Primary key column names")
+    common_filters: tuple[str, ...] = Field(description="Commonly used WHERE clause conditions")
 
 
 class QuerySchemaResult(BaseModel):
@@ -184,7 +202,7 @@ class QuerySchemaResult(BaseModel):
     suggested_approach: str = Field(
         description="Recommended approach for writing the SQL (narrative)"
     )
-    key_columns: dict[str, list[str]] = Field(
+    key_columns: dict[str, tuple[str, ...]] = Field(
         description="Important columns by table for this query"
     )
     # New structured guidance fields for deterministic planning
@@ -194,8 +212,8 @@ class QuerySchemaResult(BaseModel):
     join_plan: list[JoinPlanStep] = Field(
         default_factory=list[JoinPlanStep], description="Structured join steps"
     )
-    group_by_candidates: list[str] = Field(
-        default_factory=list, description="Candidate columns to GROUP BY"
+    group_by_candidates: tuple[str, ...] = Field(
+        default_factory=tuple, description="Candidate columns to GROUP BY"
     )
     filter_candidates: list[FilterCandidate] = Field(
         default_factory=list,
@@ -222,12 +240,12 @@ class QuerySchemaResult(BaseModel):
         default=None,
         description="Suggested next step based on confidence and ambiguities",
     )
-    clarifications: list[str] = Field(
-        default_factory=list,
+    clarifications: tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Concrete questions to resolve ambiguities before execution",
     )
-    assumptions: list[str] = Field(
-        default_factory=list,
+    assumptions: tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Assumptions the planner made that the agent may confirm",
     )
     confidence: float | None = Field(
@@ -247,7 +265,7 @@ class DatabaseSummary(BaseModel):
     )
     database_type: str = Field(description="Database dialect (PostgreSQL, MySQL, etc.)")
     total_tables: int = Field(description="Total number of tables")
-    schemas: list[str] = Field(description="Schema names in the database")
+    schemas: tuple[str, ...] = Field(description="Schema names in the database")
     # Preserve compact map for quick reading
     key_subject_areas: dict[str, str] = Field(
         description="Major business areas and their purpose (compact)"
@@ -256,8 +274,10 @@ class DatabaseSummary(BaseModel):
     subject_areas: dict[str, SubjectAreaData] | None = Field(
         default=None, description="Structured subject areas keyed by ID"
     )
-    most_important_tables: list[str] = Field(description="Tables that are frequently joined to")
-    common_patterns: list[str] = Field(description="Common query patterns in this database")
+    most_important_tables: tuple[str, ...] = Field(
+        description="Tables that are frequently joined to"
+    )
+    common_patterns: tuple[str, ...] = Field(description="Common query patterns in this database")
 
 
 class TableInfo(BaseModel):
@@ -265,13 +285,19 @@ class TableInfo(BaseModel):
 
     table_name: str = Field(description="Full table name with schema")
     business_description: str = Field(description="What this table represents in business terms")
-    columns: list[ColumnDetail] = Field(description="All column details with types and samples")
-    relationships: list[JoinExample] = Field(description="How this table connects to others")
-    typical_queries: list[str] = Field(description="Common query patterns using this table")
-    indexing_notes: list[str] = Field(description="Important notes about performance and indexing")
-    pk_columns: list[str] = Field(default_factory=list, description="Primary key column names")
-    foreign_keys: list[ForeignKeyRef] = Field(
-        default_factory=list, description="Foreign key references"
+    columns: tuple[ColumnDetail, ...] = Field(
+        description="All column details with types and samples"
+    )
+    relationships: tuple[JoinExample, ...] = Field(description="How this table connects to others")
+    typical_queries: tuple[str, ...] = Field(description="Common query patterns using this table")
+    indexing_notes: tuple[str, ...] = Field(
+        description="Important notes about performance and indexing"
+    )
+    pk_columns: tuple[str, ...] = Field(
+        default_factory=tuple, description="Primary key column names"
+    )
+    foreign_keys: tuple[ForeignKeyRef, ...] = Field(
+        default_factory=tuple, description="Foreign key references"
     )
     approx_rowcount: int | None = Field(default=None, description="Estimated total rows if known")
 
@@ -279,6 +305,8 @@ class TableInfo(BaseModel):
 class TableSearchHit(BaseModel):
     """Search hit for table discovery."""
 
+    model_config = _LEAF_MODEL_CONFIG
+
     table: str = Field(description="Table key 'schema.table'")
     score: float = Field(description="Relevance score (normalized where applicable)")
     summary: str | None = Field(default=None, description="Short business summary if available")
@@ -287,6 +315,8 @@ class TableSearchHit(BaseModel):
 class ColumnSearchHit(BaseModel):
     """Search hit for column discovery."""
 
+    model_config = _LEAF_MODEL_CONFIG
+
     table: str = Field(description="Table key 'schema.table'")
     column: str = Field(description="Column name")
     role: str | None = Field(default=None, description="Business role if known")
@@ -296,6 +326,8 @@ class ColumnSearchHit(BaseModel):
 class FilterCandidate(BaseModel):
     """A suggested filter operation for a column."""
 
+    model_config = _LEAF_MODEL_CONFIG
+
     table: str
     column: str
     operator_examples: list[str]
@@ -304,6 +336,8 @@ class FilterCandidate(BaseModel):
 class SelectedColumn(BaseModel):
     """A suggested select-list column with rationale."""
 
+    model_config = _LEAF_MODEL_CONFIG
+
     table: str
     column: str
     reason: str
@@ -312,6 +346,8 @@ class SelectedColumn(BaseModel):
 class ForeignKeyRef(BaseModel):
     """Foreign key reference descriptor."""
 
+    model_config = _LEAF_MODEL_CONFIG
+
     column: str
     ref_table: str
     ref_column: str
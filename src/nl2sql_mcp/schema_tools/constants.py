@@ -22,14 +22,35 @@ class Constants:
     DEFAULT_EMBEDDING_MODEL: Final[str] = "minishlab/potion-base-8M"
     DEFAULT_MAX_COLS_FOR_EMBEDDINGS: Final[int] = 20
     DEFAULT_VALUE_CONSTRAINT_THRESHOLD: Final[int] = 20
+    DEFAULT_SAMPLE_WORKERS: Final[int] = 4
 
     # Regex patterns
     EMAIL_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
     PHONE_PATTERN: Final[re.Pattern[str]] = re.compile(r"^\+?\d[\d\-\s]{7,}\d$")
     URL_PATTERN: Final[re.Pattern[str]] = re.compile(r"^https?://")
     PERCENT_PATTERN: Final[re.Pattern[str]] = re.compile(r"%$")
+    # The four value patterns above in one pass: alternatives are tried in that
+    # order, so match().lastgroup names the first kind that applies
+    COMBINED_TYPE_PATTERN: Final[re.Pattern[str]] = re.compile(
+        r"(?P<email>[^@\s]+@[^@\s]+\.[^@\s]+$)"
+        r"|(?P<phone>\+?\d[\d\-\s]{7,}\d$)"
+        r"|(?P<url>https?://)"
+        r"|(?P<percent>(?s:.*)%$)"
+    )
+    # Legacy archive suffixes; is_archive_label() checks them with str.endswith
+    ARCHIVE_SUFFIXES: Final[tuple[str, ...]] = (
+        "archive",
+        "archived",
+        "hist",
+        "history",
+        "backup",
+        "bak",
+        "old",
+        "tmp",
+        "temp",
+    )
     ARCHIVE_PATTERN: Final[re.Pattern[str]] = re.compile(
-        r"(archive|archived|hist|history|backup|bak|old|tmp|temp)$", re.IGNORECASE
+        r"({})$".format("|".join(ARCHIVE_SUFFIXES)), re.IGNORECASE
     )
     # Canonical archive/admin tokens used for token-based detection.
     ARCHIVE_TOKENS: Final[frozenset[str]] = frozenset(
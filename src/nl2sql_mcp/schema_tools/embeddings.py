@@ -2,19 +2,24 @@
 
 This module provides embedding capabilities for semantic similarity search over
 database schema elements. It includes a light wrapper over ``model2vec``
-(`StaticModel`) for fast CPU-only sentence embeddings, an Annoy-backed semantic
-index, and a token-lexicon learner used for query expansion.
+(`StaticModel`) for fast CPU-only sentence embeddings, an Annoy- or HNSW-backed
+semantic index, and a token-lexicon learner used for query expansion.
 
 Classes:
 - Embedder: Wrapper for Model2Vec ``StaticModel`` embedding models
-- SemanticIndex: Annoy-backed semantic similarity index
+- SemanticIndex: Approximate nearest-neighbor semantic similarity index
 - TokenLexiconLearner: Learns token embeddings for query expansion
 """
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from typing import Protocol, cast, runtime_checkable
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+
+# Optional accelerator detection at import time to avoid runtime try/except.
+import importlib.util as _importlib_util
+import threading
+from typing import Any, Literal, Protocol, cast, runtime_checkable
 
 from annoy import AnnoyIndex
 from fastmcp.utilities.logging import get_logger
@@ -26,6 +31,25 @@ from .utils import tokens_from_text
 # Logger
 _logger = get_logger("schema_explorer.embeddings")
 
+# hnswlib (C++ HNSW graphs) gives a better recall/latency tradeoff than Annoy's
+# random-projection forests on larger indexes; Annoy is used when it is missing.
+_HAS_HNSWLIB = _importlib_util.find_spec("hnswlib") is not None
+
+# HNSW parameters: "auto" switches to HNSW above HNSW_MIN_ITEMS vectors
+HNSW_MIN_ITEMS = 256
+HNSW_EF_CONSTRUCTION = 200
+HNSW_M = 16
+# Query-time beam width, fixed at build; hnswlib searches with max(ef, k) anyway
+HNSW_EF_SEARCH = 64
+
+# Leading embedding dimensions kept by default (potion-base-8M is 256-d)
+DEFAULT_TRUNCATE_DIM = 256
+
+SemanticBackend = Literal["auto", "annoy", "hnsw"]
+
+# Lexicon expansions remembered per learner (exact query-vector matches)
+EXPANSION_CACHE_SIZE = 256
+
 
 @runtime_checkable
 class _EmbeddingBackend(Protocol):
@@ -39,6 +63,14 @@ class _EmbeddingBackend(Protocol):
         ...
 
 
+@lru_cache(maxsize=4)
+def _load_static_model(model_name: str) -> _EmbeddingBackend:
+    """Load a Model2Vec model once per process and share it across embedders."""
+    # Cast to the minimal protocol to keep strict typing without relying on
+    # third-party type hints.
+    return cast(_EmbeddingBackend, StaticModel.from_pretrained(model_name))
+
+
 class Embedder:
     """Wrapper for Model2Vec static embedding models.
 
@@ -47,24 +79,43 @@ class Embedder:
 
     Attributes:
         _backend: Concrete embedding backend implementing ``_EmbeddingBackend``
+        _truncate_dim: Number of leading dimensions kept, or ``None`` for all
     """
 
-    def __init__(self, model_name: str = "minishlab/potion-base-8M") -> None:
+    def __init__(
+        self,
+        model_name: str = "minishlab/potion-base-8M",
+        truncate_dim: int | None = DEFAULT_TRUNCATE_DIM,
+    ) -> None:
         """Initialize the embedder with a Model2Vec model.
 
         Args:
             model_name: Name or path of the Model2Vec model to load. Defaults to
                 ``minishlab/minishlab/potion-base-8M``.
+            truncate_dim: Keep only the first ``truncate_dim`` dimensions of each
+                embedding. Model2Vec dimensions are PCA-ordered, so the leading
+                ones carry most of the signal; ``None`` keeps the full vector.
 
         Raises:
             RuntimeError: If ``model2vec`` is not installed or fails to load.
+            ValueError: If ``truncate_dim`` is not positive.
         """
-        backend = StaticModel.from_pretrained(model_name)
-        # Cast to the minimal protocol to keep strict typing without relying on
-        # third-party type hints.
-        self._backend: _EmbeddingBackend = cast(_EmbeddingBackend, backend)
+        if truncate_dim is not None and truncate_dim <= 0:
+            msg = f"truncate_dim must be positive, got {truncate_dim}"
+            raise ValueError(msg)
+        self._truncate_dim = truncate_dim
+        self._backend: _EmbeddingBackend = _load_static_model(model_name)
         _logger.info("Embedding backend: model2vec model=%s", model_name)
 
+    @staticmethod
+    def preload(model_name: str = "minishlab/potion-base-8M") -> None:
+        """Load a model into the process-wide cache ahead of first use.
+
+        Args:
+            model_name: Name or path of the Model2Vec model to load
+        """
+        _load_static_model(model_name)
+
     def encode(self, texts: list[str]) -> np.ndarray:
         """Encode texts into embedding vectors.
 
@@ -77,28 +128,100 @@ class Embedder:
         """
         # Model2Vec performs its own internal batching; return float32 for ANN.
         vecs = self._backend.encode(list(texts))
+        if self._truncate_dim is not None and vecs.shape[-1] > self._truncate_dim:
+            # No renormalization: both ANN backends use cosine distance
+            vecs = np.ascontiguousarray(vecs[..., : self._truncate_dim])
         if vecs.dtype != np.float32:
             vecs = vecs.astype("float32", copy=False)
         return vecs
 
+    def encode_many(self, groups: dict[str, list[str]]) -> dict[str, np.ndarray]:
+        """Encode several groups of texts with a single backend call.
+
+        Args:
+            groups: Mapping of group name to the texts in that group
+
+        Returns:
+            Mapping of group name to a ``(len(texts), dim)`` float32 array,
+            holding the rows for that group in input order
+        """
+        flat = [text for texts in groups.values() for text in texts]
+        if not flat:
+            return {name: np.zeros((0, 0), dtype="float32") for name in groups}
+        vecs = self.encode(flat)
+        result: dict[str, np.ndarray] = {}
+        start = 0
+        for name, texts in groups.items():
+            result[name] = vecs[start : start + len(texts)]
+            start += len(texts)
+        return result
+
+
+def _add_rows(index: AnnoyIndex, vectors: np.ndarray) -> None:
+    """Add every row of a contiguous float32 matrix to an Annoy index.
+
+    Annoy has no bulk insert, so rows are passed as buffer-backed memoryviews,
+    which avoids materializing a Python float list per row.
+    """
+    add_item = index.add_item
+    for i, row in enumerate(vectors):
+        add_item(i, memoryview(row))
+
+
+def _build_hnsw(vectors: np.ndarray) -> Any:
+    """Build a cosine HNSW index over a contiguous float32 matrix.
+
+    Args:
+        vectors: Matrix of shape ``(n, dim)`` with ``n > 0``
+
+    Returns:
+        Populated ``hnswlib.Index``
+    """
+    import hnswlib  # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+
+    count, dim = vectors.shape
+    index = hnswlib.Index(space="cosine", dim=dim)
+    index.init_index(max_elements=count, ef_construction=HNSW_EF_CONSTRUCTION, M=HNSW_M)
+    index.add_items(vectors, np.arange(count), num_threads=-1)
+    # Set once here: ef is index-wide state, so per-query changes would race
+    index.set_ef(HNSW_EF_SEARCH)
+    return index
+
 
 class SemanticIndex:
-    """Annoy-backed semantic similarity index for fast vector search.
+    """Approximate nearest-neighbor index for fast semantic similarity search.
 
     This class provides efficient similarity search over embedding vectors
-    using Annoy for approximate nearest neighbor search.
+    using Annoy, or an HNSW graph from ``hnswlib`` when it is installed and the
+    index is large enough to benefit. Both cosine metrics normalize vectors
+    themselves, so neither indexed nor query vectors are L2-normalized here.
 
     Attributes:
-        labels: List of labels corresponding to indexed vectors
-        vecs: NumPy array of embedding vectors
-        index: Annoy index for fast similarity search
+        labels: List of labels corresponding to indexed vectors; the vectors
+            themselves live only in the ANN index
+        index: Annoy index for fast similarity search (Annoy backend only)
+        backend: Backend used by the last build (``"annoy"`` or ``"hnsw"``)
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty semantic index."""
+    def __init__(self, backend: SemanticBackend = "auto") -> None:
+        """Initialize an empty semantic index.
+
+        Args:
+            backend: ``"annoy"``, ``"hnsw"``, or ``"auto"`` to use HNSW for more
+                than ``HNSW_MIN_ITEMS`` vectors when ``hnswlib`` is installed
+
+        Raises:
+            RuntimeError: If ``"hnsw"`` is requested but ``hnswlib`` is missing
+        """
+        if backend == "hnsw" and not _HAS_HNSWLIB:
+            msg = "SemanticIndex backend 'hnsw' requires the hnswlib package"
+            raise RuntimeError(msg)
+        self._backend_choice: SemanticBackend = backend
+        self.backend: str = "annoy"
         self.labels: list[str] = []
-        self.vecs: np.ndarray | None = None
+        self._label_array = np.empty(0, dtype=object)
         self.index: AnnoyIndex | None = None
+        self._hnsw: Any = None
 
     def build(self, labels: list[str], vectors: np.ndarray) -> None:
         """Build the semantic index from labels and vectors.
@@ -108,50 +231,87 @@ class SemanticIndex:
             vectors: NumPy array of embedding vectors
         """
         self.labels = labels
-        self.vecs = vectors
+        self._label_array = np.array(labels, dtype=object)
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.index = None
+        self._hnsw = None
+
+        use_hnsw = self._backend_choice == "hnsw" or (
+            self._backend_choice == "auto" and _HAS_HNSWLIB and len(vectors) > HNSW_MIN_ITEMS
+        )
+        self.backend = "hnsw" if use_hnsw else "annoy"
 
-        if vectors.shape[0] > 0:
+        if vectors.shape[0] > 0 and use_hnsw:
+            self._hnsw = _build_hnsw(vectors)
+        elif vectors.shape[0] > 0:
             # Build Annoy index for fast similarity search
             embedding_dim = vectors.shape[1]
             self.index = AnnoyIndex(embedding_dim, "angular")  # angular = cosine distance
 
-            # Add normalized vectors to index
-            normalized_vectors = vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-8)
-            for i, vector in enumerate(normalized_vectors):
-                self.index.add_item(i, vector.tolist())
+            _add_rows(self.index, vectors)
 
             # Build the index with 10 trees (good balance of speed/accuracy)
             self.index.build(10)
-        else:
-            self.index = None
 
-    def search(self, query_vector: np.ndarray, k: int = 10) -> list[tuple[str, float]]:
-        """Search for most similar vectors in the index.
+    def search_ids(self, query_vector: np.ndarray, k: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """Search for the most similar vectors, returning positional ids.
 
         Args:
             query_vector: Query embedding vector
             k: Number of top results to return
 
         Returns:
-            List of (label, similarity_score) tuples, sorted by similarity
+            Tuple of (ids, similarities) arrays sorted by similarity, where
+            ``ids`` index into ``labels`` and the build-time vector order
         """
-        if self.vecs is None or len(self.vecs) == 0 or self.index is None:
-            return []
+        if not self.labels:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
 
-        # Normalize query vector
-        query_normalized = query_vector / (np.linalg.norm(query_vector) + 1e-8)
+        if self._hnsw is not None:
+            k = min(k, len(self.labels))
+            ids, dists = self._hnsw.knn_query(query_vector, k=k)
+            # hnswlib's cosine space reports distance as 1 - cos_sim
+            return ids[0].astype(np.intp), 1.0 - dists[0].astype(np.float64)
+
+        if self.index is None:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
 
         # Use Annoy for fast search
         indices, distances = self.index.get_nns_by_vector(
-            query_normalized.tolist(), k, include_distances=True
+            query_vector.tolist(), k, include_distances=True
         )
-        results: list[tuple[str, float]] = []
-        for idx, dist in zip(indices, distances, strict=False):
-            # Convert angular distance back to cosine similarity
-            # Formula is: cos_sim = 1 - (angular_dist^2 / 2)
-            similarity = 1.0 - (dist * dist / 2.0)
-            results.append((self.labels[idx], similarity))
-        return results
+        # Convert angular distance back to cosine similarity
+        # Formula is: cos_sim = 1 - (angular_dist^2 / 2)
+        dist = np.asarray(distances, dtype=np.float64)
+        return np.asarray(indices, dtype=np.intp), 1.0 - dist * dist / 2.0
+
+    def search(self, query_vector: np.ndarray, k: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """Search for most similar vectors in the index.
+
+        Args:
+            query_vector: Query embedding vector
+            k: Number of top results to return
+
+        Returns:
+            Tuple of (labels, similarities) arrays sorted by similarity; labels
+            is an object array of ``str`` for vectorized filtering
+        """
+        ids, sims = self.search_ids(query_vector, k)
+        return self._label_array[ids], sims
+
+    def search_pairs(self, query_vector: np.ndarray, k: int = 10) -> list[tuple[str, float]]:
+        """Search for most similar vectors, returning (label, score) pairs.
+
+        Args:
+            query_vector: Query embedding vector
+            k: Number of top results to return
+
+        Returns:
+            List of (label, similarity_score) tuples, sorted by similarity
+        """
+        ids, sims = self.search_ids(query_vector, k)
+        labels = self.labels
+        return [(labels[idx], sim) for idx, sim in zip(ids.tolist(), sims.tolist(), strict=True)]
 
 
 class TokenLexiconLearner:
@@ -164,7 +324,7 @@ class TokenLexiconLearner:
     Attributes:
         token_to_items: Maps tokens to lists of item indices where they appear
         token_df: Document frequency count for each token
-        tokens: Sorted list of unique tokens
+        tokens: Sorted list of unique tokens; position is the token's index id
         vecs: Embedding vectors for tokens
         index: Semantic index for token similarity search
     """
@@ -177,6 +337,13 @@ class TokenLexiconLearner:
         self.vecs: np.ndarray | None = None
         self.index = SemanticIndex()
         self._built = False
+        # Document frequency aligned with ``tokens`` (and so with index ids)
+        self._df_array = np.empty(0, dtype=np.int32)
+        # Repeated queries encode to identical vectors; remember their expansions
+        self._expansion_cache: OrderedDict[
+            tuple[bytes, int, int, frozenset[str]], tuple[tuple[str, float], ...]
+        ] = OrderedDict()
+        self._expansion_lock = threading.Lock()
 
     def build(self, item_labels: list[str], item_vectors: np.ndarray) -> None:
         """Build token embeddings from item labels and their vectors.
@@ -206,14 +373,15 @@ class TokenLexiconLearner:
             filtered_tokens = [token for token in tokens if token and not token.isdigit()]
             label_tokens.append(list(dict.fromkeys(filtered_tokens)))
 
-        # Build token-to-items mapping and document frequency
-        df_counter: Counter[str] = Counter()
+        # Build token-to-items mapping; tokens are unique per label, so each
+        # token's document frequency is simply the size of its item list
+        token_to_items: defaultdict[str, list[int]] = defaultdict(list)
         for item_index, tokens in enumerate(label_tokens):
             for token in tokens:
-                self.token_to_items[token].append(item_index)
-            df_counter.update(tokens)
+                token_to_items[token].append(item_index)
 
-        self.token_df = dict(df_counter)
+        self.token_to_items = token_to_items
+        self.token_df = {token: len(items) for token, items in token_to_items.items()}
 
         # Sort tokens by document frequency (descending) then alphabetically
         tokens_sorted = sorted(
@@ -232,6 +400,11 @@ class TokenLexiconLearner:
             token_embeddings.append(token_embedding)
 
         self.tokens = tokens_sorted
+        self._df_array = np.fromiter(
+            (self.token_df[token] for token in tokens_sorted),
+            dtype=np.int32,
+            count=len(tokens_sorted),
+        )
         self.vecs = (
             np.vstack(token_embeddings)  # type: ignore[misc]
             if token_embeddings
@@ -243,6 +416,8 @@ class TokenLexiconLearner:
             token_labels = [f"tok::{token}" for token in self.tokens]
             self.index.build(token_labels, self.vecs)  # type: ignore[misc]
 
+        with self._expansion_lock:
+            self._expansion_cache.clear()
         self._built = True
 
     def expand_tokens_by_query(
@@ -269,25 +444,34 @@ class TokenLexiconLearner:
         if not self._built or len(self.tokens) == 0:
             return []
 
+        exclude_set = frozenset(exclude or ())
+        key = (np.asarray(query_vector, dtype=np.float32).tobytes(), top_n, min_df, exclude_set)
+        with self._expansion_lock:
+            cached = self._expansion_cache.get(key)
+            if cached is not None:
+                self._expansion_cache.move_to_end(key)
+                return list(cached)
+
         # Search for similar tokens
         candidate_count = min(top_n * 5, len(self.tokens))
-        hits = self.index.search(query_vector, k=candidate_count)
+        ids, sims = self.index.search_ids(query_vector, k=candidate_count)
 
-        exclude_set = set(exclude or [])
+        # Index ids are positions in ``tokens``; apply the df threshold as a mask
+        keep = self._df_array[ids] >= min_df
+        tokens = self.tokens
         results: list[tuple[str, float]] = []
 
-        for label, score in hits:
-            # Extract token from label (format: "tok::token")
-            token = label.split("::", 1)[-1]
-
+        for idx, score in zip(ids[keep].tolist(), sims[keep].tolist(), strict=True):
+            token = tokens[idx]
             if token in exclude_set:
                 continue
 
-            # Check document frequency threshold
-            if self.token_df.get(token, 0) >= min_df:
-                results.append((token, float(score)))
-
+            results.append((token, score))
             if len(results) >= top_n:
                 break
 
+        with self._expansion_lock:
+            self._expansion_cache[key] = tuple(results)
+            if len(self._expansion_cache) > EXPANSION_CACHE_SIZE:
+                self._expansion_cache.popitem(last=False)
         return results
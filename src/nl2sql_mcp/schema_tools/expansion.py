@@ -11,6 +11,7 @@ Classes:
 
 from __future__ import annotations
 
+import heapq
 from typing import TYPE_CHECKING
 
 from fastmcp.utilities.logging import get_logger
@@ -18,6 +19,8 @@ from fastmcp.utilities.logging import get_logger
 from .constants import TableArchetype
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .models import SchemaCard
 
 # Logger
@@ -42,10 +45,37 @@ class GraphExpander:
         Args:
             schema_card: Complete schema card with table metadata and relationships
             expander_type: Type of expansion algorithm to use ("fk_following" or "simple")
+
+        Raises:
+            ValueError: If ``expander_type`` is not a known algorithm
         """
         self.schema_card = schema_card
         self.expander_type = expander_type
 
+        # Resolve the algorithm once instead of comparing strings per call
+        implementations: dict[str, Callable[[list[str], int], list[str]]] = {
+            "fk_following": self.expand_fk_following,
+            "simple": self.expand_simple,
+        }
+        if expander_type not in implementations:
+            msg = f"Unknown expander type {expander_type!r}; expected {sorted(implementations)}"
+            raise ValueError(msg)
+        self._expand_impl = implementations[expander_type]
+
+        # Undirected adjacency: table -> (edge position, neighbor) in edge order,
+        # so expansion never rescans the full edge list
+        adjacency: dict[str, list[tuple[int, str]]] = {}
+        for position, (source_table, target_table, _) in enumerate(schema_card.edges):
+            if source_table == target_table:
+                continue
+            adjacency.setdefault(source_table, []).append((position, target_table))
+            adjacency.setdefault(target_table, []).append((position, source_table))
+        self._adj = adjacency
+
+        # Per-table utility; a rebuilt card gets a new expander, so this never
+        # needs invalidating
+        self._utility_cache: dict[str, float] = {}
+
     def _compute_node_utility(self, table_key: str) -> float:
         """Compute utility score for a table node.
 
@@ -58,6 +88,10 @@ class GraphExpander:
         Returns:
             Utility score (higher is better)
         """
+        cached = self._utility_cache.get(table_key)
+        if cached is not None:
+            return cached
+
         table_profile = self.schema_card.tables[table_key]
         score = 0.0
 
@@ -82,13 +116,15 @@ class GraphExpander:
         if table_profile.is_archive:
             score -= 0.6
 
+        self._utility_cache[table_key] = score
         return score
 
     def expand_simple(self, seed_tables: list[str], k: int) -> list[str]:
         """Expand seed tables using simple neighbor inclusion.
 
-        Includes all direct neighbors of the seed tables up to the limit.
-        This is a fast but less sophisticated approach.
+        Includes direct neighbors of the seed tables up to the limit, in seed
+        order and then FK edge order. This is a fast but less sophisticated
+        approach.
 
         Args:
             seed_tables: List of seed table keys
@@ -97,25 +133,20 @@ class GraphExpander:
         Returns:
             List of table keys including seeds and neighbors
         """
-        if not seed_tables:
-            return []
-
-        seed_set = set(seed_tables)
-        neighbors: set[str] = set()
-        valid_tables = set(self.schema_card.tables.keys())
-
-        # Find all direct neighbors of seed tables
-        for source_table, target_table, _ in self.schema_card.edges:
-            if source_table in seed_set and target_table in valid_tables:
-                neighbors.add(target_table)
-            if target_table in seed_set and source_table in valid_tables:
-                neighbors.add(source_table)
-
-        # Combine seeds and neighbors, limit to k tables
-        result_set = seed_set.union(neighbors)
-        return [table for table in list(result_set)[:k] if table in valid_tables]
-
-    def expand_fk_following(self, seed_tables: list[str], k: int) -> list[str]:  # noqa: PLR0912
+        tables = self.schema_card.tables
+        seeds = list(dict.fromkeys(t for t in seed_tables if t in tables))[: max(k, 0)]
+        selected = list(seeds)
+        seen = set(seeds)
+        for seed in seeds:
+            for _, neighbor in self._adj.get(seed, ()):
+                if len(selected) >= k:
+                    return selected
+                if neighbor not in seen and neighbor in tables:
+                    selected.append(neighbor)
+                    seen.add(neighbor)
+        return selected
+
+    def expand_fk_following(self, seed_tables: list[str], k: int) -> list[str]:
         """Expand seed tables using FK-following algorithm.
 
         Follows foreign key relationships from seed tables to find directly
@@ -151,40 +182,33 @@ class GraphExpander:
             main_tp = self.schema_card.tables.get(valid_seeds[0])
             main_area = main_tp.subject_area if main_tp else None
 
-        for source_table, target_table, _ in self.schema_card.edges:
-            # Check if we have a connection from selected to unselected table
-            if (
-                source_table in selected_set
-                and target_table not in selected_set
-                and target_table in self.schema_card.tables
-            ):
-                utility = self._compute_node_utility(target_table)
-                # Subject-area consistency bonus
-                if main_area is not None:
-                    tp = self.schema_card.tables.get(target_table)
-                    if tp and tp.subject_area == main_area:
-                        utility += 0.2
-                neighbor_scores.append((utility, target_table))
-            elif (
-                target_table in selected_set
-                and source_table not in selected_set
-                and source_table in self.schema_card.tables
-            ):
-                utility = self._compute_node_utility(source_table)
-                if main_area is not None:
-                    tp = self.schema_card.tables.get(source_table)
-                    if tp and tp.subject_area == main_area:
-                        utility += 0.2
-                neighbor_scores.append((utility, source_table))
-
-        # Sort neighbors by utility (descending) and add until we reach k
-        neighbor_scores.sort(key=lambda x: -x[0])
-        for _, neighbor in neighbor_scores:
-            if len(selected_tables) >= k:
-                break
-            if neighbor not in selected_set:
-                selected_tables.append(neighbor)
-                selected_set.add(neighbor)
+        # Edges from a selected to an unselected table, in edge order so that
+        # equal-utility neighbors keep their original tie order
+        candidates = sorted(
+            pair
+            for table in selected_set
+            for pair in self._adj.get(table, ())
+            if pair[1] not in selected_set and pair[1] in self.schema_card.tables
+        )
+        scored: set[str] = set()
+        for _, neighbor in candidates:
+            # A neighbor reached over several edges is scored once
+            if neighbor in scored:
+                continue
+            scored.add(neighbor)
+            utility = self._compute_node_utility(neighbor)
+            # Subject-area consistency bonus
+            if main_area is not None:
+                tp = self.schema_card.tables.get(neighbor)
+                if tp and tp.subject_area == main_area:
+                    utility += 0.2
+            neighbor_scores.append((utility, neighbor))
+
+        # Add the highest-utility neighbors that fit; nlargest keeps tie order
+        remaining = k - len(selected_tables)
+        for _, neighbor in heapq.nlargest(remaining, neighbor_scores, key=lambda x: x[0]):
+            selected_tables.append(neighbor)
+            selected_set.add(neighbor)
 
         return selected_tables[:k]
 
@@ -198,6 +222,4 @@ class GraphExpander:
         Returns:
             List of expanded table keys
         """
-        if self.expander_type == "fk_following":
-            return self.expand_fk_following(seed_tables, k)
-        return self.expand_simple(seed_tables, k)
+        return self._expand_impl(seed_tables, k)
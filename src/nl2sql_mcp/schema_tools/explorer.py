@@ -14,6 +14,7 @@ from __future__ import annotations
 from collections import Counter, defaultdict
 import hashlib
 import time
+from typing import Any
 
 from fastmcp.utilities.logging import get_logger
 import networkx as nx
@@ -30,7 +31,7 @@ from .models import ColumnProfile, SchemaCard, SchemaExplorerConfig, TableProfil
 from .profiling import Profiler
 from .reflection import ReflectionAdapter
 from .sampling import Sampler
-from .utils import fingerprint_reflection, is_archive_label, now, tokens_from_text
+from .utils import fingerprint_reflection, is_archive_label, now, tokens_iter
 
 # Logger
 _logger = get_logger("schema_explorer")
@@ -121,7 +122,12 @@ class SchemaExplorer:
         """
         return hashlib.sha256(url.encode("utf-8")).hexdigest()[:10]
 
-    def build_index(self, timings: dict[str, float] | None = None) -> SchemaCard:  # noqa: PLR0912
+    def build_index(  # noqa: PLR0912
+        self,
+        timings: dict[str, float] | None = None,
+        *,
+        reflection: tuple[dict[str, Any], str] | None = None,
+    ) -> SchemaCard:
         """Build complete schema index with all analysis components.
 
         Performs comprehensive schema analysis including reflection, sampling,
@@ -130,6 +136,8 @@ class SchemaExplorer:
 
         Args:
             timings: Optional dictionary to store timing measurements
+            reflection: Optional (reflection payload, fingerprint) pair the caller
+                already has, so the database is not reflected and hashed again
 
         Returns:
             Complete SchemaCard with analyzed metadata
@@ -143,12 +151,15 @@ class SchemaExplorer:
         total_start = now()
 
         # Step 1: Database reflection
-        _logger.info("Starting database reflection...")
-        reflection_start = now()
-        reflection_data = self._reflector.reflect()
-        timings["reflect"] = now() - reflection_start
-
-        self._reflection_hash = fingerprint_reflection(reflection_data)
+        if reflection is None:
+            _logger.info("Starting database reflection...")
+            reflection_start = now()
+            reflection_data = self._reflector.reflect()
+            timings["reflect"] = now() - reflection_start
+            self._reflection_hash = fingerprint_reflection(reflection_data)
+        else:
+            reflection_data, self._reflection_hash = reflection
+            timings["reflect"] = 0.0
         schemas = list(reflection_data["schemas"].keys())
         db_url_fingerprint = self._db_url_fingerprint(str(self._engine.url))
 
@@ -285,17 +296,28 @@ class SchemaExplorer:
         # Step 6: Classification and summarization
         _logger.info("Classifying tables and generating summaries...")
         classification_start = now()
+        archetypes = self._classifier.bulk_classify(tables, relationship_graph)
         for table_key, table_profile in tables.items():
-            table_profile.archetype = self._classifier.classify_table(
-                table_profile, relationship_graph
-            )
+            table_profile.archetype = archetypes[table_key]
             table_profile.summary = self._classifier.summarize_table(table_profile)
 
-            # Compute derived metrics
-            table_profile.n_metrics = sum(
-                1 for col in table_profile.columns if col.role == "metric"
-            )
-            table_profile.n_dates = sum(1 for col in table_profile.columns if col.role == "date")
+            # Compute derived metrics in a single pass over the columns
+            metric_names: list[str] = []
+            date_names: list[str] = []
+            n_categories = 0
+            for col in table_profile.columns:
+                role = col.role
+                if role == "metric":
+                    metric_names.append(col.name)
+                elif role == "date":
+                    date_names.append(col.name)
+                elif role == "category":
+                    n_categories += 1
+            table_profile.metric_col_names = tuple(metric_names)
+            table_profile.date_col_names = tuple(date_names)
+            table_profile.n_metrics = len(metric_names)
+            table_profile.n_dates = len(date_names)
+            table_profile.n_categories = n_categories
             table_profile.is_archive = is_archive_label(table_key)
 
         # Audit-like detection based on centrality and generic tokens
@@ -305,7 +327,7 @@ class SchemaExplorer:
         )
 
         for table_profile in tables.values():
-            table_tokens = set(tokens_from_text(table_profile.name))
+            table_tokens = set(tokens_iter(table_profile.name))
             has_generic_tokens = any(
                 token in Constants.GENERIC_DIMENSION_TOKENS for token in table_tokens
             )
@@ -359,65 +381,74 @@ class SchemaExplorer:
     # ---- internals ---------------------------------------------------------
 
     def _sample_and_profile_tables(self, tables: dict[str, TableProfile]) -> dict[str, int]:
-        """Sample and profile tables using a single streaming connection.
+        """Sample and profile tables, sampling up to ``sample_workers`` tables at once.
 
         Returns a mapping of ``"schema.table"`` to the number of columns
         actually selected for sampling (after LOB filtering and column cap).
         Keeps logic out of ``build_index`` to reduce branching and improve readability.
         """
-        coverage: dict[str, int] = {}
-        with self._engine.connect() as _conn:
-            streaming_conn = _conn.execution_options(stream_results=True)
-            for table_profile in list(tables.values()):
-                preview_cols = 12  # limit for DEBUG column name preview
-                columns_ordered = table_profile.columns
-                if self.config.max_sampled_columns:
-                    columns_ordered = columns_ordered[: self.config.max_sampled_columns]
-
-                def _is_lob(type_str: str) -> bool:
-                    t = (type_str or "").lower()
-                    return any(
-                        hint in t
-                        for hint in ("blob", "clob", "bytea", "varbinary", "image", "ntext")
-                    )
 
-                column_names = [col.name for col in columns_ordered if not _is_lob(col.type)]
-                lob_skipped = max(0, len(columns_ordered) - len(column_names))
-
-                # DEBUG visibility per table
-                try:
-                    preview = ", ".join(column_names[:preview_cols])
-                    if len(column_names) > preview_cols:
-                        preview += ", …"
-                    _logger.debug(
-                        "sampling table %s.%s: cols=%d [%s] lob_skipped=%d",
-                        table_profile.schema,
-                        table_profile.name,
-                        len(column_names),
-                        preview,
-                        lob_skipped,
-                    )
-                except Exception:  # noqa: BLE001 - observability-only
-                    _logger.debug("sampling table preview failed", exc_info=True)
-
-                sample_data = self._sampler.sample_table(
-                    table_profile.schema, table_profile.name, column_names, conn=streaming_conn
-                )
-                updated = self._profiler.profile_table(
-                    table_profile,
-                    sample_data,
-                    value_constraint_threshold=self.config.value_constraint_threshold,
-                )
-                tables[f"{updated.schema}.{updated.name}"] = updated
-                coverage[f"{updated.schema}.{updated.name}"] = len(column_names)
+        def _is_lob(type_str: str) -> bool:
+            t = (type_str or "").lower()
+            return any(
+                hint in t for hint in ("blob", "clob", "bytea", "varbinary", "image", "ntext")
+            )
 
-                # DEBUG post-profile heartbeat per table
+        # Select columns per table first so the IO-bound sampling can run as a batch
+        profiles = list(tables.values())
+        requests: list[tuple[str, str, list[str]]] = []
+        for table_profile in profiles:
+            preview_cols = 12  # limit for DEBUG column name preview
+            columns_ordered = table_profile.columns
+            if self.config.max_sampled_columns:
+                columns_ordered = columns_ordered[: self.config.max_sampled_columns]
+
+            column_names = [col.name for col in columns_ordered if not _is_lob(col.type)]
+            lob_skipped = max(0, len(columns_ordered) - len(column_names))
+
+            # DEBUG visibility per table
+            try:
+                preview = ", ".join(column_names[:preview_cols])
+                if len(column_names) > preview_cols:
+                    preview += ", …"
                 _logger.debug(
-                    "profiled %s.%s: rows_sampled=%d",
-                    updated.schema,
-                    updated.name,
-                    int(updated.n_rows_sampled or 0),
+                    "sampling table %s.%s: cols=%d [%s] lob_skipped=%d",
+                    table_profile.schema,
+                    table_profile.name,
+                    len(column_names),
+                    preview,
+                    lob_skipped,
                 )
+            except Exception:  # noqa: BLE001 - observability-only
+                _logger.debug("sampling table preview failed", exc_info=True)
+
+            requests.append((table_profile.schema, table_profile.name, column_names))
+
+        samples = self._sampler.iter_sample_tables(
+            requests, max_workers=self.config.sample_workers
+        )
+
+        # Profile in table order as samples arrive, overlapping with the sampling
+        # of later tables; profiling is CPU-bound and stays on this thread
+        coverage: dict[str, int] = {}
+        for table_profile, (_, _, column_names), sample_data in zip(
+            profiles, requests, samples, strict=True
+        ):
+            updated = self._profiler.profile_table(
+                table_profile,
+                sample_data,
+                value_constraint_threshold=self.config.value_constraint_threshold,
+            )
+            tables[f"{updated.schema}.{updated.name}"] = updated
+            coverage[f"{updated.schema}.{updated.name}"] = len(column_names)
+
+            # DEBUG post-profile heartbeat per table
+            _logger.debug(
+                "profiled %s.%s: rows_sampled=%d",
+                updated.schema,
+                updated.name,
+                int(updated.n_rows_sampled or 0),
+            )
 
         return coverage
 
@@ -438,7 +469,7 @@ class SchemaExplorer:
             return False
 
         _logger.info("Schema changed; rebuilding index.")
-        self.build_index()
+        self.build_index(reflection=(current_reflection, current_hash))
         return True
 
     def enrich_index(self) -> SchemaCard:
@@ -510,7 +541,7 @@ class SchemaExplorer:
             # Generate area name from common tokens
             all_table_tokens: Counter[str] = Counter()
             for tp in tables.values():
-                all_table_tokens.update(tokens_from_text(tp.name))
+                all_table_tokens.update(tokens_iter(tp.name))
 
             common_tokens = {t for t, _ in all_table_tokens.most_common(10)}
             area_tokens: Counter[str] = Counter()
@@ -532,7 +563,7 @@ class SchemaExplorer:
                 min_token_length = 2
                 tokens = [
                     token
-                    for token in tokens_from_text(table_profile.name)
+                    for token in tokens_iter(table_profile.name)
                     if token not in common_tokens
                     and token not in generic_tokens
                     and len(token) > min_token_length
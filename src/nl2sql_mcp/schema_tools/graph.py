@@ -12,6 +12,9 @@ Classes:
 
 from __future__ import annotations
 
+# Optional accelerator detection at import time to avoid runtime try/except.
+import importlib.util as _importlib_util
+import random
 from typing import TYPE_CHECKING
 
 from fastmcp.utilities.logging import get_logger
@@ -34,10 +37,59 @@ MAX_METRICS_FOR_DIMENSION = 1
 MAX_COLS_FOR_REFERENCE = 4
 MIN_CONNECTIONS_FOR_REFERENCE = 1
 
+# Table summaries: column role -> summary bucket, and how many names each bucket lists
+SUMMARY_ROLE_BUCKETS: dict[str, str] = {
+    "key": "key",
+    "date": "date",
+    "metric": "metric",
+    "category": "dimension",
+    "text": "dimension",
+}
+SUMMARY_BUCKET_LIMITS: dict[str, int] = {"key": 3, "date": 2, "metric": 5, "dimension": 6}
+
+# Fixed seed so Leiden yields the same subject areas on every schema build
+COMMUNITY_SEED = 42
+
+# python-igraph (C core, the "leiden" extra) provides Leiden community detection;
+# fall back to NetworkX greedy modularity when it is not installed.
+_HAS_IGRAPH = _importlib_util.find_spec("igraph") is not None
+
 # Logger
 _logger = get_logger("schema_explorer.graph")
 
 
+def _leiden_communities(graph: nx.Graph[str]) -> list[list[str]]:
+    """Detect modularity communities with igraph's Leiden implementation.
+
+    Args:
+        graph: Undirected NetworkX graph with at least one edge
+
+    Returns:
+        Communities as node lists, largest first (matching NetworkX ordering)
+    """
+    import igraph  # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    ig_graph = igraph.Graph(
+        n=len(nodes),
+        edges=[(index[u], index[v]) for u, v in graph.edges()],
+        directed=False,
+    )
+    rng = random.Random(COMMUNITY_SEED)  # noqa: S311 - clustering, not security
+    igraph.set_random_number_generator(rng)
+    try:
+        partition = ig_graph.community_leiden(objective_function="modularity", n_iterations=-1)
+    finally:
+        igraph.set_random_number_generator(random)
+
+    membership: list[int] = list(partition.membership)
+    groups: dict[int, list[str]] = {}
+    for node, community_id in zip(nodes, membership, strict=True):
+        groups.setdefault(community_id, []).append(node)
+    return sorted(groups.values(), key=len, reverse=True)
+
+
 class GraphBuilder:
     """Builder for relationship graphs from database schema metadata.
 
@@ -61,16 +113,16 @@ class GraphBuilder:
         graph: nx.DiGraph[str] = nx.DiGraph()
 
         # Add all tables as nodes
-        for table_key in tables:
-            graph.add_node(table_key)
+        graph.add_nodes_from(tables)
 
-        # Add foreign key relationships as edges
-        for table_key, table_profile in tables.items():
-            for column_name, ref_table, ref_column in table_profile.fks:
-                if ref_table in tables:
-                    # Create edge with foreign key description
-                    fk_description = f"{table_key}.{column_name}->{ref_table}.{ref_column}"
-                    graph.add_edge(table_key, ref_table, fk=fk_description)
+        # Add foreign key relationships as edges in one batch, each carrying its
+        # foreign key description; FKs to tables outside the card are skipped
+        graph.add_edges_from(
+            (table_key, ref_table, {"fk": f"{table_key}.{column_name}->{ref_table}.{ref_column}"})
+            for table_key, table_profile in tables.items()
+            for column_name, ref_table, ref_column in table_profile.fks
+            if ref_table in tables
+        )
 
         return graph
 
@@ -79,8 +131,9 @@ class GraphBuilder:
     ) -> tuple[dict[str, float], dict[str, int]]:
         """Compute graph centrality metrics and detect communities.
 
-        Calculates degree centrality for all nodes and uses greedy modularity
-        maximization to detect communities (subject areas).
+        Calculates degree centrality for all nodes and detects communities
+        (subject areas) by modularity maximization: Leiden via igraph when it
+        is installed, otherwise NetworkX greedy modularity.
 
         Args:
             graph: NetworkX directed graph of table relationships
@@ -93,14 +146,25 @@ class GraphBuilder:
         # Convert to undirected graph for centrality and community detection
         undirected_graph = graph.to_undirected()
 
-        # Compute degree centrality
-        centrality = nx.degree_centrality(undirected_graph)
+        # Degree centrality, computed as nx.degree_centrality does but without
+        # its generic dispatch layer
+        n_nodes = undirected_graph.number_of_nodes()
+        centrality: dict[str, float]
+        if n_nodes <= 1:
+            centrality = dict.fromkeys(undirected_graph, 1.0)
+        else:
+            scale = 1.0 / (n_nodes - 1)
+            centrality = {node: degree * scale for node, degree in undirected_graph.degree()}
 
-        # Detect communities using greedy modularity maximization
+        # Detect communities using modularity maximization
+        communities_list: list[list[str]] | list[set[str]]
         if undirected_graph.number_of_edges() > 0:
-            communities_list = nx.algorithms.community.greedy_modularity_communities(
-                undirected_graph
-            )
+            if _HAS_IGRAPH:
+                communities_list = _leiden_communities(undirected_graph)
+            else:
+                communities_list = list(
+                    nx.algorithms.community.greedy_modularity_communities(undirected_graph)
+                )
         else:
             # If no edges, put all nodes in one community
             communities_list = [set(undirected_graph.nodes())]
@@ -122,12 +186,38 @@ class Classifier:
     human-readable summaries.
     """
 
+    def bulk_classify(
+        self, tables: dict[str, TableProfile], graph: nx.DiGraph[str]
+    ) -> dict[str, str]:
+        """Classify every table against one graph.
+
+        Degree views are materialized into plain dicts once, so classifying N
+        tables does not pay for 2N NetworkX view lookups.
+
+        Args:
+            tables: Dictionary mapping table keys to TableProfile objects
+            graph: NetworkX graph containing relationship information
+
+        Returns:
+            Dictionary mapping table keys to archetype strings
+        """
+        out_degrees: dict[str, int] = dict(graph.out_degree())  # type: ignore[arg-type]
+        in_degrees: dict[str, int] = dict(graph.in_degree())  # type: ignore[arg-type]
+        archetypes: dict[str, str] = {}
+        for table_key, table_profile in tables.items():
+            table_node = f"{table_profile.schema}.{table_profile.name}"
+            archetypes[table_key] = self._classify_with_degrees(
+                table_profile, out_degrees.get(table_node, 0), in_degrees.get(table_node, 0)
+            )
+        return archetypes
+
     def classify_table(self, table_profile: TableProfile, graph: nx.DiGraph[str]) -> str:
         """Classify a table into a dimensional modeling archetype.
 
         Uses heuristics based on table structure, column roles, and graph
         position to classify tables into fact, dimension, bridge, reference,
-        or operational archetypes.
+        or operational archetypes. Prefer ``bulk_classify`` when classifying
+        many tables against the same graph.
 
         Args:
             table_profile: TableProfile object to classify
@@ -136,15 +226,6 @@ class Classifier:
         Returns:
             Table archetype string (fact, dimension, bridge, reference, operational)
         """
-        # Count column roles
-        num_metrics = sum(1 for col in table_profile.columns if col.role == "metric")
-        num_dates = sum(1 for col in table_profile.columns if col.role == "date")
-
-        # Count non-key columns
-        non_fk_non_key_columns = [
-            col for col in table_profile.columns if not col.is_fk and not col.is_pk
-        ]
-
         # Get graph degree information
         table_node = f"{table_profile.schema}.{table_profile.name}"
         if table_node in graph:
@@ -153,16 +234,39 @@ class Classifier:
         else:
             out_degree = 0
             in_degree = 0
-        total_degree = int(out_degree) + int(in_degree)
+        return self._classify_with_degrees(table_profile, int(out_degree), int(in_degree))
+
+    def _classify_with_degrees(
+        self, table_profile: TableProfile, out_degree: int, in_degree: int
+    ) -> str:
+        """Apply the archetype heuristics given precomputed graph degrees."""
+        # Tally column roles, non-key columns and PK/FK overlap in a single pass
+        num_metrics = 0
+        num_dates = 0
+        num_non_key = 0
+        pk_cols_all_fk = True
+        for col in table_profile.columns:
+            role = col.role
+            if role == "metric":
+                num_metrics += 1
+            elif role == "date":
+                num_dates += 1
+            if col.is_pk:
+                if not col.is_fk:
+                    pk_cols_all_fk = False
+            elif not col.is_fk:
+                num_non_key += 1
+        num_pk_cols = len(table_profile.pk_cols)
+        total_degree = out_degree + in_degree
 
         # Bridge table detection
         # - Compound primary key with all FK columns
         # - Few or no non-key columns
         # - Connected to multiple tables
         if (
-            len(table_profile.pk_cols) >= MIN_PK_COLS_FOR_BRIDGE
-            and all(col.is_fk for col in table_profile.columns if col.is_pk)
-            and len(non_fk_non_key_columns) <= MAX_NON_KEY_COLS_FOR_BRIDGE
+            num_pk_cols >= MIN_PK_COLS_FOR_BRIDGE
+            and pk_cols_all_fk
+            and num_non_key <= MAX_NON_KEY_COLS_FOR_BRIDGE
             and total_degree >= MIN_CONNECTIONS_FOR_BRIDGE
         ):
             return TableArchetype.BRIDGE.value
@@ -184,7 +288,7 @@ class Classifier:
         if (
             in_degree >= MIN_IN_DEGREE_FOR_DIMENSION
             and num_metrics <= MAX_METRICS_FOR_DIMENSION
-            and len(table_profile.pk_cols) == 1
+            and num_pk_cols == 1
         ):
             return TableArchetype.DIMENSION.value
 
@@ -214,13 +318,16 @@ class Classifier:
         Returns:
             Human-readable table summary string
         """
-        # Extract key information from columns
-        key_columns = [col.name for col in table_profile.columns if col.role == "key"][:3]
-        date_columns = [col.name for col in table_profile.columns if col.role == "date"][:2]
-        metric_columns = [col.name for col in table_profile.columns if col.role == "metric"][:5]
-        dimension_columns = [
-            col.name for col in table_profile.columns if col.role in ("category", "text")
-        ][:6]
+        # Extract key information from columns in a single pass
+        picked: dict[str, list[str]] = {bucket: [] for bucket in SUMMARY_BUCKET_LIMITS}
+        for col in table_profile.columns:
+            bucket = SUMMARY_ROLE_BUCKETS.get(col.role or "")
+            if bucket is not None and len(picked[bucket]) < SUMMARY_BUCKET_LIMITS[bucket]:
+                picked[bucket].append(col.name)
+        key_columns = picked["key"]
+        date_columns = picked["date"]
+        metric_columns = picked["metric"]
+        dimension_columns = picked["dimension"]
 
         # Build summary parts
         table_name = f"{table_profile.schema}.{table_profile.name}"
@@ -13,11 +13,14 @@ Models:
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, field
 import json
+import threading
 from typing import Any
 
-from nl2sql_mcp.models import SubjectAreaData
+from nl2sql_mcp.models import SubjectAreaData, TableInfo
+from nl2sql_mcp.schema_tools.utils import parse_fk_columns
 
 from .constants import Constants
 
@@ -86,6 +89,9 @@ class TableProfile:
         centrality: Graph centrality measure indicating table importance
         n_metrics: Count of columns classified as metrics/measures
         n_dates: Count of columns classified as date/time columns
+        n_categories: Count of columns classified as categorical attributes
+        metric_col_names: Names of metric columns, in column order
+        date_col_names: Names of date/time columns, in column order
         is_archive: True if table appears to contain historical/archived data
         is_audit_like: True if table appears to be a generic system/audit table
     """
@@ -105,6 +111,9 @@ class TableProfile:
     # Derived analytical flags
     n_metrics: int = 0
     n_dates: int = 0
+    n_categories: int = 0
+    metric_col_names: tuple[str, ...] = ()
+    date_col_names: tuple[str, ...] = ()
     is_archive: bool = False
     is_audit_like: bool = False
 
@@ -118,6 +127,11 @@ class SchemaCard:
     It serves as the central knowledge base for query generation and
     schema understanding.
 
+    A card is immutable once constructed: the derived fields below are computed
+    in ``__post_init__`` and are not refreshed if ``tables`` or ``edges`` change
+    afterwards. Build the complete tables and edges first, and construct a new
+    card (as a schema rebuild does) instead of mutating an existing one.
+
     Attributes:
         db_dialect: Database dialect/engine type (postgresql, mysql, etc.)
         db_url_fingerprint: Hash fingerprint of the database connection URL
@@ -127,6 +141,15 @@ class SchemaCard:
         edges: List of relationship edges as (src_table, dst_table, fk_description)
         built_at: Unix timestamp when this schema card was created
         reflection_hash: Hash of the reflection payload for change detection
+        edges_by_table: Derived index mapping each table key to the edges touching it,
+            in edge order (not serialized; built from ``edges`` at construction)
+        edge_columns: Derived map from each well-formed FK description to its
+            parsed (from_col, to_col) pair (not serialized; built at construction)
+        archetype_by_table: Derived map from table key to its archetype label, for
+            tables that have one (not serialized; built at construction)
+        table_info_cache: Bounded LRU of get_table_info responses keyed by table and
+            build options, guarded by ``table_info_lock`` (not serialized; starts
+            empty and is discarded with the card)
     """
 
     db_dialect: str
@@ -137,6 +160,35 @@ class SchemaCard:
     edges: list[tuple[str, str, str]]  # (src_table, dst_table, fk_desc)
     built_at: float
     reflection_hash: str
+    edges_by_table: dict[str, list[tuple[str, str, str]]] = field(
+        init=False, repr=False, compare=False
+    )
+    edge_columns: dict[str, tuple[str, str]] = field(init=False, repr=False, compare=False)
+    archetype_by_table: dict[str, str] = field(init=False, repr=False, compare=False)
+    table_info_cache: OrderedDict[tuple[Any, ...], TableInfo] = field(
+        init=False, repr=False, compare=False
+    )
+    table_info_lock: threading.Lock = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index edges by endpoint, parse FK descriptions, and map table archetypes."""
+        index: dict[str, list[tuple[str, str, str]]] = {}
+        columns: dict[str, tuple[str, str]] = {}
+        for edge in self.edges:
+            src, dst, fk_desc = edge[0], edge[1], edge[2]
+            index.setdefault(src, []).append(edge)
+            if dst != src:
+                index.setdefault(dst, []).append(edge)
+            parsed = parse_fk_columns(fk_desc)
+            if parsed is not None:
+                columns[fk_desc] = parsed
+        self.edges_by_table = index
+        self.edge_columns = columns
+        self.archetype_by_table = {
+            key: tp.archetype for key, tp in self.tables.items() if tp.archetype
+        }
+        self.table_info_cache = OrderedDict()
+        self.table_info_lock = threading.Lock()
 
     def to_json(self) -> str:
         """Serialize the schema card to JSON format.
@@ -236,6 +288,7 @@ class SchemaExplorerConfig:
         fast_startup: Enable faster, shallow first build of the index
         max_tables_at_startup: Optional cap on number of tables reflected at startup
         max_sampled_columns: Maximum number of columns to sample per table
+        sample_workers: Maximum number of tables sampled concurrently
     """
 
     include_schemas: list[str] | None = None
@@ -253,6 +306,7 @@ class SchemaExplorerConfig:
     fast_startup: bool = False
     max_tables_at_startup: int | None = None
     max_sampled_columns: int = 20
+    sample_workers: int = Constants.DEFAULT_SAMPLE_WORKERS
     # Reflection timeout (seconds) applied session-locally during metadata reflection
     reflect_timeout_sec: int = Constants.DEFAULT_TIMEOUT_SEC
     # Retrieval/expansion tuning
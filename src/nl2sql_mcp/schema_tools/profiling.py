@@ -27,6 +27,14 @@ if TYPE_CHECKING:
 
 MIN_UNIQUE_COUNT_FOR_METRIC = 10
 
+# COMBINED_TYPE_PATTERN group name -> (semantic tag, pattern label)
+_VALUE_KIND_TAGS: dict[str, tuple[str, str]] = {
+    "email": ("email", "email-like"),
+    "phone": ("phone", "phone-like"),
+    "url": ("url", "url-like"),
+    "percent": ("unit:%", "percent-like"),
+}
+
 # Logger
 _logger = get_logger("schema_explorer.profiling")
 
@@ -52,6 +60,7 @@ class Profiler:
         PHONE_RE: Compiled regex for phone number pattern detection
         URL_RE: Compiled regex for URL pattern detection
         PCT_RE: Compiled regex for percentage pattern detection
+        VALUE_RE: Single-pass regex combining the four value patterns above
         DATE_HINTS: Set of tokens that suggest date/time columns
         NUM_HINTS: Set of tokens that suggest numeric columns
     """
@@ -61,6 +70,7 @@ class Profiler:
     PHONE_RE = Constants.PHONE_PATTERN
     URL_RE = Constants.URL_PATTERN
     PCT_RE = Constants.PERCENT_PATTERN
+    VALUE_RE = Constants.COMBINED_TYPE_PATTERN
 
     # Type hint sets
     DATE_HINTS = Constants.DATE_TYPE_HINTS
@@ -96,7 +106,7 @@ class Profiler:
         type_lower = sqlalchemy_type.lower()
         return ("char" in type_lower) or ("text" in type_lower) or ("clob" in type_lower)
 
-    def infer_col_role(  # noqa: PLR0912
+    def infer_col_role(
         self,
         name: str,
         sqlalchemy_type: str,
@@ -183,18 +193,11 @@ class Profiler:
         for value in values[:30]:  # Analyze first 30 values
             value_str = str(value)  # Ensure string type
 
-            if self.EMAIL_RE.match(value_str):
-                semantic_tags.append("email")
-                patterns.append("email-like")
-            elif self.PHONE_RE.match(value_str):
-                semantic_tags.append("phone")
-                patterns.append("phone-like")
-            elif self.URL_RE.match(value_str):
-                semantic_tags.append("url")
-                patterns.append("url-like")
-            elif self.PCT_RE.search(value_str):
-                semantic_tags.append("unit:%")
-                patterns.append("percent-like")
+            match = self.VALUE_RE.match(value_str)
+            if match is not None and match.lastgroup:
+                tag, pattern = _VALUE_KIND_TAGS[match.lastgroup]
+                semantic_tags.append(tag)
+                patterns.append(pattern)
 
         # Named entity recognition using new LightweightNER (lazy & optional)
         if self._ner_enabled:
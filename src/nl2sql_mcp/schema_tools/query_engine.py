@@ -20,7 +20,7 @@ from .embeddings import Embedder, SemanticIndex, TokenLexiconLearner
 from .expansion import GraphExpander
 from .models import SchemaCard, SchemaExplorerConfig
 from .retrieval import RetrievalEngine
-from .utils import is_archive_label, tokens_from_text
+from .utils import is_archive_label, tokens_iter
 
 # Logger
 _logger = get_logger("query_engine")
@@ -95,9 +95,7 @@ class QueryEngine:
 
         # Build embeddings if embedder available
         if self.embedder:
-            self._build_table_embeddings()
-            if self.config.build_column_index:
-                self._build_column_embeddings()
+            self._build_embeddings()
 
             # Build token lexicon
             if self._col_labels and self._col_vecs is not None and len(self._col_labels) > 0:
@@ -105,6 +103,11 @@ class QueryEngine:
             elif self._table_vecs is not None:
                 self.lexicon_learner.build(self._table_labels, self._table_vecs)
 
+            # Raw float matrices are only needed to learn the lexicon; the
+            # ANN indexes hold the only copies from here on.
+            self._table_vecs = None
+            self._col_vecs = None
+
         # Initialize retrieval and expansion engines
         self.retrieval_engine = RetrievalEngine(
             schema_card=self.schema_card,
@@ -133,20 +136,20 @@ class QueryEngine:
             token_weights: dict[str, float] = defaultdict(float)
 
             # Add table name tokens
-            for token in tokens_from_text(table_profile.name):
+            for token in tokens_iter(table_profile.name):
                 token_weights[token] += 2.0
 
             # Add schema name tokens
-            for token in tokens_from_text(table_profile.schema):
+            for token in tokens_iter(table_profile.schema):
                 token_weights[token] += 0.5
 
             # Add column name and role tokens
             for column in table_profile.columns:
-                for token in tokens_from_text(column.name):
+                for token in tokens_iter(column.name):
                     token_weights[token] += 1.0
 
                 if column.role:
-                    for token in tokens_from_text(column.role):
+                    for token in tokens_iter(column.role):
                         token_weights[token] += 0.5
 
             # Downweight archive tables
@@ -156,11 +159,24 @@ class QueryEngine:
 
             self._lexical_cache[table_key] = dict(token_weights)
 
-    def _build_table_embeddings(self) -> None:
-        """Build table-level embeddings."""
+    def _build_embeddings(self) -> None:
+        """Embed table and column descriptions in one batch and index them."""
         if not self.embedder:
             return
 
+        table_labels, table_texts = self._table_embedding_texts()
+        col_labels: list[str] = []
+        col_texts: list[str] = []
+        if self.config.build_column_index:
+            col_labels, col_texts = self._column_embedding_texts()
+
+        encoded = self.embedder.encode_many({"tables": table_texts, "columns": col_texts})
+        self._build_table_embeddings(table_labels, encoded["tables"])
+        if self.config.build_column_index:
+            self._build_column_embeddings(col_labels, encoded["columns"])
+
+    def _table_embedding_texts(self) -> tuple[list[str], list[str]]:
+        """Collect table labels and the descriptions embedded for them."""
         labels: list[str] = []
         texts: list[str] = []
 
@@ -179,30 +195,10 @@ class QueryEngine:
             labels.append(table_key)
             texts.append(text)
 
-        # Generate embeddings
-        embeddings = self.embedder.encode(texts)
-
-        # Store for retrieval engine
-        self._table_labels = labels
-        self._table_vecs = embeddings
-
-        # Build semantic index
-        self.table_index = SemanticIndex()
-        self.table_index.build(labels, embeddings)
-
-        # Minimal heartbeat: table embeddings stats
-        try:
-            count = len(labels)
-            dim = int(embeddings.shape[1]) if embeddings.size > 0 else 0
-            _logger.info("embeddings.tables: count=%d dim=%d", count, dim)
-        except Exception:  # noqa: BLE001 - observability-only
-            _logger.debug("table embeddings heartbeat logging failed", exc_info=True)
-
-    def _build_column_embeddings(self) -> None:
-        """Build column-level embeddings."""
-        if not self.embedder:
-            return
+        return labels, texts
 
+    def _column_embedding_texts(self) -> tuple[list[str], list[str]]:
+        """Collect column labels and the descriptions embedded for them."""
         labels: list[str] = []
         texts: list[str] = []
 
@@ -220,15 +216,28 @@ class QueryEngine:
                 labels.append(f"{table_key}::{col.name}")
                 texts.append(text)
 
-        if texts:
-            embeddings = self.embedder.encode(texts)
-        elif self._table_vecs is not None:
-            # Create empty array with same dimension as table embeddings
-            embeddings = np.zeros((0, self._table_vecs.shape[1]), dtype="float32")
-        else:
-            # Default embedding dimension
-            embeddings = np.zeros((0, 384), dtype="float32")
+        return labels, texts
+
+    def _build_table_embeddings(self, labels: list[str], embeddings: np.ndarray) -> None:
+        """Store table embeddings and build the table index."""
+        # Store for retrieval engine
+        self._table_labels = labels
+        self._table_vecs = embeddings
+
+        # Build semantic index
+        self.table_index = SemanticIndex()
+        self.table_index.build(labels, embeddings)
+
+        # Minimal heartbeat: table embeddings stats
+        try:
+            count = len(labels)
+            dim = int(embeddings.shape[1]) if embeddings.size > 0 else 0
+            _logger.info("embeddings.tables: count=%d dim=%d", count, dim)
+        except Exception:  # noqa: BLE001 - observability-only
+            _logger.debug("table embeddings heartbeat logging failed", exc_info=True)
 
+    def _build_column_embeddings(self, labels: list[str], embeddings: np.ndarray) -> None:
+        """Store column embeddings and build the column index."""
         # Store for retrieval engine
         self._col_labels = labels
         self._col_vecs = embeddings
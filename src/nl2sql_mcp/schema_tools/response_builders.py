@@ -7,7 +7,9 @@ intelligence analysis data into structured models suitable for MCP responses.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, cast
+from functools import lru_cache
+import heapq
+from typing import TYPE_CHECKING, Literal
 
 import sqlalchemy as sa
 
@@ -24,16 +26,64 @@ from nl2sql_mcp.models import (
     TableInfo,
     TableSummary,
 )
+from nl2sql_mcp.schema_tools.constants import TableArchetype
 from nl2sql_mcp.schema_tools.explorer import SchemaExplorer
-from nl2sql_mcp.schema_tools.utils import tokens_from_text
+from nl2sql_mcp.schema_tools.utils import tokens_iter
 
 if TYPE_CHECKING:
     from nl2sql_mcp.schema_tools.models import TableProfile
 
 # Constants for magic values
 MAX_DISTINCT_VALUES_FOR_FILTERS = 10
-FK_DESCRIPTION_PARTS_COUNT = 2
-FK_TABLE_PARTS_MIN_COUNT = 2
+# get_table_info responses memoized per schema card (options are client-controlled)
+TABLE_INFO_CACHE_SIZE = 512
+
+# Archetype labels as stored on TableProfile.archetype (see Classifier.classify_table)
+_FACT = TableArchetype.FACT.value
+_DIMENSION = TableArchetype.DIMENSION.value
+
+# Relationship cardinality labels shared by every JoinExample
+_MANY_TO_ONE = "many:1"
+_ONE_TO_MANY = "1:many"
+
+# Column/table tokens used to score one-hop bridge tables (generic, DB-agnostic)
+_BRIDGE_ADMIN_TOKENS = frozenset(
+    {
+        "last",
+        "edited",
+        "edit",
+        "lastedited",
+        "lasteditedby",
+        "created",
+        "create",
+        "createdby",
+        "modified",
+        "modify",
+        "modifiedby",
+        "update",
+        "updated",
+        "updatedby",
+        "change",
+        "changed",
+    }
+)
+_BRIDGE_IDENTITY_TOKENS = frozenset(
+    {
+        "user",
+        "users",
+        "person",
+        "people",
+        "employee",
+        "employees",
+        "staff",
+        "account",
+        "accounts",
+        "login",
+        "logon",
+        "owner",
+        "ownerid",
+    }
+)
 
 
 class QuerySchemaResultBuilder:
@@ -68,10 +118,14 @@ class QuerySchemaResultBuilder:
             msg = "Schema card not available"
             raise RuntimeError(msg)
 
-        # Normalize detail controls
-        samples = include_samples and detail_level != "minimal"
-        columns_cap = 6 if detail_level == "minimal" else max_columns_per_table
-        joins_cap = 3 if detail_level == "minimal" else join_limit
+        # Normalize detail controls. Minimal responses skip the advisory candidate
+        # lists entirely; selected columns are still built because they drive the
+        # draft SQL, clarifications, and confidence.
+        minimal = detail_level == "minimal"
+        samples = include_samples and not minimal
+        columns_cap = 6 if minimal else max_columns_per_table
+        joins_cap = 3 if minimal else join_limit
+        wants_candidates = not minimal
 
         # Build suggested approach first to determine main table and dims
         suggested_approach, main_table, dims_sorted = (
@@ -105,11 +159,19 @@ class QuerySchemaResultBuilder:
         join_plan = QuerySchemaResultBuilder._build_join_plan(
             join_examples, explorer, limit=joins_cap, query=query
         )
-        group_by_candidates = QuerySchemaResultBuilder._build_group_by_candidates(
-            main_table, dims_sorted, explorer, max_items=8
+        group_by_candidates = (
+            QuerySchemaResultBuilder._build_group_by_candidates(
+                main_table, dims_sorted, explorer, max_items=8
+            )
+            if wants_candidates
+            else []
         )
-        filter_candidates = QuerySchemaResultBuilder._build_filter_candidates(
-            selected_tables, explorer, max_items=10
+        filter_candidates = (
+            QuerySchemaResultBuilder._build_filter_candidates(
+                selected_tables, explorer, max_items=10
+            )
+            if wants_candidates
+            else []
         )
         selected_columns = QuerySchemaResultBuilder._build_selected_columns(
             main_table, dims_sorted, explorer, max_items=8
@@ -177,7 +239,7 @@ class QuerySchemaResultBuilder:
         # a clear anchor table, emit a minimal COUNT(*) even when clarifications
         # exist (e.g., about joins). This improves usability for simple asks.
         if not draft_sql:
-            qtokens = set(tokens_from_text(query))
+            qtokens = set(tokens_iter(query))
             count_signals = {"count", "how", "many", "number"}
             is_count_intent = bool(count_signals & qtokens)
             anchor = main_table or (selected_tables[0] if selected_tables else None)
@@ -204,7 +266,9 @@ class QuerySchemaResultBuilder:
         else:
             next_action = "refine_plan"
 
-        return QuerySchemaResult(
+        # Every field is assembled above from already-built models and plain values in
+        # their declared types, so skip re-validating the whole nested result.
+        return QuerySchemaResult.model_construct(
             query=query,
             relevant_tables=relevant_tables,
             join_examples=join_examples,
@@ -212,12 +276,12 @@ class QuerySchemaResultBuilder:
             key_columns=key_columns,
             main_table=main_table,
             join_plan=join_plan,
-            group_by_candidates=group_by_candidates,
+            group_by_candidates=tuple(group_by_candidates),
             filter_candidates=filter_candidates,
             selected_columns=selected_columns,
             draft_sql=draft_sql,
-            clarifications=clarifications,
-            assumptions=assumptions,
+            clarifications=tuple(clarifications),
+            assumptions=tuple(assumptions),
             confidence=confidence,
             next_action=next_action,
             status=status,
@@ -255,18 +319,21 @@ class QuerySchemaResultBuilder:
                 out.append(t)
                 seen.add(t)
 
+        # Neighbours of the main table are both the direct-join set and the bridge candidates
+        bridge_candidates = adj.get(main_table, set())
+        no_neighbors: set[str] = set()
+
         # Always keep the original order
-        for t in list(selected_tables):
+        for t in selected_tables:
             add(t)
             if t == main_table:
                 continue
             # If already directly connected, nothing to do
-            if t in adj.get(main_table, set()):
+            if t in bridge_candidates:
                 continue
             # Try one-hop bridge with scoring
-            bridge_candidates = adj.get(main_table, set())
             best_x: str | None = None
-            best_score = float("-inf")
+            best_score = 0.0
             found_bridge = False
 
             def _score_bridge(x: str, dest: str) -> float:
@@ -288,40 +355,6 @@ class QuerySchemaResultBuilder:
                     score += 0.2
 
                 # Inspect FK columns for admin patterns vs business keys (generic, DB-agnostic)
-                admin_tokens = {
-                    "last",
-                    "edited",
-                    "edit",
-                    "lastedited",
-                    "lasteditedby",
-                    "created",
-                    "create",
-                    "createdby",
-                    "modified",
-                    "modify",
-                    "modifiedby",
-                    "update",
-                    "updated",
-                    "updatedby",
-                    "change",
-                    "changed",
-                }
-                identity_tokens = {
-                    "user",
-                    "users",
-                    "person",
-                    "people",
-                    "employee",
-                    "employees",
-                    "staff",
-                    "account",
-                    "accounts",
-                    "login",
-                    "logon",
-                    "owner",
-                    "ownerid",
-                }
-
                 def _edge_penalty(u: str, v: str) -> float:
                     fks = edge_fk.get(frozenset({u, v}), [])
                     pen = 0.0
@@ -331,23 +364,23 @@ class QuerySchemaResultBuilder:
                         left, right = fkdesc.split("->", 1)
                         lcol = left.split(".")[-1]
                         rcol = right.split(".")[-1]
-                        ltok = set(tokens_from_text(lcol))
-                        rtok = set(tokens_from_text(rcol))
-                        if ltok & admin_tokens or rtok & admin_tokens:
+                        ltok = set(tokens_iter(lcol))
+                        rtok = set(tokens_iter(rcol))
+                        if ltok & _BRIDGE_ADMIN_TOKENS or rtok & _BRIDGE_ADMIN_TOKENS:
                             pen -= 0.5
                         # Penalize common admin bridge patterns: admin column -> identity reference
-                        if (ltok & admin_tokens and (rtok & identity_tokens)) or (
-                            rtok & admin_tokens and (ltok & identity_tokens)
+                        if (ltok & _BRIDGE_ADMIN_TOKENS and (rtok & _BRIDGE_IDENTITY_TOKENS)) or (
+                            rtok & _BRIDGE_ADMIN_TOKENS and (ltok & _BRIDGE_IDENTITY_TOKENS)
                         ):
                             pen -= 0.4
                         # Small preference for clean ID joins
-                        has_left_id = "id" in ltok and not (ltok & admin_tokens)
-                        has_right_id = "id" in rtok and not (rtok & admin_tokens)
+                        has_left_id = "id" in ltok and not (ltok & _BRIDGE_ADMIN_TOKENS)
+                        has_right_id = "id" in rtok and not (rtok & _BRIDGE_ADMIN_TOKENS)
                         if has_left_id or has_right_id:
                             pen += 0.1
                     # Penalize if bridge table name looks like a generic identity table
-                    name_toks = set(tokens_from_text(x))
-                    if name_toks & identity_tokens:
+                    name_toks = set(tokens_iter(x))
+                    if name_toks & _BRIDGE_IDENTITY_TOKENS:
                         pen -= 0.2
                     return pen
 
@@ -356,9 +389,9 @@ class QuerySchemaResultBuilder:
                 return score
 
             for x in bridge_candidates:
-                if t in adj.get(x, set()) and x in explorer.card.tables:
+                if t in adj.get(x, no_neighbors) and x in explorer.card.tables:
                     s = _score_bridge(x, t)
-                    if s > best_score:
+                    if best_x is None or s > best_score:
                         best_score = s
                         best_x = x
 
@@ -380,14 +413,14 @@ class QuerySchemaResultBuilder:
         include_samples: bool,
         max_sample_values: int,
         max_columns_per_table: int,
-    ) -> tuple[list[TableSummary], dict[str, list[str]]]:
+    ) -> tuple[list[TableSummary], dict[str, tuple[str, ...]]]:
         """Build table summaries and key columns mapping."""
         if not explorer.card:
             msg = "Schema card not available"
             raise RuntimeError(msg)
 
         relevant_tables: list[TableSummary] = []
-        key_columns: dict[str, list[str]] = {}
+        key_columns: dict[str, tuple[str, ...]] = {}
 
         for table_key in selected_tables:
             table_profile = explorer.card.tables.get(table_key)
@@ -403,16 +436,17 @@ class QuerySchemaResultBuilder:
             common_filters = QuerySchemaResultBuilder._build_common_filters(table_profile)
             table_key_columns = QuerySchemaResultBuilder._extract_key_columns(table_profile)
 
-            table_summary = TableSummary(
+            # Built from the card with the exact field types: skip re-validation
+            table_summary = TableSummary.model_construct(
                 name=table_key,
                 business_purpose=table_profile.summary
                 or f"{table_profile.archetype or 'data'} table",
                 columns=columns,
-                primary_keys=table_profile.pk_cols,
-                common_filters=common_filters,
+                primary_keys=tuple(table_profile.pk_cols),
+                common_filters=tuple(common_filters),
             )
             relevant_tables.append(table_summary)
-            key_columns[table_key] = table_key_columns
+            key_columns[table_key] = tuple(table_key_columns)
 
         return relevant_tables, key_columns
 
@@ -456,8 +490,8 @@ class QuerySchemaResultBuilder:
                 is_primary_key=col.is_pk,
                 is_foreign_key=col.is_fk,
                 business_role=business_role,
-                sample_values=sample_values,
-                constraints=constraints,
+                sample_values=tuple(sample_values),
+                constraints=tuple(constraints),
             )
             columns.append(column_detail)
 
@@ -493,79 +527,82 @@ class QuerySchemaResultBuilder:
         main_table: str | None = None,
         query: str | None = None,
     ) -> list[JoinExample]:
-        """Build ranked JOIN examples, anchoring to main table and query tokens."""
+        """Build ranked JOIN examples, anchoring to main table and query tokens.
+
+        Edges are scored as raw tuples; `JoinExample` models are only materialized
+        for the top `limit` survivors.
+        """
         if not explorer.card:
             msg = "Schema card not available"
             raise RuntimeError(msg)
 
-        qtokens = set(tokens_from_text(query or ""))
-
-        scored: list[tuple[float, JoinExample]] = []
+        qtokens = set(tokens_iter(query or ""))
+        tables = explorer.card.tables
+        edge_columns = explorer.card.edge_columns
+
+        scored: list[
+            tuple[
+                float,
+                tuple[str, str, str],
+                tuple[str, str],
+                TableProfile | None,
+                TableProfile | None,
+            ]
+        ] = []
         for edge in explorer.card.edges:
-            if edge[0] in selected_tables and edge[1] in selected_tables:
-                je = QuerySchemaResultBuilder._create_join_example(edge, explorer)
-                if not je:
-                    continue
-                score = 0.0
-                # Anchor: edges touching the main table first
-                if main_table and (main_table in (je.from_table, je.to_table)):
-                    score += 1.0
-                # Prefer fact→dimension
-                a = explorer.card.tables.get(je.from_table)
-                b = explorer.card.tables.get(je.to_table)
-                if a and b and (a.archetype == "fact" and b.archetype == "dimension"):
-                    score += 0.2
-                # Query token overlap with either table key
-                ftoks = set(tokens_from_text(je.from_table))
-                ttoks = set(tokens_from_text(je.to_table))
-                if qtokens & (ftoks | ttoks):
-                    score += 0.2
-                # Downrank dim↔dim and self-joins unless anchored
-                if a and b and a.archetype == b.archetype == "dimension":
-                    score -= 0.2
-                if je.from_table == je.to_table and not (
-                    main_table and je.from_table == main_table
-                ):
-                    score -= 0.3
-                scored.append((score, je))
-
-        scored.sort(key=lambda x: -x[0])
-        return [je for _s, je in scored[:limit]]
+            from_table, to_table, fk_desc = edge
+            if from_table not in selected_tables or to_table not in selected_tables:
+                continue
+            cols = edge_columns.get(fk_desc)
+            if cols is None:
+                continue
+            score = 0.0
+            # Anchor: edges touching the main table first
+            if main_table and (main_table in (from_table, to_table)):
+                score += 1.0
+            # Prefer fact→dimension
+            a = tables.get(from_table)
+            b = tables.get(to_table)
+            if a and b and a.archetype == _FACT and b.archetype == _DIMENSION:
+                score += 0.2
+            # Query token overlap with either table key
+            ftoks = set(tokens_iter(from_table))
+            ttoks = set(tokens_iter(to_table))
+            if qtokens & (ftoks | ttoks):
+                score += 0.2
+            # Downrank dim↔dim and self-joins unless anchored
+            if a and b and a.archetype == b.archetype == _DIMENSION:
+                score -= 0.2
+            if from_table == to_table and not (main_table and from_table == main_table):
+                score -= 0.3
+            scored.append((score, edge, cols, a, b))
+
+        # nlargest is stable for ties, matching the previous sort-then-slice order
+        top = heapq.nlargest(limit, scored, key=lambda x: x[0])
+        return [
+            QuerySchemaResultBuilder._create_join_example(
+                edge, explorer, columns=cols, from_profile=a, to_profile=b
+            )
+            for _s, edge, cols, a, b in top
+        ]
 
     @staticmethod
     def _create_join_example(
-        edge: tuple[str, str, str], explorer: SchemaExplorer
-    ) -> JoinExample | None:
-        """Create a JOIN example from an edge."""
-        if not explorer.card:
-            msg = "Schema card not available"
-            raise RuntimeError(msg)
-
-        # Parse FK description to get column names
-        fk_desc = edge[2]  # Format: "table1.col1->table2.col2"
-        if "->" not in fk_desc:
-            return None
-
-        parts = fk_desc.split("->")
-        if len(parts) != FK_DESCRIPTION_PARTS_COUNT:
-            return None
-
-        from_parts = parts[0].split(".")
-        to_parts = parts[1].split(".")
-        if len(from_parts) < FK_TABLE_PARTS_MIN_COUNT or len(to_parts) < FK_TABLE_PARTS_MIN_COUNT:
-            return None
-
-        from_col = from_parts[-1]
-        to_col = to_parts[-1]
+        edge: tuple[str, str, str],
+        explorer: SchemaExplorer,
+        *,
+        columns: tuple[str, str],
+        from_profile: TableProfile | None,
+        to_profile: TableProfile | None,
+    ) -> JoinExample:
+        """Create a JOIN example from an edge with pre-parsed FK columns."""
+        from_col, to_col = columns
 
         # Create SQL JOIN syntax via SQLAlchemy for dialect safety
         sql_syntax = _compile_join_clause(edge[0], edge[1], from_col, to_col, explorer)
 
         # Determine relationship type and purpose
-        from_profile = explorer.card.tables.get(edge[0])
-        to_profile = explorer.card.tables.get(edge[1])
-
-        relationship_type = "1:many"  # Default assumption
+        relationship_type = _ONE_TO_MANY  # Default assumption
         from_archetype = from_profile.archetype if from_profile else "records"
         to_archetype = to_profile.archetype if to_profile else "related data"
         business_purpose = f"{from_archetype} → {to_archetype}"
@@ -609,12 +646,12 @@ class QuerySchemaResultBuilder:
                 score += 2.0
             if (tp.n_dates or 0) > 0:
                 score += 1.0
-            if (tp.archetype or "").lower() == "fact":
+            if tp.archetype == _FACT:
                 score += 1.5
             score += 0.3 * (tp.centrality or 0.0)
             # New: lexical overlap of query tokens with table key and columns
-            qtokens = set(tokens_from_text(query))
-            name_toks = set(tokens_from_text(tk))
+            qtokens = set(tokens_iter(query))
+            name_toks = set(tokens_iter(tk))
             overlap = len(qtokens & name_toks)
             if overlap:
                 score += 0.4 + 0.1 * min(2, overlap - 1)
@@ -640,17 +677,17 @@ class QuerySchemaResultBuilder:
                 return 0.0
             tp = explorer.card.tables[tk]
             score = 0.0
-            if (tp.archetype or "").lower() == "dimension":
+            if tp.archetype == _DIMENSION:
                 score += 1.0
             # Prefer dimensions rich in categorical attributes
-            cat_count = sum(1 for c in tp.columns if c.role == "category")
-            score += 0.15 * min(8, cat_count)
+            score += 0.15 * min(8, tp.n_categories)
             # Small bonus for having dates (slowly changing or dated dims)
             if tp.n_dates > 0:
                 score += 0.3
             return score
 
-        dims_sorted = sorted(set(dim_candidates), key=dim_score, reverse=True)[:3]
+        # dict.fromkeys dedupes while keeping edge order, so ties sort deterministically
+        dims_sorted = sorted(dict.fromkeys(dim_candidates), key=dim_score, reverse=True)[:3]
 
         dims_str = ", ".join(dims_sorted) if dims_sorted else "key dimensions"
         return (
@@ -690,7 +727,7 @@ class QuerySchemaResultBuilder:
 
         steps: list[JoinPlanStep] = []
         edges = explorer.card.edges
-        qtokens = set(tokens_from_text(query or ""))
+        qtokens = set(tokens_iter(query or ""))
 
         for j in join_examples[:limit]:
             # Collect raw ON pairs with metadata for ordering/filtering
@@ -738,8 +775,8 @@ class QuerySchemaResultBuilder:
                 def _pair_score(p: tuple[str, str]) -> int:
                     l_name = p[0].split(".")[-1]
                     r_name = p[1].split(".")[-1]
-                    return int(bool(set(tokens_from_text(l_name)) & qtokens)) + int(
-                        bool(set(tokens_from_text(r_name)) & qtokens)
+                    return int(bool(set(tokens_iter(l_name)) & qtokens)) + int(
+                        bool(set(tokens_iter(r_name)) & qtokens)
                     )
 
                 scored = [(p, _pair_score(p)) for p in raw_pairs]
@@ -794,12 +831,12 @@ class QuerySchemaResultBuilder:
         if not explorer.card:
             msg = "Schema card not available"
             raise RuntimeError(msg)
+        tables = explorer.card.tables
         out: list[str] = []
         # Prefer dimension labels first, then dates from main table
         # 1) Dimension category columns
         for tk in dims_sorted:
-            tp = explorer.card.tables.get(tk) if tk else None
-            if not tp:
+            if not tk or (tp := tables.get(tk)) is None:
                 continue
             for col in tp.columns:
                 if col.role == "category":
@@ -807,15 +844,10 @@ class QuerySchemaResultBuilder:
                     if len(out) >= max_items:
                         return out
         # 2) Dates from main table
-        for tk in [main_table]:
-            if not tk:
-                continue
-            tp = explorer.card.tables.get(tk) if tk else None
-            if not tp:
-                continue
+        if main_table and (tp := tables.get(main_table)) is not None:
             for col in tp.columns:
                 if col.role == "date":
-                    out.append(f"{tk}.{col.name}")
+                    out.append(f"{main_table}.{col.name}")
                     if len(out) >= max_items:
                         return out
         return out
@@ -970,23 +1002,29 @@ class DatabaseSummaryBuilder:
 
         # Build common patterns
         common_patterns: list[str] = []
-        fact_tables = [k for k, v in explorer.card.tables.items() if v.archetype == "fact"]
-        dim_tables = [k for k, v in explorer.card.tables.items() if v.archetype == "dimension"]
+        has_fact = has_dim = has_dates = has_metrics = False
+        for tp in explorer.card.tables.values():
+            has_fact = has_fact or tp.archetype == _FACT
+            has_dim = has_dim or tp.archetype == _DIMENSION
+            has_dates = has_dates or tp.n_dates > 0
+            has_metrics = has_metrics or tp.n_metrics > 0
+            if has_fact and has_dim and has_dates and has_metrics:
+                break
 
-        if fact_tables and dim_tables:
+        if has_fact and has_dim:
             common_patterns.append("Star schema: fact/dimension tables")
         if len(explorer.card.edges) > len(explorer.card.tables):
             common_patterns.append("Normalized: many relationships")
-        if any(t.n_dates > 0 for t in explorer.card.tables.values()):
+        if has_dates:
             common_patterns.append("Time-series: date columns")
-        if any(t.n_metrics > 0 for t in explorer.card.tables.values()):
+        if has_metrics:
             common_patterns.append("Analytics: numeric metrics")
 
         return DatabaseSummary(
             database_name=explorer.database_name,
             database_type=explorer.card.db_dialect,
             total_tables=len(explorer.card.tables),
-            schemas=list(explorer.card.schemas),
+            schemas=tuple(explorer.card.schemas),
             key_subject_areas=key_subject_areas,
             subject_areas=subject_areas,
             most_important_tables=important_tables,
@@ -1025,13 +1063,70 @@ class TableInfoBuilder:
             msg = "Schema card not available"
             raise RuntimeError(msg)
 
+        # The card is immutable once built and a rebuild replaces it, so responses are
+        # memoized on the card itself (bounded LRU) and go away with it
+        card = explorer.card
+        role_filter = tuple(column_role_filter) if column_role_filter else None
+        key = (table_key, include_samples, role_filter, max_sample_values, relationship_limit)
+        with card.table_info_lock:
+            info = card.table_info_cache.get(key)
+            if info is not None:
+                card.table_info_cache.move_to_end(key)
+        if info is None:
+            info = TableInfoBuilder._build_uncached(
+                table_key,
+                explorer,
+                include_samples=include_samples,
+                column_role_filter=column_role_filter,
+                max_sample_values=max_sample_values,
+                relationship_limit=relationship_limit,
+            )
+            with card.table_info_lock:
+                card.table_info_cache[key] = info
+                if len(card.table_info_cache) > TABLE_INFO_CACHE_SIZE:
+                    card.table_info_cache.popitem(last=False)
+        # Nested models are frozen and held in tuples, so a shallow copy is enough to
+        # keep callers from changing the memoized instance
+        return info.model_copy()
+
+    @staticmethod
+    def warm(explorer: SchemaExplorer) -> None:
+        """Precompile relationship JOINs and typical queries for every table.
+
+        Fills the module-level compile caches so that the first ``build`` for a table
+        does no SQLAlchemy compilation. Intended to run off the request path, e.g.
+        right after the schema card is built.
+        """
+        if not explorer.card:
+            msg = "Schema card not available"
+            raise RuntimeError(msg)
+
+        for table_key, table_profile in explorer.card.tables.items():
+            TableInfoBuilder._build_table_relationships(table_key, explorer)
+            TableInfoBuilder._build_typical_queries(table_key, table_profile, explorer)
+
+    @staticmethod
+    def _build_uncached(
+        table_key: str,
+        explorer: SchemaExplorer,
+        *,
+        include_samples: bool,
+        column_role_filter: list[str] | None,
+        max_sample_values: int,
+        relationship_limit: int | None,
+    ) -> TableInfo:
+        """Build TableInfo from the explorer's current schema card."""
+        if not explorer.card:
+            msg = "Schema card not available"
+            raise RuntimeError(msg)
+
         table_profile = explorer.card.tables.get(table_key)
         if not table_profile:
             msg = f"Table '{table_key}' not found"
             raise KeyError(msg)
 
         # Build all components using helper methods
-        columns = TableInfoBuilder._build_table_columns(
+        columns, fk_index_notes = TableInfoBuilder._build_table_columns(
             table_profile,
             include_samples=include_samples,
             role_filter=column_role_filter,
@@ -1046,21 +1141,21 @@ class TableInfoBuilder:
         typical_queries = TableInfoBuilder._build_typical_queries(
             table_key, table_profile, explorer
         )
-        indexing_notes = TableInfoBuilder._build_indexing_notes(table_profile)
+        indexing_notes = TableInfoBuilder._pk_index_notes(table_profile) + fk_index_notes
 
         return TableInfo(
             table_name=table_key,
             business_description=table_profile.summary
             or f"{table_profile.archetype or 'data'} table",
-            columns=columns,
-            relationships=relationships,
+            columns=tuple(columns),
+            relationships=tuple(relationships),
             typical_queries=typical_queries,
-            indexing_notes=indexing_notes,
-            pk_columns=list(table_profile.pk_cols),
-            foreign_keys=[
+            indexing_notes=tuple(indexing_notes),
+            pk_columns=tuple(table_profile.pk_cols),
+            foreign_keys=tuple(
                 ForeignKeyRef(column=c, ref_table=rtab, ref_column=rcol)
                 for c, rtab, rcol in table_profile.fks
-            ],
+            ),
             approx_rowcount=table_profile.approx_rowcount,
         )
 
@@ -1071,23 +1166,31 @@ class TableInfoBuilder:
         include_samples: bool,
         role_filter: list[str] | None,
         max_sample_values: int,
-    ) -> list[ColumnDetail]:
-        """Build column details for table information."""
+    ) -> tuple[list[ColumnDetail], list[str]]:
+        """Build column details and FK index notes in one pass over the columns.
+
+        FK notes cover every FK column, including those excluded by ``role_filter``.
+        """
         columns: list[ColumnDetail] = []
+        fk_index_notes: list[str] = []
+        allowed_roles = frozenset(role_filter) if role_filter else None
         for col in table_profile.columns:
-            if role_filter and (col.role or "data") not in set(role_filter):
+            if col.is_fk:
+                fk_index_notes.append(f"FK index: {col.name}")
+            if allowed_roles is not None and (col.role or "data") not in allowed_roles:
                 continue
-            # Get sample values if requested
-            sample_values = []
-            if include_samples and col.distinct_values:
-                sample_values = [str(v) for v in col.distinct_values[:max_sample_values]]
+            # Stringify the leading distinct values once for samples and constraints
+            value_strs = (
+                tuple(str(v) for v in col.distinct_values[:max_sample_values])
+                if col.distinct_values
+                else ()
+            )
+            sample_values = value_strs if include_samples else ()
 
             # Build constraints
             constraints: list[str] = []
             if col.distinct_values:
-                constraints.append(
-                    f"Values: {', '.join(str(v) for v in col.distinct_values[:max_sample_values])}"
-                )
+                constraints.append(f"Values: {', '.join(value_strs)}")
             if col.value_range:
                 constraints.append(f"Range: {col.value_range[0]}-{col.value_range[1]}")
 
@@ -1106,10 +1209,10 @@ class TableInfoBuilder:
                 is_foreign_key=col.is_fk,
                 business_role=business_role,
                 sample_values=sample_values,
-                constraints=constraints,
+                constraints=tuple(constraints),
             )
             columns.append(column_detail)
-        return columns
+        return columns, fk_index_notes
 
     @staticmethod
     def _build_table_relationships(table_key: str, explorer: SchemaExplorer) -> list[JoinExample]:
@@ -1119,13 +1222,10 @@ class TableInfoBuilder:
             raise RuntimeError(msg)
 
         relationships: list[JoinExample] = []
-        for edge in explorer.card.edges:
-            if edge[0] == table_key or edge[1] == table_key:
-                relationship = TableInfoBuilder._create_table_relationship(
-                    table_key, edge, explorer
-                )
-                if relationship:
-                    relationships.append(relationship)
+        for edge in explorer.card.edges_by_table.get(table_key, ()):
+            relationship = TableInfoBuilder._create_table_relationship(table_key, edge, explorer)
+            if relationship:
+                relationships.append(relationship)
         return relationships
 
     @staticmethod
@@ -1142,33 +1242,21 @@ class TableInfoBuilder:
         to_table = edge[1]
 
         # Parse FK description
-        fk_desc = edge[2]
-        if "->" not in fk_desc:
-            return None
-
-        parts = fk_desc.split("->")
-        if len(parts) != FK_DESCRIPTION_PARTS_COUNT:
+        cols = explorer.card.edge_columns.get(edge[2])
+        if cols is None:
             return None
-
-        from_parts = parts[0].split(".")
-        to_parts = parts[1].split(".")
-        if len(from_parts) < FK_TABLE_PARTS_MIN_COUNT or len(to_parts) < FK_TABLE_PARTS_MIN_COUNT:
-            return None
-
-        from_col = from_parts[-1]
-        to_col = to_parts[-1]
+        from_col, to_col = cols
 
         # Compile dialect-specific JOIN clause using SQLAlchemy
         sql_syntax = _compile_join_clause(from_table, to_table, from_col, to_col, explorer)
 
         # Get business purpose
         other_table = to_table if from_table == table_key else from_table
-        other_profile = explorer.card.tables.get(other_table)
-        other_archetype = other_profile.archetype if other_profile else "related"
+        other_archetype = explorer.card.archetype_by_table.get(other_table, "related")
 
         # Infer cardinality: if the current table is the FK side (from_table), it's many:1.
         # If current table is the referenced table (to_table), it's 1:many.
-        relationship_type = "many:1" if table_key == from_table else "1:many"
+        relationship_type = _MANY_TO_ONE if table_key == from_table else _ONE_TO_MANY
         business_purpose = f"{relationship_type} → {other_archetype} ({other_table})"
 
         return JoinExample(
@@ -1182,54 +1270,24 @@ class TableInfoBuilder:
     @staticmethod
     def _build_typical_queries(
         table_key: str, table_profile: TableProfile, explorer: SchemaExplorer
-    ) -> list[str]:
-        """Build typical query examples for a table using SQLAlchemy compilation."""
-        typical_queries: list[str] = []
-
-        # Helpers to construct lightweight selectable for table
+    ) -> tuple[str, ...]:
+        """Build typical query examples for a table (shared, memoized tuple)."""
         schema, name = table_key.split(".", 1)
-
-        def table_with_cols(cols: list[str]) -> sa.TableClause:
-            columns: list[Any] = [sa.column(c) for c in cols]
-            return sa.table(name, *columns, schema=schema)  # pyright: ignore[reportUnknownArgumentType]
-
-        # Metric aggregation example
-        metric_cols = [c.name for c in table_profile.columns if c.role == "metric"]
-        if metric_cols:
-            mcol = metric_cols[0]
-            t = table_with_cols([mcol])
-            stmt = sa.select(sa.func.sum(t.c[mcol])).select_from(t)
-            typical_queries.append(str(stmt.compile(dialect=explorer.dialect)))
-
-        # Date filter example
-        date_cols = [c.name for c in table_profile.columns if c.role == "date"]
-        if date_cols:
-            dcol = date_cols[0]
-            t = table_with_cols([dcol])
-            lit_all = cast(Any, sa.literal_column("*"))
-            stmt = sa.select(lit_all).select_from(t).where(t.c[dcol] >= sa.bindparam("date_from"))  # pyright: ignore[reportUnknownArgumentType]
-            typical_queries.append(str(stmt.compile(dialect=explorer.dialect)))
-
-        # Lookup by PK example
-        if table_profile.pk_cols:
-            pk_col = table_profile.pk_cols[0]
-            t = table_with_cols([pk_col])
-            lit_all_pk = cast(Any, sa.literal_column("*"))
-            stmt = sa.select(lit_all_pk).select_from(t).where(t.c[pk_col] == sa.bindparam("value"))  # pyright: ignore[reportUnknownArgumentType]
-            typical_queries.append(str(stmt.compile(dialect=explorer.dialect)))
-
-        return typical_queries
+        return _compile_typical_queries(
+            explorer.dialect,
+            schema,
+            name,
+            table_profile.metric_col_names[0] if table_profile.metric_col_names else None,
+            table_profile.date_col_names[0] if table_profile.date_col_names else None,
+            table_profile.pk_cols[0] if table_profile.pk_cols else None,
+        )
 
     @staticmethod
-    def _build_indexing_notes(table_profile: TableProfile) -> list[str]:
-        """Build indexing recommendation notes for a table."""
-        indexing_notes: list[str] = []
+    def _pk_index_notes(table_profile: TableProfile) -> list[str]:
+        """Build the primary-key index note, if the table has a primary key."""
         if table_profile.pk_cols:
-            indexing_notes.append(f"PK index: {', '.join(table_profile.pk_cols)}")
-        indexing_notes.extend(
-            f"FK index: {col.name}" for col in table_profile.columns if col.is_fk
-        )
-        return indexing_notes
+            return [f"PK index: {', '.join(table_profile.pk_cols)}"]
+        return []
 
 
 def _compile_join_clause(
@@ -1241,8 +1299,25 @@ def _compile_join_clause(
 ) -> str:
     """Compile a dialect-specific JOIN clause using SQLAlchemy.
 
+    Reduces the explorer to its dialect so the compiled clause can be served
+    from `_compile_join_sql`'s cache.
+    """
+    return _compile_join_sql(explorer.dialect, from_table_key, to_table_key, from_col, to_col)
+
+
+@lru_cache(maxsize=4096)
+def _compile_join_sql(
+    dialect: sa.engine.Dialect,
+    from_table_key: str,
+    to_table_key: str,
+    from_col: str,
+    to_col: str,
+) -> str:
+    """Cached JOIN clause compilation keyed by dialect and edge columns.
+
     Builds lightweight table clauses with only the columns required for the ON condition,
-    compiles the Join object against the active dialect, and returns the rendered SQL.
+    compiles the Join object against the dialect, and returns the rendered SQL. The output
+    depends only on the arguments, so entries never go stale across schema reloads.
     """
     from_schema, from_name = from_table_key.split(".", 1)
     to_schema, to_name = to_table_key.split(".", 1)
@@ -1251,9 +1326,62 @@ def _compile_join_clause(
     t_to = sa.table(to_name, sa.column(to_col), schema=to_schema)
 
     join_obj = t_from.join(t_to, t_from.c[from_col] == t_to.c[to_col])
-    return str(join_obj.compile(dialect=explorer.dialect))
+    return str(join_obj.compile(dialect=dialect))
+
+
+@lru_cache(maxsize=1024)
+def _compile_typical_queries(
+    dialect: sa.engine.Dialect,
+    schema: str,
+    name: str,
+    metric_col: str | None,
+    date_col: str | None,
+    pk_col: str | None,
+) -> tuple[str, ...]:
+    """Compile the metric/date/PK example queries for a table.
+
+    Identifier quoting depends on the names themselves, so results are memoized per
+    table and column rather than rendered from a shared dialect-level template. Output
+    matches what SQLAlchemy compiles for the equivalent ``select()`` statements.
+    """
+    typical_queries: list[str] = []
+
+    # Metric aggregation example
+    if metric_col:
+        t = sa.table(name, sa.column(metric_col), schema=schema)
+        stmt = sa.select(sa.func.sum(t.c[metric_col])).select_from(t)
+        typical_queries.append(str(stmt.compile(dialect=dialect)))
+
+    # The two "SELECT * ... WHERE col <op> :bind" shapes only vary by identifier quoting
+    # and bind style, so render them with the dialect's preparer instead of compiling.
+    preparer = dialect.identifier_preparer
+    qualified = preparer.format_table(sa.table(name, schema=schema))
+
+    # Date filter example
+    if date_col:
+        typical_queries.append(
+            f"SELECT * \nFROM {qualified} \n"
+            f"WHERE {qualified}.{preparer.quote(date_col)} >= "
+            f"{_render_bindparam(dialect, 'date_from')}"
+        )
+
+    # Lookup by PK example
+    if pk_col:
+        typical_queries.append(
+            f"SELECT * \nFROM {qualified} \n"
+            f"WHERE {qualified}.{preparer.quote(pk_col)} = {_render_bindparam(dialect, 'value')}"
+        )
+
+    return tuple(typical_queries)
+
+
+@lru_cache(maxsize=64)
+def _render_bindparam(dialect: sa.engine.Dialect, name: str) -> str:
+    """Render a named bind parameter in the dialect's paramstyle (e.g. ?, %(name)s)."""
+    return str(sa.bindparam(name).compile(dialect=dialect))
 
 
+@lru_cache(maxsize=256)
 def _sanitize_sql_type(type_str: str) -> str:
     """Normalize SQL type strings for readability.
 
@@ -246,7 +246,7 @@ class RetrievalEngine:
             return []
 
         query_vector = self.embedder.encode([query])[0]
-        hits = self.table_index.search(query_vector, k=max(k * 3, 50))
+        hits = self.table_index.search_pairs(query_vector, k=max(k * 3, 50))
         return self._filter_archive_priority(hits, k)
 
     def retrieve_column_embeddings(
@@ -269,13 +269,15 @@ class RetrievalEngine:
             return []
 
         query_vector = self.embedder.encode([query])[0]
-        column_hits = self.column_index.search(query_vector, k=k_columns)
+        column_labels, column_scores = self.column_index.search(query_vector, k=k_columns)
 
-        # Aggregate column scores by table
+        # Aggregate column scores by table (negative similarities count as zero)
         table_scores: dict[str, float] = defaultdict(float)
-        for column_label, score in column_hits:
+        for column_label, score in zip(
+            column_labels.tolist(), np.maximum(column_scores, 0.0).tolist(), strict=True
+        ):
             table_key = column_label.split("::")[0]
-            table_scores[table_key] += max(0.0, score)
+            table_scores[table_key] += score
 
         # Sort by aggregated score and apply archive filtering
         items = sorted(table_scores.items(), key=lambda x: -x[1])[: max(k_tables * 3, 50)]
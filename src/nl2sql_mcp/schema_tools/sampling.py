@@ -11,17 +11,34 @@ Classes:
 
 from __future__ import annotations
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from fastmcp.utilities.logging import get_logger
 import pandas as pd
 import sqlalchemy as sa
 from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 from sqlalchemy.sql.elements import ColumnElement
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 # Logger
 _logger = get_logger("schema_explorer.sampling")
 
+# TABLESAMPLE tuning: only tables estimated at or above this many rows are sampled
+# by page, reading enough pages for TABLESAMPLE_OVERSAMPLE x per_table_rows rows.
+TABLESAMPLE_MIN_ROWS = 1_000_000
+TABLESAMPLE_OVERSAMPLE = 10
+
+# Planner row estimates for PostgreSQL tables, views excluded (reltuples < 0: never analyzed)
+_PG_ROW_ESTIMATES_SQL = sa.text(
+    "SELECT n.nspname, c.relname, c.reltuples FROM pg_catalog.pg_class c "
+    "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+    "WHERE c.relkind IN ('r', 'm', 'p') AND c.reltuples >= :min_rows"
+)
+
 
 class Sampler:
     """Database table sampler with dialect-specific optimizations.
@@ -59,6 +76,7 @@ class Sampler:
         cols: list[str],
         *,
         conn: Connection | None = None,
+        approx_rows: int | None = None,
     ) -> pd.DataFrame:
         """Sample data from a database table.
 
@@ -70,6 +88,9 @@ class Sampler:
             schema: Database schema name containing the table
             table: Table name to sample from
             cols: List of column names to include in the sample
+            conn: Optional open connection to sample on
+            approx_rows: Estimated table row count; large PostgreSQL tables are
+                read with ``TABLESAMPLE SYSTEM`` instead of from their first pages
 
         Returns:
             DataFrame containing the sampled data with the specified columns
@@ -82,11 +103,7 @@ class Sampler:
             _logger.debug("No columns specified for %s.%s", schema, table)
             return pd.DataFrame()
 
-        # Build base query using SQLAlchemy Core with explicit column selection.
-        # Use lightweight table/column clauses so we don't require full reflection.
-        table_obj = sa.table(table, schema=schema if schema else None)
-        select_columns: list[ColumnElement[Any]] = [sa.column(col) for col in cols]
-        sql_query = sa.select(*select_columns).select_from(table_obj).limit(self.per_table_rows)
+        sql_query = self._build_query(schema, table, cols, approx_rows)
 
         _logger.debug("Sampling %s.%s with query: %s", schema, table, sql_query)
 
@@ -96,10 +113,10 @@ class Sampler:
                 with self.engine.connect() as _conn:
                     streaming_conn = _conn.execution_options(stream_results=True)
                     self._apply_statement_timeout(streaming_conn)
-                    return pd.read_sql(sql_query, streaming_conn)
+                    return self._fetch_frame(streaming_conn, sql_query)
             else:
                 self._apply_statement_timeout(conn)
-                return pd.read_sql(sql_query, conn)
+                return self._fetch_frame(conn, sql_query)
 
         except Exception as e:  # noqa: BLE001 - Return empty DataFrame on any error
             _logger.debug("Sampling failed for %s.%s: %s", schema, table, e)
@@ -107,7 +124,111 @@ class Sampler:
             # Return empty DataFrame with correct column structure on failure
             return pd.DataFrame(columns=cols)  # type: ignore[call-overload]
 
+    def iter_sample_tables(
+        self, requests: list[tuple[str, str, list[str]]], *, max_workers: int
+    ) -> Iterator[pd.DataFrame]:
+        """Sample several tables, concurrently when the engine's pool allows it.
+
+        Each sample is an independent, IO-bound query, so up to ``max_workers``
+        tables are sampled at once, each on its own pooled connection. Engines
+        whose pool pins one connection per thread or process (e.g. in-memory
+        SQLite) are sampled sequentially over a single streaming connection.
+        Samples are yielded in request order as soon as they (and every earlier
+        one) are ready, so callers can process them alongside the remaining IO.
+
+        Args:
+            requests: ``(schema, table, cols)`` triples, as for ``sample_table``
+            max_workers: Upper bound on concurrently sampled tables
+
+        Yields:
+            One DataFrame per request, in request order
+        """
+        estimates = self._row_estimates()
+        workers = min(max_workers, len(requests))
+        if workers <= 1 or isinstance(self.engine.pool, SingletonThreadPool | StaticPool):
+            with self.engine.connect() as _conn:
+                streaming_conn = _conn.execution_options(stream_results=True)
+                for schema, table, cols in requests:
+                    yield self.sample_table(
+                        schema,
+                        table,
+                        cols,
+                        conn=streaming_conn,
+                        approx_rows=estimates.get((schema, table)),
+                    )
+            return
+
+        def _sample(req: tuple[str, str, list[str]]) -> pd.DataFrame:
+            schema, table, cols = req
+            return self.sample_table(
+                schema, table, cols, approx_rows=estimates.get((schema, table))
+            )
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sampler") as pool:
+            yield from pool.map(_sample, requests)
+
     # ---- internals ---------------------------------------------------------
+    def _build_query(
+        self, schema: str, table: str, cols: list[str], approx_rows: int | None
+    ) -> sa.Select[Any]:
+        """Build the sampling SELECT, page-sampling large PostgreSQL tables.
+
+        A plain ``LIMIT`` reads the physical start of the table, which is both
+        biased and, behind filters or views, potentially a long scan;
+        ``TABLESAMPLE SYSTEM`` reads a random subset of pages instead. Smaller or
+        unestimated tables keep the plain ``LIMIT`` so they are never under-sampled.
+        """
+        # Use lightweight table/column clauses so we don't require full reflection.
+        table_obj = sa.table(table, schema=schema if schema else None)
+        source: sa.FromClause = table_obj
+        if (
+            approx_rows is not None
+            and approx_rows >= TABLESAMPLE_MIN_ROWS
+            and self.engine.dialect.name == "postgresql"
+        ):
+            percent = min(
+                100.0, 100.0 * TABLESAMPLE_OVERSAMPLE * self.per_table_rows / approx_rows
+            )
+            source = sa.tablesample(
+                table_obj, sa.func.system(sa.literal_column(f"{percent:.6f}")), name="sampled"
+            )
+        select_columns: list[ColumnElement[Any]] = [sa.column(col) for col in cols]
+        return sa.select(*select_columns).select_from(source).limit(self.per_table_rows)
+
+    def _row_estimates(self) -> dict[tuple[str, str], int]:
+        """Return planner row estimates of large tables, keyed by (schema, table).
+
+        Only PostgreSQL is consulted (one catalog query); other dialects, or any
+        failure, yield no estimates and therefore plain LIMIT sampling.
+        """
+        if self.engine.dialect.name != "postgresql":
+            return {}
+        try:
+            with self.engine.connect() as conn:
+                rows = conn.execute(_PG_ROW_ESTIMATES_SQL, {"min_rows": TABLESAMPLE_MIN_ROWS})
+                return {(str(nsp), str(rel)): int(est) for nsp, rel, est in rows}
+        except Exception as e:  # noqa: BLE001 - best-effort; fall back to LIMIT sampling
+            _logger.debug("Could not read row estimates: %s", e)
+            return {}
+
+    def _fetch_frame(self, conn: Connection, sql_query: sa.Select[Any]) -> pd.DataFrame:
+        """Execute the sample query and build a DataFrame from its plain rows.
+
+        Rows are fetched through the result rather than the raw DBAPI cursor, since
+        streamed results prefetch their first row into SQLAlchemy's buffer; they are
+        then handed to ``DataFrame.from_records``, skipping ``pd.read_sql``'s
+        generic wrapping.
+        """
+        # Bound driver-side buffering at per_table_rows even if a backend ignores
+        # the LIMIT: stream in one batch of that size and fetch it in one trip.
+        batch = {"yield_per": self.per_table_rows, "max_row_buffer": self.per_table_rows}
+        with conn.execute(sql_query, execution_options=batch) as result:
+            result.cursor.arraysize = self.per_table_rows
+            labels = list(result.keys())
+            rows = result.fetchmany(self.per_table_rows)
+        records = [tuple(row) for row in rows]
+        return pd.DataFrame.from_records(records, columns=labels, coerce_float=True)
+
     def _apply_statement_timeout(self, conn: Connection) -> None:
         """Apply a per-query timeout for supported dialects.
 
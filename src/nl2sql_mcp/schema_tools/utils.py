@@ -7,26 +7,73 @@ tokenization, fingerprinting, and database dialect-specific configurations.
 Functions:
 - normalize_identifier(): Convert database identifiers to normalized tokens
 - tokens_from_text(): Extract normalized tokens from text
+- tokens_iter(): Iterate normalized tokens without copying them into a list
 - fingerprint_reflection(): Generate deterministic hash of reflection data
 - default_excluded_schemas(): Get system schemas to exclude by dialect
 - is_archive_label(): Detect archive/historical data indicators
+- parse_fk_columns(): Extract column names from an FK edge description
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 import hashlib
-import json
 import re
+import sys
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastmcp.utilities.logging import get_logger
+from pydantic_core import to_json
 
 from .constants import Constants
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 # Logger setup
 _logger = get_logger("schema_explorer")
 
+# FK edge descriptions look like "schema.t1.c1->schema.t2.c2"
+FK_DESCRIPTION_PARTS_COUNT = 2
+FK_TABLE_PARTS_MIN_COUNT = 2
+
+# Identifier normalization patterns, compiled once for the per-column hot path.
+# A CamelCase boundary is a lowercase letter or digit followed by an uppercase
+# letter, so acronyms such as "ID" or "XMLHttp" stay whole.
+_CAMEL_BOUNDARY = re.compile(r"(?<=[^\W_A-Z])(?=[A-Z])")
+# Separator runs and CamelCase boundaries in one pass, each replaced by one space
+_IDENTIFIER_BREAKS = re.compile(r"[\s_\-]+|(?<=[^\W_A-Z])(?=[A-Z])")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Byte table mapping everything outside [a-z0-9] to a space, for ASCII tokenization
+_TOKEN_BYTES = frozenset(b"abcdefghijklmnopqrstuvwxyz0123456789")
+_TOKEN_TRANS = bytes(b if b in _TOKEN_BYTES else 0x20 for b in range(256))
+
+# Reflection payloads are opened down to the per-table level (payload -> schemas ->
+# schema -> tables) and sorted there; each table dict is built with a fixed key order
+# by ReflectionAdapter, so it is serialized as-is by pydantic-core's Rust encoder.
+_FINGERPRINT_SPLIT_DEPTH = 4
+
+# System schemas per dialect; keys double as substring needles, checked in order
+_POSTGRES_SYSTEM_SCHEMAS = ("information_schema", "pg_catalog", "pg_toast")
+_MSSQL_SYSTEM_SCHEMAS = ("information_schema", "sys")
+_EXCLUDED_SCHEMAS: dict[str, tuple[str, ...]] = {
+    "postgresql": _POSTGRES_SYSTEM_SCHEMAS,
+    "postgres": _POSTGRES_SYSTEM_SCHEMAS,
+    "mssql": _MSSQL_SYSTEM_SCHEMAS,
+    "sqlserver": _MSSQL_SYSTEM_SCHEMAS,
+    "mysql": ("information_schema", "mysql", "performance_schema", "sys"),
+    "oracle": ("sys", "system", "xdb", "mdsys", "ctxsys"),
+    "snowflake": ("information_schema",),
+}
+# Fallback for unknown dialects
+_DEFAULT_EXCLUDED_SCHEMAS = ("information_schema", "pg_catalog", "sys")
+
+# One pattern for every archive token plus an optional numeric suffix
+_ARCHIVE_TOKEN_RE = re.compile(
+    "(?:{})[0-9]*".format("|".join(map(re.escape, sorted(Constants.ARCHIVE_TOKENS))))
+)
+
 
 def now() -> float:
     """Return high-resolution timestamp for performance measurements.
@@ -37,6 +84,7 @@ def now() -> float:
     return time.perf_counter()
 
 
+@lru_cache(maxsize=4096)
 def normalize_identifier(name: str) -> str:
     """Normalize database identifiers to lowercase space-separated tokens.
 
@@ -55,26 +103,18 @@ def normalize_identifier(name: str) -> str:
         >>> normalize_identifier("CustomerOrders")
         'customer orders'
         >>> normalize_identifier("XMLHttpRequest")
-        'xmlhttprequest'
+        'xmlhttp request'
     """
     if not name:
         return ""
-
-    # Replace underscores and dashes with spaces
-    normalized = re.sub(r"[_\-]+", " ", name)
-
-    # Insert spaces before capital letters (for CamelCase)
-    normalized = re.sub(r"(?<!^)(?=[A-Z])", " ", normalized)
-
-    # Collapse multiple spaces and convert to lowercase
-    return re.sub(r"\s+", " ", normalized).strip().lower()
+    return sys.intern(_IDENTIFIER_BREAKS.sub(" ", name).strip().lower())
 
 
 def tokens_from_text(text: str) -> list[str]:
     """Extract normalized tokens from text.
 
-    Converts text to normalized identifier format and extracts
-    alphanumeric tokens, filtering out empty strings and non-meaningful tokens.
+    Splits CamelCase boundaries and extracts lowercase alphanumeric tokens,
+    matching the tokens of normalize_identifier() output.
 
     Args:
         text: Input text to tokenize
@@ -82,8 +122,44 @@ def tokens_from_text(text: str) -> list[str]:
     Returns:
         List of lowercase alphanumeric tokens
     """
-    normalized_text = normalize_identifier(text or "")
-    return [token for token in re.split(r"[^a-z0-9]+", normalized_text) if token]
+    if not text:
+        return []
+    # Cached as a tuple so callers may freely mutate the list they get back
+    return list(_tokens_cached(text))
+
+
+def tokens_iter(text: str) -> Iterator[str]:
+    """Iterate the tokens of tokens_from_text() without building a list.
+
+    For callers that only fold tokens into a set, count them, or stop early.
+
+    Args:
+        text: Input text to tokenize
+
+    Returns:
+        Iterator over lowercase alphanumeric tokens
+    """
+    return iter(_tokens_cached(text) if text else ())
+
+
+@lru_cache(maxsize=4096)
+def _tokens_cached(text: str) -> tuple[str, ...]:
+    """Tokenize text for tokens_from_text(); identifiers recur across tables.
+
+    Tokens are interned so the same word coming from different identifiers (``id``
+    in ``user_id`` and ``order_id``) is one object, and dict/set lookups downstream
+    hit the identity check before comparing characters.
+    """
+    if not text.isascii():
+        # Underscores, dashes and whitespace are already token separators for
+        # _TOKEN_RE, so only the CamelCase split is needed.
+        return tuple(map(sys.intern, _TOKEN_RE.findall(_CAMEL_BOUNDARY.sub(" ", text).lower())))
+    if not text.islower():
+        text = _CAMEL_BOUNDARY.sub(" ", text).lower()
+    # Table lookup per byte instead of a regex scan; split() drops empty tokens
+    return tuple(
+        map(sys.intern, text.encode("ascii").translate(_TOKEN_TRANS).decode("ascii").split())
+    )
 
 
 def fingerprint_reflection(payload: dict[str, Any]) -> str:
@@ -98,11 +174,29 @@ def fingerprint_reflection(payload: dict[str, Any]) -> str:
     Returns:
         16-character hex hash string representing the payload
     """
-    # Convert to JSON with consistent key ordering
-    json_string = json.dumps(payload, sort_keys=True, default=str)
+    # Feed the JSON to the hasher piece by piece so the full document is never
+    # materialized
+    digest = hashlib.blake2b(digest_size=8)
+    for chunk in _iter_json_chunks(payload, _FINGERPRINT_SPLIT_DEPTH):
+        digest.update(chunk)
+    return digest.hexdigest()
+
 
-    # Generate SHA-256 hash and return first 16 characters
-    return hashlib.sha256(json_string.encode("utf-8")).hexdigest()[:16]
+def _iter_json_chunks(value: Any, depth: int) -> Iterator[bytes]:
+    """Yield compact UTF-8 JSON for ``value`` in pieces.
+
+    Dict keys are sorted for the outer ``depth`` levels; anything deeper is encoded in
+    one ``to_json`` call, with ``str()`` as the fallback for non-JSON values.
+    """
+    if depth <= 0 or not isinstance(value, dict) or not value:
+        yield to_json(value, fallback=str)
+        return
+    separator = b"{"
+    for key, item in sorted(value.items()):
+        yield separator + to_json(key) + b":"
+        yield from _iter_json_chunks(item, depth - 1)
+        separator = b","
+    yield b"}"
 
 
 def default_excluded_schemas(dialect_name: str) -> list[str]:
@@ -118,21 +212,21 @@ def default_excluded_schemas(dialect_name: str) -> list[str]:
         List of system schema names to exclude from analysis
     """
     dialect_lower = dialect_name.lower()
-
-    if "postgresql" in dialect_lower or "postgres" in dialect_lower:
-        return ["information_schema", "pg_catalog", "pg_toast"]
-    if "mssql" in dialect_lower or "sqlserver" in dialect_lower:
-        return ["information_schema", "sys"]
-    if "mysql" in dialect_lower:
-        return ["information_schema", "mysql", "performance_schema", "sys"]
-    if "oracle" in dialect_lower:
-        return ["sys", "system", "xdb", "mdsys", "ctxsys"]
-    if "snowflake" in dialect_lower:
-        return ["information_schema"]
-    # Default fallback for unknown dialects
-    return ["information_schema", "pg_catalog", "sys"]
-
-
+    schemas = _EXCLUDED_SCHEMAS.get(dialect_lower)
+    if schemas is None:
+        # Driver-qualified or vendor-prefixed names, e.g. "postgresql+psycopg"
+        schemas = next(
+            (
+                excluded
+                for needle, excluded in _EXCLUDED_SCHEMAS.items()
+                if needle in dialect_lower
+            ),
+            _DEFAULT_EXCLUDED_SCHEMAS,
+        )
+    return list(schemas)
+
+
+@lru_cache(maxsize=2048)
 def is_archive_label(label: str) -> bool:
     """Check if a table/column label indicates archive, snapshot, or temp data.
 
@@ -147,23 +241,36 @@ def is_archive_label(label: str) -> bool:
     Returns:
         True if the label appears to indicate archive/snapshot/temp data
     """
-    table_part = label.split("::")[0].split(".")[-1]
+    table_part = label.partition("::")[0].rpartition(".")[2]
 
-    # Fast path: legacy suffix regex
-    if Constants.ARCHIVE_PATTERN.search(table_part):
+    # Fast path: legacy suffixes (same matches as Constants.ARCHIVE_PATTERN)
+    if table_part.lower().endswith(Constants.ARCHIVE_SUFFIXES):
         return True
 
-    # Token-based detection with startswith handling for year/number suffixes
-    toks = tokens_from_text(table_part)
-    for t in toks:
-        # direct match
-        if t in Constants.ARCHIVE_TOKENS:
-            return True
-        # startswith canonical token followed by digits or separators folded into the token
-        for canon in Constants.ARCHIVE_TOKENS:
-            if t.startswith(canon) and len(t) > len(canon):
-                # Accept if the remainder is digits (e.g., history2021, archive2020)
-                rest = t[len(canon) :]
-                if rest.isdigit():
-                    return True
-    return False
+    # Token-based detection: a canonical token, optionally followed by digits
+    # (e.g., history2021, archive2020)
+    return any(map(_ARCHIVE_TOKEN_RE.fullmatch, _tokens_cached(table_part)))
+
+
+def parse_fk_columns(fk_desc: str) -> tuple[str, str] | None:
+    """Extract (from_col, to_col) from an FK description "schema.t1.c1->schema.t2.c2".
+
+    Args:
+        fk_desc: Foreign key edge description as stored on SchemaCard.edges
+
+    Returns:
+        Tuple of (from_col, to_col), or None when the description is malformed
+    """
+    if "->" not in fk_desc:
+        return None
+
+    parts = fk_desc.split("->")
+    if len(parts) != FK_DESCRIPTION_PARTS_COUNT:
+        return None
+
+    from_parts = parts[0].split(".")
+    to_parts = parts[1].split(".")
+    if len(from_parts) < FK_TABLE_PARTS_MIN_COUNT or len(to_parts) < FK_TABLE_PARTS_MIN_COUNT:
+        return None
+
+    return from_parts[-1], to_parts[-1]
@@ -20,6 +20,9 @@ from nl2sql_mcp.schema_tools.mssql_spatial import register_mssql_spatial_types
 spec = _importlib_util.find_spec("geoalchemy2")
 _HAS_GEOALCHEMY2 = spec is not None
 
+# Recycle pooled connections before common server/proxy idle timeouts
+_POOL_RECYCLE_SEC = 1800
+
 
 class ConfigService:
     """Service for managing configuration and database connections."""
@@ -59,6 +62,18 @@ class ConfigService:
         if plugins:
             create_kwargs["plugins"] = plugins
 
+        # Pool tuning for server databases (SQLite uses its own pool classes):
+        # - LIFO hands out the most recently used connection, keeping fewer
+        #   connections warm and letting idle ones time out server-side.
+        # - pre_ping replaces such stale connections transparently, as
+        #   recommended alongside LIFO; recycle bounds connection age.
+        if sa.make_url(url).get_backend_name() != "sqlite":
+            create_kwargs.update(
+                pool_use_lifo=True,
+                pool_pre_ping=True,
+                pool_recycle=_POOL_RECYCLE_SEC,
+            )
+
         engine = sa.create_engine(url, **create_kwargs)
 
         # Dialect-specific enhancements (kept minimal and testable):
@@ -29,7 +29,7 @@ from nl2sql_mcp.schema_tools.response_builders import (
     QuerySchemaResultBuilder,
     TableInfoBuilder,
 )
-from nl2sql_mcp.schema_tools.utils import tokens_from_text
+from nl2sql_mcp.schema_tools.utils import tokens_iter
 from nl2sql_mcp.services.config_service import ConfigService
 
 pyodbc.pooling = False
@@ -120,10 +120,12 @@ class SchemaService:
         """Warm QueryEngine caches/indices for the current schema card.
 
         Builds the reusable QueryEngine once so the first user request does
-        not pay the embedding/index construction cost.
+        not pay the embedding/index construction cost, and precompiles the
+        per-table SQL snippets used by table information responses.
         """
         config = ConfigService.get_query_analysis_config()
         _ = self._get_query_engine(config)
+        TableInfoBuilder.warm(self.explorer)
 
     def analyze_query_schema(  # noqa: PLR0913 - explicit controls are intentional
         self,
@@ -309,7 +311,9 @@ class SchemaService:
         ):
             vec = query_engine.embedder.encode([keyword])[0] if query_engine.embedder else None
             if vec is not None:
-                hits = query_engine.retrieval_engine.column_index.search(vec, k=max(limit * 2, 50))
+                hits = query_engine.retrieval_engine.column_index.search_pairs(
+                    vec, k=max(limit * 2, 50)
+                )
                 for label, _score in hits:
                     if "::" not in label:
                         continue
@@ -339,7 +343,7 @@ class SchemaService:
 
         # Fallback lexical search
 
-        tokens = set(tokens_from_text(keyword))
+        tokens = set(tokens_iter(keyword))
         if not tokens:
             return results
         scored: list[tuple[float, ColumnSearchHit]] = []
@@ -347,8 +351,8 @@ class SchemaService:
             if by_table and table_key != by_table:
                 continue
             for col in tp.columns:
-                name_toks = set(tokens_from_text(col.name))
-                role_toks: set[str] = set(tokens_from_text(col.role)) if col.role else set[str]()
+                name_toks = set(tokens_iter(col.name))
+                role_toks: set[str] = set(tokens_iter(col.role)) if col.role else set[str]()
                 hit_score = 0.0
                 if tokens & name_toks:
                     hit_score += 1.0
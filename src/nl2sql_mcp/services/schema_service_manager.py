@@ -28,6 +28,7 @@ from nl2sql_mcp.services.state import (
     SchemaInitPhase,
     SchemaInitState,
 )
+from nl2sql_mcp.sqlglot_tools import Dialect, map_sqlalchemy_to_sqlglot
 
 
 class SchemaServiceManager:
@@ -49,6 +50,7 @@ class SchemaServiceManager:
         self._initialization_lock = asyncio.Lock()
         self._logger = get_logger(__name__)
         self._sa_dialect_name: str | None = None
+        self._sqlglot_dialect: Dialect = "sql"
 
         # Background thread and state
         self._thread_lock = threading.Lock()
@@ -275,6 +277,13 @@ class SchemaServiceManager:
         """Return the current SQLAlchemy dialect name if initialized."""
         return self._sa_dialect_name
 
+    def current_sqlglot_dialect(self) -> Dialect:
+        """Return the sqlglot dialect for the active engine ("sql" until initialized).
+
+        The mapping is resolved once when the engine is bound rather than per call.
+        """
+        return self._sqlglot_dialect
+
     # ---- internal ------------------------------------------------------------
 
     def _initialize_sync(self) -> None:
@@ -288,11 +297,12 @@ class SchemaServiceManager:
 
         # Create database engine
         engine = ConfigService.create_database_engine(database_url)
-        # Record dialect name for external consumers
+        # Record dialect name (and its sqlglot mapping) for external consumers
         try:
             self._sa_dialect_name = engine.dialect.name  # e.g., 'postgresql'
         except Exception:  # noqa: BLE001 - defensive
             self._sa_dialect_name = None
+        self._sqlglot_dialect = map_sqlalchemy_to_sqlglot(self._sa_dialect_name or "sql")
 
         # Test database connectivity
         self._logger.debug("Testing database connectivity…")
@@ -22,7 +22,7 @@ class SchemaInitPhase(Enum):
     STOPPED = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SchemaInitState:
     """Snapshot of initialization state with timestamps and error details."""
 
@@ -20,7 +20,7 @@ from .models import (
     SqlValidationRequest,
     SqlValidationResult,
 )
-from .service import SqlglotService, map_sqlalchemy_to_sqlglot
+from .service import SqlglotService, cap_row_limit, map_sqlalchemy_to_sqlglot
 
 __all__ = [
     "Dialect",
@@ -35,6 +35,7 @@ __all__ = [
     "SqlValidationRequest",
     "SqlValidationResult",
     "SqlglotService",
+    "cap_row_limit",
     "map_sqlalchemy_to_sqlglot",
     "register_sqlglot_tools",
 ]
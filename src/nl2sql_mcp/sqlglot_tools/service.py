@@ -11,6 +11,7 @@ import logging
 
 import sqlglot
 from sqlglot import expressions as sgl_exp
+from sqlglot.dialects.dialect import Dialect as SqlglotDialect
 from sqlglot.errors import ParseError
 
 from .models import (
@@ -50,10 +51,65 @@ def map_sqlalchemy_to_sqlglot(sa_dialect_name: str) -> Dialect:
     return SQLALCHEMY_TO_SQLGLOT.get(sa_dialect_name.lower(), "sql")
 
 
+@lru_cache(maxsize=16)
+def _dialect_instance(dialect: Dialect) -> SqlglotDialect:
+    """Resolve a dialect name once; sqlglot otherwise builds a new instance per call.
+
+    Dialect objects only carry settings (parsers and generators are created per
+    call), so a shared instance is safe. Unknown names such as "sql" raise
+    ValueError on every call because exceptions are not cached.
+    """
+    return SqlglotDialect.get_or_raise(dialect)
+
+
 @lru_cache(maxsize=256)
 def _cached_parse(sql: str, dialect: Dialect) -> sqlglot.Expression | None:
     """Small cache for parse results to speed up repetitive calls."""
-    return sqlglot.parse_one(sql, dialect=dialect)
+    return sqlglot.parse_one(sql, dialect=_dialect_instance(dialect))
+
+
+# Row locks, SELECT ... INTO and bind parameters do not survive a sqlglot round
+# trip unchanged (placeholders are re-rendered, LIMIT lands before FOR UPDATE).
+_UNCAPPABLE_NODES: tuple[type[sgl_exp.Expression], ...] = (
+    sgl_exp.Lock,
+    sgl_exp.Into,
+    sgl_exp.Placeholder,
+    sgl_exp.Parameter,
+)
+
+
+def cap_row_limit(sql: str, dialect: Dialect, cap: int) -> str:
+    """Return ``sql`` with a row cap the database can apply itself.
+
+    Adds (or lowers) a plain LIMIT/TOP on a top-level SELECT or UNION so the
+    server stops after ``cap`` rows. Queries that already request fewer rows, use
+    OFFSET, FETCH, TOP ... PERCENT or non-literal limits, lock rows, select INTO,
+    carry bind parameters, or fail to parse are returned unchanged, since
+    re-rendering them could change what runs; the caller still enforces the cap
+    while fetching.
+    """
+    try:
+        parsed = _cached_parse(sql, dialect)
+        if (
+            not isinstance(parsed, sgl_exp.Select | sgl_exp.Union)
+            or parsed.args.get("offset") is not None
+            or parsed.find(*_UNCAPPABLE_NODES) is not None
+        ):
+            return sql
+        existing = parsed.args.get("limit")
+        if existing is not None:
+            count = existing.expression if isinstance(existing, sgl_exp.Limit) else None
+            if (
+                not isinstance(count, sgl_exp.Literal)
+                or count.is_string
+                or existing.args.get("limit_options") is not None
+                or int(count.this) <= cap
+            ):
+                return sql
+        # limit() copies, so the cached tree stays untouched
+        return parsed.limit(cap).sql(dialect=_dialect_instance(dialect), copy=False)
+    except (ParseError, ValueError, TypeError):
+        return sql
 
 
 class SqlglotService:
@@ -68,31 +124,39 @@ class SqlglotService:
     ) -> None:
         self.default_dialect = default_dialect
         self._logger = logger or logging.getLogger(__name__)
+        # validate and auto-transpile are pure functions of (sql, dialect) and run on
+        # every execute_query call; memoize them per instance, bounded by LRU.
+        self._validate_cached = lru_cache(maxsize=1024)(self._validate)
+        self._auto_transpile_cached = lru_cache(maxsize=1024)(self._auto_transpile)
 
     # ---- validation -----------------------------------------------------
     def validate(self, req: SqlValidationRequest) -> SqlValidationResult:
         """Parse and validate SQL, returning pretty SQL on success."""
+        return self._validate_cached(req.sql, req.dialect).model_copy()
+
+    def _validate(self, sql: str, dialect: Dialect) -> SqlValidationResult:
+        """Uncached body of :meth:`validate`."""
         try:
-            parsed = _cached_parse(req.sql, req.dialect)
+            parsed = _cached_parse(sql, dialect)
             if parsed is None:
                 return SqlValidationResult(
                     is_valid=False,
                     error_message="Failed to parse SQL query",
                     normalized_sql=None,
-                    target_dialect=req.dialect,
+                    target_dialect=dialect,
                 )
             return SqlValidationResult(
                 is_valid=True,
                 error_message=None,
-                normalized_sql=parsed.sql(dialect=req.dialect, pretty=True),
-                target_dialect=req.dialect,
+                normalized_sql=parsed.sql(dialect=dialect, pretty=True),
+                target_dialect=dialect,
             )
         except Exception as e:  # noqa: BLE001 - returning typed error
             return SqlValidationResult(
                 is_valid=False,
                 error_message=f"SQL parsing error: {e}",
                 normalized_sql=None,
-                target_dialect=req.dialect,
+                target_dialect=dialect,
             )
 
     # ---- transpile ------------------------------------------------------
@@ -102,8 +166,8 @@ class SqlglotService:
         try:
             out = sqlglot.transpile(
                 req.sql,
-                read=req.source_dialect,
-                write=req.target_dialect,
+                read=_dialect_instance(req.source_dialect),
+                write=_dialect_instance(req.target_dialect),
                 pretty=req.pretty,
             )
             if not out:
@@ -380,9 +444,11 @@ class SqlglotService:
         for d in candidates:
             score = heur.get(d, 0)
             try:
-                parsed = sqlglot.parse_one(sql, dialect=d)
+                dialect = _dialect_instance(d)
+                parsed = sqlglot.parse_one(sql, dialect=dialect)
                 score += 2  # successful parse bonus
-                out = parsed.sql(dialect=d, pretty=False)
+                # Fresh, uncached tree: let the generator mutate it instead of copying
+                out = parsed.sql(dialect=dialect, pretty=False, copy=False)
                 if out and out.lower() == sql.strip().lower():
                     score += 1
             except (ParseError, ValueError, TypeError) as e:
@@ -405,26 +471,31 @@ class SqlglotService:
 
     def auto_transpile_for_database(self, req: SqlAutoTranspileRequest) -> SqlAutoTranspileResult:
         """Detect source dialect; transpile to target when different."""
-        detected, conf, notes = self.detect_dialect(req.sql)
-        if detected in {req.target_dialect, "sql"}:
+        return self._auto_transpile_cached(req.sql, req.target_dialect).model_copy(deep=True)
+
+    def _auto_transpile(self, sql: str, target_dialect: Dialect) -> SqlAutoTranspileResult:
+        """Uncached body of :meth:`auto_transpile_for_database`."""
+        detected, conf, notes = self.detect_dialect(sql)
+        if detected in {target_dialect, "sql"}:
             try:
-                parsed = sqlglot.parse_one(req.sql, dialect=req.target_dialect)
-                normalized = parsed.sql(dialect=req.target_dialect, pretty=True)
+                dialect = _dialect_instance(target_dialect)
+                parsed = sqlglot.parse_one(sql, dialect=dialect)
+                normalized = parsed.sql(dialect=dialect, pretty=True, copy=False)
             except (ParseError, ValueError, TypeError):
-                normalized = req.sql
+                normalized = sql
             return SqlAutoTranspileResult(
                 detected_source=detected,
                 confidence=conf,
                 sql=normalized,
                 notes=notes,
-                target_dialect=req.target_dialect,
+                target_dialect=target_dialect,
             )
 
         t = self.transpile(
             SqlTranspileRequest(
-                sql=req.sql,
+                sql=sql,
                 source_dialect=detected,
-                target_dialect=req.target_dialect,
+                target_dialect=target_dialect,
                 pretty=True,
             )
         )
@@ -433,5 +504,5 @@ class SqlglotService:
             confidence=conf,
             sql=t.sql,
             notes=notes + (t.warnings or []),
-            target_dialect=req.target_dialect,
+            target_dialect=target_dialect,
         )
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+import sqlalchemy as sa
+
+from nl2sql_mcp.services.config_service import ConfigService
+
+
+def test_server_engines_use_lifo_pool_with_pre_ping(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, object] = {}
+    real_create_engine = sa.create_engine
+
+    def fake_create_engine(url: str, **kwargs: object) -> sa.Engine:
+        captured.update(kwargs, url=url)
+        return real_create_engine("sqlite+pysqlite:///:memory:")
+
+    monkeypatch.setattr(sa, "create_engine", fake_create_engine)
+    ConfigService.create_database_engine("postgresql+psycopg://u:p@localhost/db")
+    assert captured["url"] == "postgresql+psycopg://u:p@localhost/db"
+    assert captured["pool_use_lifo"] is True
+    assert captured["pool_pre_ping"] is True
+    assert captured["pool_recycle"] == 1800
+
+
+def test_sqlite_engines_keep_default_pool() -> None:
+    engine = ConfigService.create_database_engine("sqlite+pysqlite:///:memory:")
+    with engine.connect() as conn:
+        assert conn.execute(sa.text("SELECT 1")).scalar() == 1
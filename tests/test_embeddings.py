@@ -0,0 +1,281 @@
+"""Tests for the Annoy-backed semantic index and token lexicon."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from nl2sql_mcp.schema_tools import embeddings
+from nl2sql_mcp.schema_tools.embeddings import Embedder, SemanticIndex, TokenLexiconLearner
+from nl2sql_mcp.schema_tools.models import (
+    ColumnProfile,
+    SchemaCard,
+    SchemaExplorerConfig,
+    TableProfile,
+)
+from nl2sql_mcp.schema_tools.query_engine import QueryEngine
+
+
+def _vectors() -> np.ndarray:
+    return np.array(
+        [[3.0, 0.0, 0.0, 0.0], [0.0, 0.5, 0.0, 0.0], [1.0, 1.0, 0.0, 0.0]], dtype=np.float64
+    )
+
+
+def test_semantic_index_scores_cosine_similarity_without_prenormalizing() -> None:
+    index = SemanticIndex()
+    index.build(["a", "b", "ab"], _vectors())
+
+    hits = index.search_pairs(np.array([10.0, 0.0, 0.0, 0.0], dtype=np.float32), k=3)
+    assert [label for label, _ in hits] == ["a", "ab", "b"]
+    scores = [score for _, score in hits]
+    assert scores == pytest.approx([1.0, np.sqrt(0.5), 0.0], abs=1e-5)
+
+
+def test_semantic_index_empty_build_returns_no_hits() -> None:
+    index = SemanticIndex()
+    index.build([], np.zeros((0, 4), dtype=np.float32))
+    assert index.search_pairs(np.ones(4, dtype=np.float32)) == []
+
+
+def test_semantic_index_stores_rows_verbatim() -> None:
+    vectors = _vectors()
+    index = SemanticIndex()
+    index.build(["a", "b", "ab"], vectors)
+    assert index.index is not None
+    for i, row in enumerate(vectors):
+        assert index.index.get_item_vector(i) == pytest.approx(row.tolist())
+
+
+def test_semantic_index_auto_backend_uses_annoy_for_small_indexes() -> None:
+    index = SemanticIndex()
+    index.build(["a", "b", "ab"], _vectors())
+    assert index.backend == "annoy"
+    assert index.index is not None
+
+
+def test_semantic_index_hnsw_backend_requires_hnswlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(embeddings, "_HAS_HNSWLIB", False)
+    with pytest.raises(RuntimeError, match="hnswlib"):
+        SemanticIndex(backend="hnsw")
+
+
+def test_semantic_index_hnsw_backend_scores_cosine_similarity() -> None:
+    pytest.importorskip("hnswlib")
+    index = SemanticIndex(backend="hnsw")
+    index.build(["a", "b", "ab"], _vectors())
+    assert index.backend == "hnsw"
+    hits = index.search_pairs(np.array([10.0, 0.0, 0.0, 0.0], dtype=np.float32), k=5)
+    assert [label for label, _ in hits] == ["a", "ab", "b"]
+    assert [score for _, score in hits] == pytest.approx([1.0, np.sqrt(0.5), 0.0], abs=1e-5)
+
+
+def test_semantic_index_auto_backend_uses_hnsw_with_fixed_ef_for_large_indexes() -> None:
+    pytest.importorskip("hnswlib")
+    rng = np.random.default_rng(0)
+    count = embeddings.HNSW_MIN_ITEMS + 44
+    index = SemanticIndex()
+    index.build([str(i) for i in range(count)], rng.standard_normal((count, 8)))
+    assert index.backend == "hnsw"
+    ids, _ = index.search_ids(rng.standard_normal(8).astype(np.float32), k=100)
+    assert len(set(ids.tolist())) == 100  # k above ef still returns k neighbors
+    assert index._hnsw.ef == embeddings.HNSW_EF_SEARCH
+
+
+class _CountingBackend:
+    """Deterministic backend: one-hot by text length, counting encode calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        out = np.zeros((len(texts), 8), dtype=np.float32)
+        for i, text in enumerate(texts):
+            out[i, len(text) % 8] = 1.0
+        return out
+
+
+def _embedder(backend: _CountingBackend, truncate_dim: int | None = None) -> Embedder:
+    embedder = Embedder.__new__(Embedder)
+    embedder._backend = backend
+    embedder._truncate_dim = truncate_dim
+    return embedder
+
+
+def test_encode_many_uses_one_backend_call_and_splits_by_group() -> None:
+    backend = _CountingBackend()
+    encoded = _embedder(backend).encode_many({"a": ["x", "yy"], "b": [], "c": ["zzz"]})
+    assert len(backend.calls) == 1
+    assert [encoded[name].shape for name in ("a", "b", "c")] == [(2, 8), (0, 8), (1, 8)]
+    assert encoded["c"][0, 3] == 1.0
+    assert _embedder(backend).encode_many({"a": []})["a"].shape[0] == 0
+    assert len(backend.calls) == 1
+
+
+def _card() -> SchemaCard:
+    tables = {
+        "sales.orders": TableProfile(
+            schema="sales",
+            name="orders",
+            columns=[
+                ColumnProfile(name="order_id", type="int", nullable=False, is_pk=True),
+                ColumnProfile(name="order_date", type="date", nullable=False),
+                ColumnProfile(name="amount", type="numeric", nullable=False),
+            ],
+            pk_cols=["order_id"],
+        ),
+        "sales.customers": TableProfile(
+            schema="sales",
+            name="customers",
+            columns=[
+                ColumnProfile(name="customer_id", type="int", nullable=False, is_pk=True),
+                ColumnProfile(name="name", type="text", nullable=False),
+            ],
+            pk_cols=["customer_id"],
+        ),
+    }
+    return SchemaCard(
+        db_dialect="sqlite",
+        db_url_fingerprint="deadbeef",
+        schemas=["sales"],
+        subject_areas={},
+        tables=tables,
+        edges=[],
+        built_at=0.0,
+        reflection_hash="hash",
+    )
+
+
+def test_query_engine_embeds_tables_and_columns_in_one_batch() -> None:
+    backend = _CountingBackend()
+    engine = QueryEngine(_card(), SchemaExplorerConfig(), embedder=_embedder(backend))
+    assert len(backend.calls) == 1
+    assert engine.table_index is not None
+    assert engine.column_index is not None
+    assert len(engine.table_index.labels) == 2
+    assert len(engine.column_index.labels) == 5
+
+
+def test_token_lexicon_averages_item_vectors_per_token() -> None:
+    labels = ["sales.orders::order_id", "sales.orders::amount", "sales.customers::order_count"]
+    vectors = np.array([[1.0, 0.0], [0.0, 1.0], [3.0, 3.0]], dtype=np.float32)
+    learner = TokenLexiconLearner()
+    learner.build(labels, vectors)
+    assert learner.vecs is not None
+    assert learner.vecs.dtype == np.float32
+    by_token = dict(zip(learner.tokens, learner.vecs, strict=True))
+    assert learner.tokens[:2] == ["order", "orders"]
+    assert by_token["order"] == pytest.approx([2.0, 1.5])
+    assert by_token["orders"] == pytest.approx([0.5, 0.5])
+    assert by_token["customers"] == pytest.approx([3.0, 3.0])
+
+
+def test_query_engine_releases_float_matrices_after_learning_lexicon() -> None:
+    engine = QueryEngine(_card(), SchemaExplorerConfig(), embedder=_embedder(_CountingBackend()))
+    assert engine._table_vecs is None
+    assert engine._col_vecs is None
+    assert engine.table_index is not None
+    assert not hasattr(engine.table_index, "vecs")
+    assert engine.table_index.search_pairs(np.ones(8, dtype=np.float32), k=1)
+    assert engine.lexicon_learner.tokens
+
+
+def test_embedder_truncates_to_leading_dimensions() -> None:
+    vecs = _embedder(_CountingBackend(), truncate_dim=4).encode(["abc", "abcdefg"])
+    assert vecs.shape == (2, 4)
+    assert vecs.flags.c_contiguous
+    assert vecs[0].tolist() == [0.0, 0.0, 0.0, 1.0]
+    assert not vecs[1].any()
+    assert _embedder(_CountingBackend(), truncate_dim=16).encode(["a"]).shape == (1, 8)
+
+
+def test_embedder_rejects_non_positive_truncate_dim() -> None:
+    with pytest.raises(ValueError, match="truncate_dim"):
+        Embedder(truncate_dim=0)
+
+
+def test_embedders_share_one_loaded_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    loads: list[str] = []
+
+    def _from_pretrained(name: str) -> _CountingBackend:
+        loads.append(name)
+        return _CountingBackend()
+
+    monkeypatch.setattr(embeddings.StaticModel, "from_pretrained", _from_pretrained)
+    embeddings._load_static_model.cache_clear()
+    try:
+        Embedder.preload("test/model")
+        first = Embedder("test/model")
+        second = Embedder("test/model")
+        assert first._backend is second._backend
+        assert loads == ["test/model"]
+    finally:
+        embeddings._load_static_model.cache_clear()
+
+
+def test_expand_tokens_by_query_caches_repeated_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    labels = ["sales.orders::order_id", "sales.orders::amount", "sales.customers::order_count"]
+    vectors = np.array([[1.0, 0.0], [0.0, 1.0], [3.0, 3.0]], dtype=np.float32)
+    learner = TokenLexiconLearner()
+    learner.build(labels, vectors)
+    searches: list[int] = []
+    search_ids = learner.index.search_ids
+
+    def _counting_search(query_vector: np.ndarray, k: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        searches.append(k)
+        return search_ids(query_vector, k)
+
+    monkeypatch.setattr(learner.index, "search_ids", _counting_search)
+    query = np.array([1.0, 0.2], dtype=np.float32)
+    first = learner.expand_tokens_by_query(query, top_n=3, min_df=2)
+    first.append(("mutated", 0.0))
+    second = learner.expand_tokens_by_query(query.copy(), top_n=3, min_df=2)
+    assert [token for token, _ in second] == ["order", "orders"]
+    assert len(searches) == 1
+
+    learner.expand_tokens_by_query(query, top_n=3, min_df=2, exclude=["order"])
+    assert len(searches) == 2
+    learner.build(labels, vectors)
+    learner.expand_tokens_by_query(query, top_n=3, min_df=2)
+    assert len(searches) == 3
+
+
+def test_expand_tokens_filters_by_df_and_exclude_after_rebuild() -> None:
+    learner = TokenLexiconLearner()
+    learner.build(["a.x::y"], np.array([[1.0, 0.0]], dtype=np.float32))
+    labels = ["sales.orders::order_id", "sales.orders::amount", "sales.customers::order_count"]
+    vectors = np.array([[1.0, 0.0], [0.0, 1.0], [3.0, 3.0]], dtype=np.float32)
+    learner.build(labels, vectors)
+    assert "x" not in learner.tokens
+    query = np.array([1.0, 0.2], dtype=np.float32)
+    expanded = learner.expand_tokens_by_query(query, top_n=10, min_df=1, exclude=["orders"])
+    tokens = [token for token, _ in expanded]
+    assert set(tokens) == set(learner.tokens) - {"orders"}
+    assert all(isinstance(score, float) for _, score in expanded)
+    assert [t for t, _ in learner.expand_tokens_by_query(query, top_n=1, min_df=2)] == ["order"]
+
+    index = learner.index
+    ids, sims = index.search_ids(query, k=3)
+    assert [(index.labels[i], s) for i, s in zip(ids, sims, strict=True)] == index.search_pairs(
+        query, 3
+    )
+
+
+def test_semantic_index_search_returns_label_and_score_arrays() -> None:
+    index = SemanticIndex()
+    index.build(["a", "b", "ab"], _vectors())
+    labels, scores = index.search(np.array([10.0, 0.0, 0.0, 0.0], dtype=np.float32), k=3)
+    assert labels.tolist() == ["a", "ab", "b"]
+    assert labels[scores > 0.5].tolist() == ["a", "ab"]
+    empty_labels, empty_scores = SemanticIndex().search(np.ones(4, dtype=np.float32))
+    assert empty_labels.size == 0
+    assert empty_scores.size == 0
+
+
+def test_column_embedding_retrieval_aggregates_scores_by_table() -> None:
+    engine = QueryEngine(_card(), SchemaExplorerConfig(), embedder=_embedder(_CountingBackend()))
+    assert engine.retrieval_engine is not None
+    hits = engine.retrieval_engine.retrieve_column_embeddings("abc", k_tables=2, k_columns=5)
+    assert {table for table, _ in hits} <= {"sales.orders", "sales.customers"}
+    assert all(score >= 0.0 for _, score in hits)
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import datetime as dt
+from decimal import Decimal
+from http import HTTPStatus
+
 import pytest
 import sqlalchemy as sa
 from sqlalchemy import text
 
 from nl2sql_mcp.execute.runner import (
     ExecutionLimits,
+    _has_banned_statement,
+    _prepare_sql,
+    _truncate_rows,
+    _truncate_value,
     enforce_select_only,
     run_execute_flow,
     strip_trailing_semicolon,
 )
-from nl2sql_mcp.sqlglot_tools import SqlglotService
+from nl2sql_mcp.sqlglot_tools import Dialect, SqlglotService
 
 
 def _mk_engine() -> sa.Engine:
@@ -38,11 +46,68 @@ def test_enforce_select_only() -> None:
         "DROP TABLE x",
         "TRUNCATE TABLE x",
         "GRANT SELECT ON x TO y",
+        "delete\nFROM x",
     ]:
         with pytest.raises(ValueError, match="Only SELECT"):
             enforce_select_only(bad)
 
 
+def test_enforce_select_only_allows_keyword_prefixed_identifiers() -> None:
+    enforce_select_only("SELECT created_at, last_update, dropped FROM t")
+
+
+def test_enforce_select_only_allows_quoted_identifiers() -> None:
+    enforce_select_only('SELECT "update" FROM t', "postgres")
+    enforce_select_only('SELECT [delete], "drop" FROM t', "tsql")
+    enforce_select_only("SELECT `insert` FROM t", "mysql")
+
+
+@pytest.mark.parametrize(
+    ("sql", "dialect"),
+    [
+        ("EXEC('DROP TABLE users')", "tsql"),
+        ("EXECUTE sp_executesql N'DELETE FROM users'", "tsql"),
+        ("DO $$ BEGIN DELETE FROM users; END $$", "postgres"),
+        ("SELECT dblink_exec('dbname=x', 'DROP TABLE users')", "postgres"),
+        ("CALL purge_users()", "mysql"),
+        ("SELECT id FROM t WHERE action = 'DELETE'", "sqlite"),
+        ("SELECT 'x'; DELETE FROM t", "sql"),
+        ("SELECT 'unterminated; DELETE FROM t", "sql"),
+    ],
+)
+def test_enforce_select_only_scans_literals_and_dynamic_sql(sql: str, dialect: Dialect) -> None:
+    with pytest.raises(ValueError, match="Only SELECT"):
+        enforce_select_only(sql, dialect)
+
+
+def test_enforce_select_only_reuses_verdict_for_repeated_sql() -> None:
+    sql = "SELECT name FROM t WHERE id = 42"
+    enforce_select_only(sql)
+    hits = _has_banned_statement.cache_info().hits
+    enforce_select_only(sql)
+    assert _has_banned_statement.cache_info().hits == hits + 1
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Only SELECT"):
+            enforce_select_only("DROP TABLE t")
+
+
+def test_truncate_rows_maps_positional_rows_to_columns() -> None:
+    rows = [(1, "abcdef", None), (2, "x", 1.5), (3, "y", True)]
+    assert _truncate_rows(rows, ["id", "name", "score"], max_rows=2, max_chars=4) == [
+        {"id": 1, "name": "abc…", "score": None},
+        {"id": 2, "name": "x", "score": 1.5},
+    ]
+
+
+def test_truncate_value_keeps_scalars_and_stringifies_the_rest() -> None:
+    assert _truncate_value(val=True, max_chars=3) is True
+    assert _truncate_value(12345678, 3) == 12345678
+    assert _truncate_value(HTTPStatus.OK, 3) is HTTPStatus.OK
+    assert _truncate_value(Decimal("1.50"), 10) == "1.50"
+    assert _truncate_value(dt.date(2024, 1, 2), 40) == "2024-01-02"
+    assert _truncate_value("abcdef", 4) == "abc…"
+
+
 def test_run_execute_flow_sqlite_basic() -> None:
     engine = _mk_engine()
     _setup_sqlite(engine)
@@ -57,7 +122,141 @@ def test_run_execute_flow_sqlite_basic() -> None:
     )
 
     assert result.status == "ok"
-    assert result.execution["rows_returned"] == 2
-    assert result.execution["truncated"] is True
+    assert result.execution.rows_returned == 2
+    assert result.execution.truncated is True
     assert len(result.results) == 2
     assert {"id", "name"}.issubset(result.results[0].keys())
+    assert "LIMIT" not in result.sql  # the server-side cap is not echoed back
+
+
+def test_run_execute_flow_truncates_cells_and_sets_defaults() -> None:
+    engine = _mk_engine()
+    _setup_sqlite(engine)
+
+    result = run_execute_flow(
+        sql="SELECT id, name FROM t WHERE name = 'Charlie'",
+        engine=engine,
+        glot=SqlglotService(),
+        active_dialect="sqlite",
+        limits=ExecutionLimits(row_limit=5, max_cell_chars=4),
+    )
+
+    assert result.status == "ok"
+    assert result.results == [{"id": 3, "name": "Cha…"}]
+    assert result.execution.truncated is False
+    assert result.timestamp
+    assert '"name":"Cha…"' in result.model_dump_json()
+    payload = result.model_dump(mode="json")["execution"]
+    assert payload == {
+        "dialect": "sqlite",
+        "elapsed_ms": result.execution.elapsed_ms,
+        "row_limit": 5,
+        "rows_returned": 1,
+        "truncated": False,
+    }
+
+
+def test_run_execute_flow_keeps_every_row_up_to_the_limit() -> None:
+    engine = _mk_engine()
+    _setup_sqlite(engine)
+
+    result = run_execute_flow(
+        sql="SELECT id AS Ident, name FROM t ORDER BY id",
+        engine=engine,
+        glot=SqlglotService(),
+        active_dialect="sqlite",
+        limits=ExecutionLimits(row_limit=3, max_cell_chars=10),
+    )
+
+    assert result.execution.truncated is False
+    assert [r["Ident"] for r in result.results] == [1, 2, 3]
+
+
+def test_run_execute_flow_prepares_repeated_sql_once() -> None:
+    engine = _mk_engine()
+    _setup_sqlite(engine)
+    glot = SqlglotService()
+    limits = ExecutionLimits(row_limit=5, max_cell_chars=10)
+    sql = "SELECT name FROM t WHERE id = 2;"
+
+    first = run_execute_flow(
+        sql=sql, engine=engine, glot=glot, active_dialect="sqlite", limits=limits
+    )
+    hits = (
+        glot._auto_transpile_cached.cache_info().hits,
+        glot._validate_cached.cache_info().hits,
+    )
+    second = run_execute_flow(
+        sql=sql, engine=engine, glot=glot, active_dialect="sqlite", limits=limits
+    )
+
+    assert glot._auto_transpile_cached.cache_info().hits == hits[0] + 1
+    assert glot._validate_cached.cache_info().hits == hits[1] + 1
+    assert first.results == second.results == [{"name": "Bob"}]
+    assert second.validation_notes == first.validation_notes
+    second.validation_notes.append("caller note")
+    assert _prepare_sql(glot, "SELECT name FROM t WHERE id = 2", "sqlite")[1] == tuple(
+        first.validation_notes
+    )
+
+
+def test_run_execute_flow_rejects_non_select_with_normalized_sql() -> None:
+    result = run_execute_flow(
+        sql="  DROP TABLE t;  ",
+        engine=_mk_engine(),
+        glot=SqlglotService(),
+        active_dialect="sqlite",
+        limits=ExecutionLimits(row_limit=5, max_cell_chars=10),
+    )
+
+    assert result.status == "error"
+    assert result.sql == "DROP TABLE t"
+    assert result.validation_notes == ["Only SELECT queries are permitted"]
+
+
+def test_run_execute_flow_reports_assist_notes_on_execution_error() -> None:
+    result = run_execute_flow(
+        sql="SELECT id FROM missing_table",
+        engine=_mk_engine(),
+        glot=SqlglotService(),
+        active_dialect="sqlite",
+        limits=ExecutionLimits(row_limit=5, max_cell_chars=10),
+    )
+
+    assert result.status == "error"
+    assert result.assist_notes == [
+        "Cause: Referenced table name may be wrong or not in search_path"
+    ]
+
+
+@pytest.mark.parametrize("sql", ["ANALYZE", "PRAGMA user_version = 3"])
+def test_run_execute_flow_reports_statements_without_rows_as_errors(sql: str) -> None:
+    result = run_execute_flow(
+        sql=sql,
+        engine=_mk_engine(),
+        glot=SqlglotService(),
+        active_dialect="sqlite",
+        limits=ExecutionLimits(row_limit=5, max_cell_chars=10),
+    )
+
+    assert result.status == "error"
+    assert result.execution_error is not None
+    assert "does not return rows" in result.execution_error
+
+
+def test_run_execute_flow_runs_parameterized_sql_unchanged() -> None:
+    engine = _mk_engine()
+    _setup_sqlite(engine)
+    result = run_execute_flow(
+        sql="SELECT name FROM t WHERE id = :id",
+        engine=engine,
+        glot=SqlglotService(),
+        active_dialect="sqlite",
+        limits=ExecutionLimits(row_limit=5, max_cell_chars=10),
+    )
+
+    # The placeholder reaches the driver as written, without an injected LIMIT
+    assert result.status == "error"
+    assert result.execution_error is not None
+    assert "bind parameter 'id'" in result.execution_error
+    assert "LIMIT" not in result.execution_error
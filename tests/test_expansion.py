@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pytest
+
+from nl2sql_mcp.schema_tools.expansion import GraphExpander
+from nl2sql_mcp.schema_tools.models import SchemaCard, TableProfile
+
+
+def _card() -> SchemaCard:
+    def table(name: str, archetype: str, **kwargs: object) -> TableProfile:
+        return TableProfile(schema="s", name=name, archetype=archetype, **kwargs)  # type: ignore[arg-type]
+
+    tables = {
+        "s.orders": table("orders", "fact", n_metrics=2, n_dates=1, subject_area="0"),
+        "s.customers": table("customers", "dimension", subject_area="0"),
+        "s.products": table("products", "dimension", subject_area="1"),
+        "s.stores": table("stores", "dimension", subject_area="1"),
+        "s.orders_old": table("orders_old", "fact", is_archive=True, subject_area="0"),
+        "s.regions": table("regions", "reference"),
+    }
+    edges = [
+        ("s.orders", "s.products", "fk1"),
+        ("s.orders", "s.stores", "fk2"),
+        ("s.orders", "s.customers", "fk3"),
+        ("s.orders_old", "s.orders", "fk4"),
+        ("s.customers", "s.regions", "fk5"),
+        ("s.orders", "s.missing", "fk6"),
+        ("s.orders", "s.orders", "self"),
+    ]
+    return SchemaCard(
+        db_dialect="sqlite",
+        db_url_fingerprint="x",
+        schemas=["s"],
+        subject_areas={},
+        tables=tables,
+        edges=edges,
+        built_at=0.0,
+        reflection_hash="h",
+    )
+
+
+def test_fk_following_ranks_neighbors_by_utility_then_edge_order() -> None:
+    expander = GraphExpander(_card())
+    assert expander.expand(["s.orders"], 10) == [
+        "s.orders",
+        "s.orders_old",
+        "s.customers",
+        "s.products",
+        "s.stores",
+    ]
+    assert expander.expand(["s.orders"], 3) == ["s.orders", "s.orders_old", "s.customers"]
+    assert expander.expand(["s.customers", "s.nope"], 10) == [
+        "s.customers",
+        "s.orders",
+        "s.regions",
+    ]
+    assert expander.expand(["s.nope"], 5) == []
+    assert expander.expand(["s.orders"], 0) == []
+
+
+def test_simple_expansion_includes_direct_neighbors_only() -> None:
+    expander = GraphExpander(_card(), expander_type="simple")
+    assert expander.expand(["s.customers"], 10) == ["s.customers", "s.orders", "s.regions"]
+    assert expander.expand(["s.nope", "s.customers", "s.customers"], 10) == [
+        "s.customers",
+        "s.orders",
+        "s.regions",
+    ]
+    assert expander.expand(["s.orders", "s.customers"], 3) == [
+        "s.orders",
+        "s.customers",
+        "s.products",
+    ]
+    assert expander.expand(["s.orders", "s.customers"], 1) == ["s.orders"]
+    assert expander.expand([], 10) == []
+    assert expander.expand(["s.orders"], 0) == []
+
+
+def test_node_utility_is_computed_once_per_table() -> None:
+    card = _card()
+    expander = GraphExpander(card)
+    first = expander.expand(["s.orders"], 10)
+    assert set(expander._utility_cache) == {
+        "s.orders_old",
+        "s.customers",
+        "s.products",
+        "s.stores",
+    }
+    card.tables["s.stores"].n_metrics = 2
+    assert expander.expand(["s.orders"], 10) == first
+
+
+def test_unknown_expander_type_is_rejected_at_construction() -> None:
+    with pytest.raises(ValueError, match="Unknown expander type"):
+        GraphExpander(_card(), expander_type="bfs")
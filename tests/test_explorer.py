@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import sqlalchemy as sa
+
+from nl2sql_mcp.schema_tools.explorer import SchemaExplorer
+from nl2sql_mcp.schema_tools.models import SchemaExplorerConfig
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def _explorer() -> SchemaExplorer:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(sa.text("CREATE TABLE orders(order_id INTEGER PRIMARY KEY, amount REAL)"))
+    return SchemaExplorer(engine, SchemaExplorerConfig(build_column_index=False))
+
+
+def test_update_index_if_changed_reflects_and_fingerprints_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    explorer = _explorer()
+    explorer.build_index()
+    explorer.card.reflection_hash = "stale"
+
+    reflect = explorer._reflector.reflect
+    calls: list[dict[str, Any]] = []
+
+    def counting_reflect() -> dict[str, Any]:
+        calls.append(reflect())
+        return calls[-1]
+
+    monkeypatch.setattr(explorer._reflector, "reflect", counting_reflect)
+    assert explorer.update_index_if_changed() is True
+    assert len(calls) == 1
+    assert explorer.needs_rebuild() is False
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import random
+
+import networkx as nx
+import pytest
+
+from nl2sql_mcp.schema_tools import graph as graph_mod
+from nl2sql_mcp.schema_tools.graph import Classifier, GraphBuilder
+from nl2sql_mcp.schema_tools.models import ColumnProfile, TableProfile
+
+
+def _two_clusters() -> nx.DiGraph[str]:
+    g: nx.DiGraph[str] = nx.DiGraph()
+    g.add_edges_from([("s.a", "s.b"), ("s.b", "s.c"), ("s.a", "s.c")])
+    g.add_edges_from([("s.x", "s.y"), ("s.y", "s.z"), ("s.x", "s.z")])
+    g.add_edge("s.c", "s.x")
+    g.add_node("s.lonely")
+    return g
+
+
+@pytest.mark.parametrize("backend", ["networkx", "igraph"])
+def test_communities_split_clusters_and_centrality_matches_networkx(
+    monkeypatch: pytest.MonkeyPatch, backend: str
+) -> None:
+    if backend == "igraph":
+        pytest.importorskip("igraph")
+    monkeypatch.setattr(graph_mod, "_HAS_IGRAPH", backend == "igraph")
+    g = _two_clusters()
+    centrality, communities = GraphBuilder().compute_metrics_and_communities(g)
+
+    assert centrality == nx.degree_centrality(g.to_undirected())
+    assert set(communities) == set(g.nodes())
+    assert communities["s.a"] == communities["s.b"] == communities["s.c"]
+    assert communities["s.x"] == communities["s.y"] == communities["s.z"]
+    assert communities["s.a"] != communities["s.x"]
+
+
+def test_build_adds_all_tables_and_in_card_fk_edges() -> None:
+    tables = {
+        "s.orders": TableProfile(
+            schema="s",
+            name="orders",
+            fks=[("customer_id", "s.customers", "id"), ("ext_id", "other.ext", "id")],
+        ),
+        "s.customers": TableProfile(schema="s", name="customers"),
+    }
+    g = GraphBuilder().build(tables)
+    assert set(g.nodes()) == {"s.orders", "s.customers"}
+    assert list(g.edges(data="fk")) == [
+        ("s.orders", "s.customers", "s.orders.customer_id->s.customers.id")
+    ]
+
+
+def test_single_node_graph_has_unit_centrality() -> None:
+    g: nx.DiGraph[str] = nx.DiGraph()
+    g.add_node("s.only")
+    centrality, communities = GraphBuilder().compute_metrics_and_communities(g)
+    assert centrality == {"s.only": 1.0}
+    assert communities == {"s.only": 0}
+
+
+def _col(
+    name: str, role: str | None = None, *, pk: bool = False, fk: bool = False
+) -> ColumnProfile:
+    return ColumnProfile(name=name, type="int", nullable=False, is_pk=pk, is_fk=fk, role=role)
+
+
+def test_classify_table_archetypes() -> None:
+    g: nx.DiGraph[str] = nx.DiGraph()
+    g.add_edges_from(
+        [
+            ("s.sales", "s.customer"),
+            ("s.sales", "s.product"),
+            ("s.returns", "s.customer"),
+            ("s.link", "s.customer"),
+            ("s.link", "s.product"),
+            ("s.status_ref", "s.sales"),
+        ]
+    )
+    classifier = Classifier()
+
+    fact = TableProfile(
+        schema="s",
+        name="sales",
+        columns=[
+            _col("id", "key", pk=True),
+            _col("sold_on", "date"),
+            _col("qty", "metric"),
+            _col("amount", "metric"),
+        ],
+        pk_cols=["id"],
+    )
+    bridge = TableProfile(
+        schema="s",
+        name="link",
+        columns=[
+            _col("customer_id", "key", pk=True, fk=True),
+            _col("product_id", "key", pk=True, fk=True),
+            _col("weight", "metric"),
+        ],
+        pk_cols=["customer_id", "product_id"],
+    )
+    dimension = TableProfile(
+        schema="s",
+        name="customer",
+        columns=[_col("id", "key", pk=True), _col("segment", "category"), _col("a"), _col("b")],
+        pk_cols=["id"],
+    )
+    reference = TableProfile(
+        schema="s", name="status_ref", columns=[_col("code", "key", pk=True)], pk_cols=["code"]
+    )
+    operational = TableProfile(schema="s", name="orphan", columns=[_col("id", pk=True)])
+
+    assert classifier.classify_table(fact, g) == "fact"
+    assert classifier.classify_table(bridge, g) == "bridge"
+    assert classifier.classify_table(dimension, g) == "dimension"
+    assert classifier.classify_table(reference, g) == "reference"
+    assert classifier.classify_table(operational, g) == "operational"
+
+    tables = {f"s.{tp.name}": tp for tp in (fact, bridge, dimension, reference, operational)}
+    assert classifier.bulk_classify(tables, g) == {
+        key: classifier.classify_table(tp, g) for key, tp in tables.items()
+    }
+
+
+def test_summarize_table_caps_names_per_role() -> None:
+    profile = TableProfile(
+        schema="s",
+        name="wide",
+        columns=[
+            *(_col(f"k{i}", "key") for i in range(4)),
+            *(_col(f"d{i}", "date") for i in range(3)),
+            *(_col(f"m{i}", "metric") for i in range(6)),
+            _col("c0", "category"),
+            _col("t0", "text"),
+            _col("misc"),
+        ],
+        fks=[("k0", "s.other", "id")],
+        archetype="fact",
+    )
+    assert Classifier().summarize_table(profile) == (
+        "s.wide is a fact; keys: k0, k1, k2; dates: d0, d1; "
+        "measures: m0, m1, m2, m3, m4; top dims: c0, t0; joins: k0->other"
+    )
+
+
+def test_leiden_communities_are_seeded_and_restore_global_rng(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    igraph = pytest.importorskip("igraph")
+    installed: list[object] = []
+    set_rng = igraph.set_random_number_generator
+
+    def _record(rng: object) -> None:
+        installed.append(rng)
+        set_rng(rng)
+
+    monkeypatch.setattr(igraph, "set_random_number_generator", _record)
+    g = nx.connected_caveman_graph(6, 5)
+    relabeled: nx.Graph[str] = nx.relabel_nodes(g, {n: f"s.t{n}" for n in g.nodes()})
+
+    first = graph_mod._leiden_communities(relabeled)
+    second = graph_mod._leiden_communities(relabeled)
+
+    assert first == second
+    assert sorted(node for group in first for node in group) == sorted(relabeled.nodes())
+    assert [len(group) for group in first] == sorted((len(group) for group in first), reverse=True)
+    # Each call seeds igraph and then hands the global random module back
+    assert installed[1::2] == [random, random]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from nl2sql_mcp.schema_tools.constants import Constants
+from nl2sql_mcp.schema_tools.profiling import Profiler
+
+
+def _sequential_kind(value: str) -> str | None:
+    if Constants.EMAIL_PATTERN.match(value):
+        return "email"
+    if Constants.PHONE_PATTERN.match(value):
+        return "phone"
+    if Constants.URL_PATTERN.match(value):
+        return "url"
+    if Constants.PERCENT_PATTERN.search(value):
+        return "percent"
+    return None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "a@b.com",
+        "a%b@c.org%",
+        "+1 555 123 4567",
+        "5551234567%",
+        "https://example.com/50%",
+        "12.5%",
+        "line\nbreak%",
+        "trailing%\n",
+        "John Smith",
+        "",
+    ],
+)
+def test_combined_type_pattern_matches_sequential_checks(value: str) -> None:
+    match = Constants.COMBINED_TYPE_PATTERN.match(value)
+    assert (match.lastgroup if match else None) == _sequential_kind(value)
+
+
+def test_infer_col_role_tags_value_patterns() -> None:
+    sample = pd.Series(["a@b.com", "https://x.io", "12%", "plain", "a@b.com"])
+    role, tags, patterns = Profiler().infer_col_role(
+        "contact", "VARCHAR(50)", sample, is_pk=False, is_fk=False
+    )
+    assert role == "text"
+    assert tags[:3] == ["email", "url", "unit:%"]
+    assert patterns == ["email-like", "url-like", "percent-like"]
@@ -0,0 +1,322 @@
+"""Tests for response builders over a small in-memory schema card."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from pydantic import ValidationError
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import mssql, postgresql, sqlite
+
+from nl2sql_mcp.models import QuerySchemaResult, SubjectAreaData
+from nl2sql_mcp.schema_tools import response_builders
+from nl2sql_mcp.schema_tools.explorer import SchemaExplorer
+from nl2sql_mcp.schema_tools.models import (
+    ColumnProfile,
+    SchemaCard,
+    SchemaExplorerConfig,
+    TableProfile,
+)
+from nl2sql_mcp.schema_tools.response_builders import (
+    DatabaseSummaryBuilder,
+    QuerySchemaResultBuilder,
+    TableInfoBuilder,
+    _compile_typical_queries,
+)
+from nl2sql_mcp.schema_tools.utils import parse_fk_columns
+
+
+def _card(
+    *,
+    extra_tables: dict[str, TableProfile] | None = None,
+    extra_edges: list[tuple[str, str, str]] | None = None,
+    built_at: float = 0.0,
+) -> SchemaCard:
+    """Build the sample card; a card is immutable once built, so extras go in here."""
+    tables: dict[str, TableProfile] = {
+        "sales.orders": TableProfile(
+            schema="sales",
+            name="orders",
+            columns=[
+                ColumnProfile(name="order_id", type="int", nullable=False, is_pk=True, role="key"),
+                ColumnProfile(
+                    name="customer_id",
+                    type="int",
+                    nullable=False,
+                    is_fk=True,
+                    fk_ref=("sales.customers", "customer_id"),
+                    role="key",
+                ),
+                ColumnProfile(name="order_date", type="date", nullable=False, role="date"),
+                ColumnProfile(name="amount", type="numeric", nullable=False, role="metric"),
+            ],
+            fks=[("customer_id", "sales.customers", "customer_id")],
+            pk_cols=["order_id"],
+            archetype="fact",
+            n_metrics=1,
+            n_dates=1,
+            metric_col_names=("amount",),
+            date_col_names=("order_date",),
+        ),
+        "sales.customers": TableProfile(
+            schema="sales",
+            name="customers",
+            columns=[
+                ColumnProfile(
+                    name="customer_id", type="int", nullable=False, is_pk=True, role="key"
+                ),
+                ColumnProfile(
+                    name="segment",
+                    type="varchar(20)",
+                    nullable=True,
+                    role="category",
+                    distinct_values=["consumer", "enterprise"],
+                ),
+            ],
+            pk_cols=["customer_id"],
+            archetype="dimension",
+            n_categories=1,
+        ),
+    }
+    tables.update(extra_tables or {})
+    return SchemaCard(
+        db_dialect="sqlite",
+        db_url_fingerprint="deadbeef",
+        schemas=["sales"],
+        subject_areas={"0": SubjectAreaData(name="sales", tables=list(tables), summary="")},
+        tables=tables,
+        edges=[
+            (
+                "sales.orders",
+                "sales.customers",
+                "sales.orders.customer_id->sales.customers.customer_id",
+            ),
+            ("sales.orders", "sales.customers", "malformed"),
+            *(extra_edges or []),
+        ],
+        built_at=built_at,
+        reflection_hash="hash",
+    )
+
+
+def _explorer() -> SchemaExplorer:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:")
+    return SchemaExplorer(engine, SchemaExplorerConfig(), schema_card=_card())
+
+
+def test_join_examples_skip_malformed_edges_and_respect_limit() -> None:
+    explorer = _explorer()
+    examples = QuerySchemaResultBuilder._build_join_examples(
+        ["sales.orders", "sales.customers"],
+        explorer,
+        limit=5,
+        main_table="sales.orders",
+        query="revenue by customer segment",
+    )
+    assert len(examples) == 1
+    je = examples[0]
+    assert (je.from_table, je.to_table) == ("sales.orders", "sales.customers")
+    assert "customer_id" in je.sql_syntax
+    assert je.business_purpose == "fact → dimension"
+
+    none = QuerySchemaResultBuilder._build_join_examples(
+        ["sales.orders", "sales.customers"], explorer, limit=0
+    )
+    assert none == []
+
+
+def test_query_schema_result_plans_join_and_draft_sql() -> None:
+    explorer = _explorer()
+    result = QuerySchemaResultBuilder.build(
+        "total amount by customer segment",
+        ["sales.orders", "sales.customers"],
+        explorer,
+    )
+    assert result.main_table == "sales.orders"
+    assert [(s.from_table, s.to_table) for s in result.join_plan] == [
+        ("sales.orders", "sales.customers")
+    ]
+    assert "sales.customers.segment" in result.group_by_candidates
+    assert result.draft_sql is not None
+    assert result.draft_sql.startswith("SELECT")
+
+
+def test_table_info_relationships_and_typical_queries() -> None:
+    explorer = _explorer()
+    info = TableInfoBuilder.build("sales.orders", explorer, include_samples=True)
+    assert [r.relationship_type for r in info.relationships] == ["many:1"]
+    assert info.relationships[0].business_purpose == "many:1 → dimension (sales.customers)"
+    assert len(info.typical_queries) == 3
+    payload = info.model_dump(mode="json")
+    assert isinstance(payload["indexing_notes"], list)
+    assert isinstance(payload["relationships"], list)
+    assert info.indexing_notes == ("PK index: order_id", "FK index: customer_id")
+
+
+def test_minimal_detail_skips_candidate_lists_but_keeps_draft() -> None:
+    explorer = _explorer()
+    result = QuerySchemaResultBuilder.build(
+        "total amount by customer segment",
+        ["sales.orders", "sales.customers"],
+        explorer,
+        detail_level="minimal",
+    )
+    assert result.group_by_candidates == ()
+    assert result.filter_candidates == []
+    assert result.draft_sql is not None
+
+
+def test_augment_with_bridges_inserts_one_hop_table() -> None:
+    regions = TableProfile(
+        schema="sales",
+        name="regions",
+        columns=[ColumnProfile(name="region_id", type="int", nullable=False, is_pk=True)],
+        pk_cols=["region_id"],
+        archetype="dimension",
+    )
+    card = _card(
+        extra_tables={"sales.regions": regions},
+        extra_edges=[
+            (
+                "sales.customers",
+                "sales.regions",
+                "sales.customers.region_id->sales.regions.region_id",
+            )
+        ],
+    )
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:")
+    explorer = SchemaExplorer(engine, SchemaExplorerConfig(), schema_card=card)
+    augmented = QuerySchemaResultBuilder._augment_with_bridges(
+        ["sales.orders", "sales.regions"], explorer, "sales.orders"
+    )
+    assert augmented == ["sales.orders", "sales.regions", "sales.customers"]
+
+
+def test_table_info_is_memoized_on_the_schema_card() -> None:
+    explorer = _explorer()
+    first = TableInfoBuilder.build("sales.orders", explorer, include_samples=False)
+    second = TableInfoBuilder.build("sales.orders", explorer, include_samples=False)
+    assert first == second
+    assert first is not second
+    assert first.columns is second.columns  # shallow copy of frozen, tuple-held models
+    assert explorer.card is not None
+    assert list(explorer.card.table_info_cache) == [("sales.orders", False, None, 5, None)]
+
+    orders = replace(_card().tables["sales.orders"], summary="Orders placed by customers")
+    rebuilt = _card(extra_tables={"sales.orders": orders}, built_at=1.0)
+    assert rebuilt.table_info_cache == {}
+    explorer.card = rebuilt
+    refreshed = TableInfoBuilder.build("sales.orders", explorer, include_samples=False)
+    assert refreshed.business_description == "Orders placed by customers"
+
+
+def test_table_info_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(response_builders, "TABLE_INFO_CACHE_SIZE", 2)
+    explorer = _explorer()
+    for limit in (1, 2, 3):
+        TableInfoBuilder.build(
+            "sales.orders", explorer, include_samples=False, max_sample_values=limit
+        )
+    assert explorer.card is not None
+    assert [key[3] for key in explorer.card.table_info_cache] == [2, 3]
+
+
+def test_schema_card_indexes_edges_by_table_without_serializing_index() -> None:
+    card = _card()
+    assert len(card.edges_by_table["sales.orders"]) == 2
+    assert card.edges_by_table["sales.customers"] == card.edges_by_table["sales.orders"]
+    assert "edges_by_table" not in card.to_json()
+    restored = SchemaCard.from_json(card.to_json())
+    assert len(restored.edges_by_table["sales.customers"]) == 2
+
+
+def test_database_summary_common_patterns() -> None:
+    summary = DatabaseSummaryBuilder.build(_explorer())
+    assert summary.common_patterns == (
+        "Star schema: fact/dimension tables",
+        "Time-series: date columns",
+        "Analytics: numeric metrics",
+    )
+    assert summary.schemas == ("sales",)
+    assert isinstance(summary.model_dump(mode="json")["common_patterns"], list)
+
+
+def test_table_columns_share_sample_values_with_constraints() -> None:
+    explorer = _explorer()
+    with_samples = TableInfoBuilder.build("sales.customers", explorer, include_samples=True)
+    segment = next(c for c in with_samples.columns if c.name == "segment")
+    assert segment.sample_values == ("consumer", "enterprise")
+    assert segment.constraints == ("Values: consumer, enterprise",)
+
+    without = TableInfoBuilder.build("sales.customers", explorer, include_samples=False)
+    segment = next(c for c in without.columns if c.name == "segment")
+    assert segment.sample_values == ()
+    assert segment.constraints == ("Values: consumer, enterprise",)
+
+
+def test_schema_card_parses_fk_descriptions_once() -> None:
+    card = _card()
+    assert card.edge_columns == {
+        "sales.orders.customer_id->sales.customers.customer_id": ("customer_id", "customer_id")
+    }
+    assert parse_fk_columns("malformed") is None
+    assert parse_fk_columns("a->b") is None
+
+
+def test_indexing_notes_cover_fk_columns_excluded_by_role_filter() -> None:
+    explorer = _explorer()
+    info = TableInfoBuilder.build(
+        "sales.orders", explorer, include_samples=False, column_role_filter=["metric"]
+    )
+    assert [c.name for c in info.columns] == ["amount"]
+    assert info.indexing_notes == ("PK index: order_id", "FK index: customer_id")
+
+
+def test_typical_queries_match_sqlalchemy_compilation_across_dialects() -> None:
+    for dialect in (sqlite.dialect(), postgresql.dialect(), mssql.dialect()):
+        queries = _compile_typical_queries(dialect, "Sales", "order", None, "Date", "id")
+        t = sa.table("order", sa.column("Date"), sa.column("id"), schema="Sales")
+        star = sa.literal_column("*")
+        expected = [
+            str(
+                sa.select(star)
+                .select_from(t)
+                .where(t.c["Date"] >= sa.bindparam("date_from"))
+                .compile(dialect=dialect)
+            ),
+            str(
+                sa.select(star)
+                .select_from(t)
+                .where(t.c["id"] == sa.bindparam("value"))
+                .compile(dialect=dialect)
+            ),
+        ]
+        assert list(queries) == expected
+
+
+def test_warm_precompiles_table_sql_snippets() -> None:
+    explorer = _explorer()
+    TableInfoBuilder.warm(explorer)
+    hits_before = _compile_typical_queries.cache_info().hits
+    TableInfoBuilder.build("sales.customers", explorer, include_samples=False)
+    assert _compile_typical_queries.cache_info().hits == hits_before + 1
+
+
+def test_leaf_response_models_are_frozen() -> None:
+    info = TableInfoBuilder.build("sales.orders", _explorer(), include_samples=False)
+    with pytest.raises(ValidationError):
+        info.columns[0].name = "renamed"  # type: ignore[misc]
+    assert (
+        info.relationships[0].model_copy(update={"business_purpose": "x"}).business_purpose == "x"
+    )
+
+
+def test_query_schema_result_matches_its_validated_form() -> None:
+    result = QuerySchemaResultBuilder.build(
+        "total amount by customer segment",
+        ["sales.orders", "sales.customers"],
+        _explorer(),
+    )
+    assert QuerySchemaResult.model_validate(result.model_dump()) == result
+    assert result.relevant_tables[0].primary_keys == ("order_id",)
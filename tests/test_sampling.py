@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from pathlib import Path
+import threading
+from typing import Any
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from nl2sql_mcp.schema_tools.sampling import Sampler
+
+
+def _mk_engine() -> sa.Engine:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t(id INTEGER, name TEXT, price NUMERIC)")
+        conn.exec_driver_sql("INSERT INTO t VALUES (1, 'a', 1.5), (2, 'b', 2), (3, NULL, 3)")
+    return engine
+
+
+def test_sample_table_matches_read_sql_and_respects_row_limit() -> None:
+    engine = _mk_engine()
+    sampler = Sampler(engine, per_table_rows=2)
+    query = sa.select(sa.column("id"), sa.column("name"), sa.column("price"))
+    with engine.connect() as conn:
+        expected = pd.read_sql(query.select_from(sa.table("t")).limit(2), conn)
+        df = sampler.sample_table("", "t", ["id", "name", "price"], conn=conn)
+    pd.testing.assert_frame_equal(df, expected)
+    # Own (streaming) connection path returns the same bounded sample
+    pd.testing.assert_frame_equal(sampler.sample_table("", "t", ["id", "name", "price"]), expected)
+
+
+def test_sample_table_returns_typed_empty_frame_on_error() -> None:
+    sampler = Sampler(_mk_engine())
+    df = sampler.sample_table("", "missing", ["id"])
+    assert list(df.columns) == ["id"]
+    assert df.empty
+
+
+def _mk_file_engine(tmp_path: Path) -> sa.Engine:
+    """File-backed engine with a QueuePool, so sampling takes the threaded path."""
+    engine = sa.create_engine(f"sqlite+pysqlite:///{tmp_path / 'db.sqlite'}")
+    with engine.begin() as conn:
+        for name in ("a", "b", "c"):
+            conn.exec_driver_sql(f"CREATE TABLE {name}(v TEXT)")
+            conn.execute(sa.table(name, sa.column("v")).insert().values(v=name))
+    return engine
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_iter_sample_tables_preserves_request_order(tmp_path: Path, max_workers: int) -> None:
+    requests = [("", name, ["v"]) for name in ("c", "a", "missing", "b")]
+    sampler = Sampler(_mk_file_engine(tmp_path))
+    frames = list(sampler.iter_sample_tables(requests, max_workers=max_workers))
+    assert [f["v"].tolist() for f in frames] == [["c"], ["a"], [], ["b"]]
+
+
+def test_large_postgres_tables_are_page_sampled() -> None:
+    pg_engine = sa.create_mock_engine("postgresql://", lambda *_a, **_k: None)
+    sampler = Sampler(pg_engine, per_table_rows=100)  # type: ignore[arg-type]
+
+    big = sampler._build_query("s", "events", ["id"], approx_rows=50_000_000)
+    big_sql = str(big.compile(pg_engine, compile_kwargs={"literal_binds": True}))
+    assert "TABLESAMPLE system(0.002000)" in big_sql
+    assert "LIMIT 100" in big_sql
+
+    small = sampler._build_query("s", "events", ["id"], approx_rows=5_000)
+    unknown = sampler._build_query("s", "events", ["id"], approx_rows=None)
+    assert "TABLESAMPLE" not in str(small.compile(pg_engine))
+    assert "TABLESAMPLE" not in str(unknown.compile(pg_engine))
+
+    lite = Sampler(_mk_engine())._build_query("", "t", ["id"], approx_rows=50_000_000)
+    assert "TABLESAMPLE" not in str(lite)
+
+
+def test_iter_sample_tables_yields_before_sampling_later_tables(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sampler = Sampler(_mk_engine())
+    sampled: list[str] = []
+    sample_table = sampler.sample_table
+
+    def _recording(schema: str, table: str, cols: list[str], **kwargs: Any) -> pd.DataFrame:
+        sampled.append(table)
+        return sample_table(schema, table, cols, **kwargs)
+
+    monkeypatch.setattr(sampler, "sample_table", _recording)
+    frames = sampler.iter_sample_tables([("", "t", ["id"]), ("", "t", ["name"])], max_workers=1)
+    assert next(frames)["id"].tolist() == [1, 2, 3]
+    assert sampled == ["t"]
+    assert next(frames)["name"].tolist()[:2] == ["a", "b"]
+    assert sampled == ["t", "t"]
+
+
+def test_iter_sample_tables_samples_on_worker_threads_in_request_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = _mk_file_engine(tmp_path)
+    assert isinstance(engine.pool, sa.pool.QueuePool)
+    sampler = Sampler(engine)
+    threads: list[str] = []
+    sample_table = sampler.sample_table
+
+    def _recording(schema: str, table: str, cols: list[str], **kwargs: Any) -> pd.DataFrame:
+        threads.append(threading.current_thread().name)
+        return sample_table(schema, table, cols, **kwargs)
+
+    monkeypatch.setattr(sampler, "sample_table", _recording)
+    requests = [("", name, ["v"]) for name in ("b", "missing", "c", "a")]
+    frames = sampler.iter_sample_tables(requests, max_workers=3)
+    assert next(frames)["v"].tolist() == ["b"]
+    assert [f["v"].tolist() for f in frames] == [[], ["c"], ["a"]]
+    assert len(threads) == len(requests)
+    assert all(name.startswith("sampler") for name in threads)
@@ -4,6 +4,7 @@ import logging
 
 from nl2sql_mcp.sqlglot_tools import (
     SqlglotService,
+    cap_row_limit,
     map_sqlalchemy_to_sqlglot,
 )
 from nl2sql_mcp.sqlglot_tools.models import (
@@ -14,6 +15,7 @@ from nl2sql_mcp.sqlglot_tools.models import (
     SqlTranspileRequest,
     SqlValidationRequest,
 )
+from nl2sql_mcp.sqlglot_tools.service import _dialect_instance
 
 
 def test_map_sqlalchemy_to_sqlglot_known() -> None:
@@ -78,3 +80,60 @@ def test_detect_and_auto_transpile() -> None:
     )
     assert res.detected_source in {"tsql", "sql"}
     assert "limit" in res.sql.lower()
+
+
+def test_auto_transpile_reuses_dialect_and_keeps_cached_trees_intact() -> None:
+    svc = SqlglotService()
+    sql = "SELECT id FROM t WHERE id = 1"
+    hits_before = _dialect_instance.cache_info().hits
+    first = svc.auto_transpile_for_database(
+        SqlAutoTranspileRequest(sql=sql, target_dialect="sqlite")
+    )
+    second = svc.auto_transpile_for_database(
+        SqlAutoTranspileRequest(sql=sql, target_dialect="sqlite")
+    )
+    assert first.sql == second.sql
+    assert _dialect_instance.cache_info().hits > hits_before
+    v1 = svc.validate(SqlValidationRequest(sql=sql, dialect="sqlite"))
+    v2 = svc.validate(SqlValidationRequest(sql=sql, dialect="sqlite"))
+    assert v1.normalized_sql == v2.normalized_sql
+
+
+def test_cap_row_limit_adds_or_lowers_plain_limits_only() -> None:
+    assert cap_row_limit("SELECT a FROM t", "sqlite", 11) == "SELECT a FROM t LIMIT 11"
+    assert cap_row_limit("SELECT a FROM t LIMIT 50", "postgres", 11).endswith("LIMIT 11")
+    assert cap_row_limit("SELECT a FROM t ORDER BY a", "tsql", 11).startswith("SELECT TOP 11")
+    assert (
+        cap_row_limit("SELECT a FROM t UNION SELECT b FROM u", "postgres", 11)
+        == "SELECT a FROM t UNION SELECT b FROM u LIMIT 11"
+    )
+    for sql, dialect in [
+        ("SELECT a FROM t LIMIT 5", "sqlite"),
+        ("SELECT a FROM t LIMIT 10 OFFSET 5", "postgres"),
+        ("SELECT a FROM t UNION SELECT b FROM u LIMIT 5 OFFSET 2", "postgres"),
+        ("SELECT a FROM t FOR UPDATE", "postgres"),
+        ("SELECT a INTO x FROM t", "tsql"),
+        ("SELECT a FROM t WHERE id = :id", "sqlite"),
+        ("SELECT a FROM t WHERE id = %(id)s", "postgres"),
+        ("SELECT a FROM t WHERE id = $1", "postgres"),
+        ("SELECT a FROM t WHERE id = @id", "tsql"),
+        ("SELECT TOP 10 PERCENT a FROM t", "tsql"),
+        ("SELECT a FROM t FETCH FIRST 30 ROWS ONLY", "oracle"),
+        ("SELECT 1", "sql"),
+    ]:
+        assert cap_row_limit(sql, dialect, 11) == sql
+
+
+def test_validate_and_auto_transpile_are_memoized_per_instance() -> None:
+    svc = SqlglotService()
+    req = SqlAutoTranspileRequest(sql="SELECT TOP 5 a FROM t", target_dialect="postgres")
+    first = svc.auto_transpile_for_database(req)
+    first.notes.append("caller mutation")
+    second = svc.auto_transpile_for_database(req)
+    assert second.sql == first.sql
+    assert "caller mutation" not in second.notes
+    assert svc._auto_transpile_cached.cache_info().hits == 1
+
+    v = SqlValidationRequest(sql="SELECT 1", dialect="sqlite")
+    assert svc.validate(v) == svc.validate(v)
+    assert svc._validate_cached.cache_info().hits >= 1
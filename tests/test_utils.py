@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import sys
+
+import pytest
+
+from nl2sql_mcp.schema_tools.constants import Constants
+from nl2sql_mcp.schema_tools.utils import (
+    default_excluded_schemas,
+    fingerprint_reflection,
+    normalize_identifier,
+    tokens_from_text,
+    tokens_iter,
+)
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("", ""),
+        ("customer_orders", "customer orders"),
+        ("CustomerOrders", "customer orders"),
+        ("XMLHttpRequest", "xmlhttp request"),
+        ("CustomerID", "customer id"),
+        ("a_ B", "a b"),
+        ("order-id  x", "order id x"),
+        ("_Leading", "leading"),
+        ("a__b--C", "a b c"),
+        ("Orders2021Archive", "orders2021 archive"),
+        ("tab\tName", "tab name"),
+        ("ÉtéData", "été data"),
+    ],
+)
+def test_normalize_identifier(name: str, expected: str) -> None:
+    assert normalize_identifier(name) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", []),
+        ("customer_orders", ["customer", "orders"]),
+        ("CustomerOrders", ["customer", "orders"]),
+        ("ID", ["id"]),
+        ("OrderID", ["order", "id"]),
+        ("order-id  x", ["order", "id", "x"]),
+        ("Orders2021Archive", ["orders2021", "archive"]),
+        ("ÉtéData", ["t", "data"]),
+        ("total $ amount (usd)", ["total", "amount", "usd"]),
+        ("order_id", ["order", "id"]),
+        ("Straße_ID", ["stra", "e", "id"]),
+    ],
+)
+def test_tokens_from_text(text: str, expected: list[str]) -> None:
+    assert tokens_from_text(text) == expected
+
+
+def test_tokens_from_text_returns_a_fresh_list_per_call() -> None:
+    first = tokens_from_text("CustomerOrders")
+    first.append("mutated")
+    assert tokens_from_text("CustomerOrders") == ["customer", "orders"]
+    assert normalize_identifier.cache_info().maxsize == 4096
+
+
+def test_fingerprint_reflection_is_order_independent() -> None:
+    first = fingerprint_reflection({"tables": {"a": [1, 2]}, "schemas": ["main"]})
+    second = fingerprint_reflection({"schemas": ["main"], "tables": {"a": [1, 2]}})
+    assert first == second
+    assert len(first) == 16
+    assert fingerprint_reflection({"tables": {"a": [1]}}) != first
+
+
+def test_fingerprint_reflection_sorts_outer_levels_and_encodes_tables_compactly() -> None:
+    table = {"columns": [{"name": "x", "type": "INTEGER"}], "pk": [], "when": dt.date(2024, 1, 1)}
+    payload = {
+        "schemas": {"main": {"tables": {"b": table, "a": {}}}, "empty": {"tables": {}}},
+        "dialect": "sqlite",
+    }
+    document = (
+        b'{"dialect":"sqlite","schemas":{"empty":{"tables":{}},"main":{"tables":{"a":{},'
+        b'"b":{"columns":[{"name":"x","type":"INTEGER"}],"pk":[],"when":"2024-01-01"}}}}}'
+    )
+    expected = hashlib.blake2b(document, digest_size=8).hexdigest()
+    assert fingerprint_reflection(payload) == expected
+
+    class Opaque:
+        def __str__(self) -> str:
+            return "opaque"
+
+    assert fingerprint_reflection({"x": Opaque()}) == fingerprint_reflection({"x": "opaque"})
+
+
+@pytest.mark.parametrize(
+    ("dialect", "expected"),
+    [
+        ("postgresql", ["information_schema", "pg_catalog", "pg_toast"]),
+        ("PostgreSQL+psycopg", ["information_schema", "pg_catalog", "pg_toast"]),
+        ("mssql", ["information_schema", "sys"]),
+        ("sqlserver", ["information_schema", "sys"]),
+        ("mysql", ["information_schema", "mysql", "performance_schema", "sys"]),
+        ("oracle", ["sys", "system", "xdb", "mdsys", "ctxsys"]),
+        ("snowflake", ["information_schema"]),
+        ("sqlite", ["information_schema", "pg_catalog", "sys"]),
+    ],
+)
+def test_default_excluded_schemas(dialect: str, expected: list[str]) -> None:
+    assert default_excluded_schemas(dialect) == expected
+
+
+def test_tokens_are_shared_across_identifiers() -> None:
+    invoice_tokens = tokens_from_text("invoice_ledger")
+    balance_tokens = tokens_from_text("LedgerBalance")
+    assert invoice_tokens[-1] is balance_tokens[0]
+    assert normalize_identifier("Invoice_Ledger") is normalize_identifier("invoice-ledger")
+
+
+def test_tokens_iter_matches_tokens_from_text() -> None:
+    assert list(tokens_iter("CustomerOrders_2021")) == tokens_from_text("CustomerOrders_2021")
+    assert list(tokens_iter("")) == []
+
+
+def test_schema_tokens_are_identical_to_constant_set_members() -> None:
+    token = tokens_from_text("OrderStatus")[-1]
+    member = next(t for t in Constants.GENERIC_DIMENSION_TOKENS if t == "status")
+    assert token is member
+    assert all(sys.intern(t) is t for t in Constants.GENERIC_DIMENSION_TOKENS)
+    assert all(
+        sys.intern(t) is t for t in Constants.DATE_TYPE_HINTS | Constants.NUMERIC_TYPE_HINTS
+    )